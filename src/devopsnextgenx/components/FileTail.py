@@ -0,0 +1,124 @@
+import csv
+import json
+import os
+from typing import List, Any, Optional
+
+_READ_LIMIT = 1 << 20  # Bytes read per poll, so a burst does not stall the UI
+
+
+class FileTail:
+    """
+    Follows a growing CSV or JSONL file and appends its new rows to a Table, a tail table
+    (Table(tail=...)) keeps memory constant. The file is polled through after(), reading only what
+    was added since the last poll; a truncated or replaced (rotated) file is read again from the start.
+    table: Table - Table the rows are appended to
+    path: str - File to follow
+    format: Optional[str] - "csv" or "jsonl", from the file extension when not given (default: None)
+    interval_ms: int - Time between polls in milliseconds (default: 500)
+    from_start: bool - Read the rows already in the file first, else only rows added from now on (default: False)
+    has_header: bool - The first line of a CSV file names the columns and is skipped (default: True)
+    columns: Optional[List[str]] - Keys of JSONL objects in column order (default: the header texts)
+    """
+    def __init__(
+        self,
+        table,
+        path: str,
+        format: Optional[str] = None,
+        interval_ms: int = 500,
+        from_start: bool = False,
+        has_header: bool = True,
+        columns: Optional[List[str]] = None
+    ):
+        self.table = table
+        self.path = path
+        self.format = format or ("jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv")
+        if self.format not in ("csv", "jsonl"):
+            raise ValueError(f"Unsupported format: {self.format}")
+        self.interval_ms = interval_ms
+        self.has_header = has_header
+        self.columns = columns if columns is not None else [header.text for header in table.headers]
+        self._file = None
+        self._inode = None
+        self._partial = b""  # Start of a line still being written
+        self._skip_header = False  # The next complete line is the CSV header
+        self._after_id = None
+        self._start_at_end = not from_start
+
+    def start(self):
+        """Start following the file"""
+        if self._after_id is None:
+            self._after_id = self.table.after(0, self._tick)
+
+    def stop(self):
+        """Stop following the file and close it"""
+        if self._after_id is not None:
+            self.table.after_cancel(self._after_id)
+            self._after_id = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _tick(self):
+        self._after_id = None
+        if not self.table.winfo_exists():
+            self.stop()
+            return
+        try:
+            self.poll()
+        finally:
+            if self.table.winfo_exists():
+                self._after_id = self.table.after(self.interval_ms, self._tick)
+
+    def _open(self) -> bool:
+        """(Re)open the file when it is new, was replaced or truncated; False while it does not exist"""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        if self._file is not None and stat.st_ino == self._inode and stat.st_size >= self._file.tell():
+            return True
+        if self._file is not None:
+            self._file.close()
+        self._file = open(self.path, "rb")
+        self._inode = stat.st_ino
+        self._partial = b""
+        if self._start_at_end:
+            self._file.seek(0, os.SEEK_END)
+        self._start_at_end = False  # A replaced file is new content, read it whole
+        self._skip_header = self.format == "csv" and self.has_header and self._file.tell() == 0
+        return True
+
+    def poll(self) -> int:
+        """Append the complete lines added since the last poll, returns the number of rows appended"""
+        if not self._open():
+            return 0
+        data = self._partial + self._file.read(_READ_LIMIT)
+        lines = data.split(b"\n")
+        self._partial = lines.pop()  # Not terminated yet
+        if self._skip_header and lines:
+            lines.pop(0)
+            self._skip_header = False
+        rows = [row for row in map(self._parse, lines) if row is not None]
+        if rows:
+            self.table.append_rows(rows)
+        return len(rows)
+
+    def _parse(self, line: bytes) -> Optional[List[Any]]:
+        text = line.decode("utf-8", errors="replace").rstrip("\r")
+        if not text.strip():
+            return None
+        if self.format == "csv":
+            row = next(csv.reader([text]))
+        else:
+            try:
+                value = json.loads(text)
+            except ValueError:
+                return None  # Skip a malformed line rather than stop following
+            if isinstance(value, dict):
+                return [value.get(column) for column in self.columns]
+            if not isinstance(value, list):
+                return None
+            row = value
+        # Every row gets one value per column
+        width = len(self.columns)
+        return row[:width] + [""] * (width - len(row))
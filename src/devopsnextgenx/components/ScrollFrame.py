@@ -1,5 +1,6 @@
 import tkinter as tk
-from ttkbootstrap import Style, Frame, Scrollbar
+from ttkbootstrap import Frame, Scrollbar
+from devopsnextgenx.utils.styleRegistry import style_registry
 
 class ScrollFrame(Frame):
     def __init__(self, parent, **kwargs):
@@ -8,9 +9,8 @@ class ScrollFrame(Frame):
         # Create a canvas and a vertical scrollbar with custom style
         self.canvas = tk.Canvas(self)
         
-        # Define custom style for the scrollbar
-        style = Style()
-        style.configure("Custom.Vertical.TScrollbar", 
+        # Define custom style for the scrollbar, once per theme
+        style_registry.define("Custom.Vertical.TScrollbar", 
                         troughcolor="gray", 
                         background="black", 
                         arrowcolor="white", 
@@ -0,0 +1,160 @@
+import sqlite3
+from collections import OrderedDict
+from typing import List, Any, Optional, Sequence, Tuple, Dict, Union
+from devopsnextgenx.components.TableModel import PagedTableModel
+from devopsnextgenx.components.TableFilter import parse_query
+
+_BOUNDARIES = 64  # Keyset boundaries remembered, one per page boundary reached
+
+
+def _quote(name: str) -> str:
+    """Quote an SQL identifier"""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _like(text: str) -> str:
+    """Escape the LIKE wildcards of text, for ESCAPE '\\'"""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class SqliteSource:
+    """
+    Lazy data source over a SQLite table. Table reads it a page at a time through a PagedTableModel
+    (see model) with sorting and filtering done in SQL; Treeview reads the children of a node by
+    parent id when the node is opened (see children). Only the rows shown and a few cached pages
+    are held in memory.
+    database: Union[str, sqlite3.Connection] - Path of the database file, or an open connection
+    table: str - Table (or view) to read
+    columns: Sequence[str] - Columns shown, in the order of the Table headers
+    key: str - Unique column ordering rows with equal sort values, used for keyset pagination (default: rowid)
+    parent_column: Optional[str] - Column holding the key of a row's parent, for Treeview; NULL for the roots (default: None)
+    boolean_columns: Sequence[int] - Columns filtered as booleans, as the boolean widget types of Table (default: ())
+    """
+    def __init__(
+        self,
+        database: Union[str, sqlite3.Connection],
+        table: str,
+        columns: Sequence[str],
+        key: str = "rowid",
+        parent_column: Optional[str] = None,
+        boolean_columns: Sequence[int] = ()
+    ):
+        self.connection = sqlite3.connect(database) if isinstance(database, str) else database
+        self.table = table
+        self.columns = list(columns)
+        self.key = key
+        self.parent_column = parent_column
+        self.boolean_columns = set(boolean_columns)
+        self._counts: Dict[Tuple, int] = {}  # filter -> row count
+        self._boundaries = OrderedDict()  # (sort, filter, offset) -> sort values and key of the row before offset
+
+    def invalidate(self):
+        """Forget the cached counts and page boundaries, after the table was changed"""
+        self._counts.clear()
+        self._boundaries.clear()
+
+    def model(self, page_size: int = 50, cache_pages: int = 3) -> PagedTableModel:
+        """A PagedTableModel reading this source, to pass to Table as data"""
+        return PagedTableModel(self.fetch, self.total_count, page_size, cache_pages)
+
+    def _where(self, filters: Dict[int, str]) -> Tuple[List[str], List[Any]]:
+        """SQL conditions and their parameters for the filter queries of Table, see parse_query"""
+        conditions, params = [], []
+        for col, text in sorted(filters.items()):
+            query = parse_query(text, col in self.boolean_columns)
+            if query is None:
+                continue
+            kind, value = query
+            column = _quote(self.columns[col])
+            match kind:
+                case "substring":
+                    conditions.append(f"{column} LIKE ? ESCAPE '\\'")
+                    params.append(f"%{_like(value)}%")
+                case "prefix":
+                    conditions.append(f"{column} LIKE ? ESCAPE '\\'")
+                    params.append(f"{_like(value)}%")
+                case "bool":
+                    # The values to_bool takes for True
+                    conditions.append(f"IFNULL({column} = 1 OR lower({column}) IN ('true', 'yes', '1'), 0) = ?")
+                    params.append(int(value))
+                case "range":
+                    low, high, low_open, high_open = value
+                    conditions.append(f"typeof({column}) IN ('integer', 'real')")
+                    if low is not None:
+                        conditions.append(f"{column} {'>' if low_open else '>='} ?")
+                        params.append(low)
+                    if high is not None:
+                        conditions.append(f"{column} {'<' if high_open else '<='} ?")
+                        params.append(high)
+        return conditions, params
+
+    def total_count(self, filters: Dict[int, str]) -> int:
+        """Number of rows matching filters, cached per filter"""
+        signature = tuple(sorted(filters.items()))
+        count = self._counts.get(signature)
+        if count is None:
+            conditions, params = self._where(filters)
+            where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+            count = self.connection.execute(f"SELECT COUNT(*) FROM {_quote(self.table)}{where}", params).fetchone()[0]
+            self._counts[signature] = count
+        return count
+
+    def fetch(self, offset: int, limit: int, sort_spec: List[Tuple[int, bool]], filters: Dict[int, str]) -> List[Tuple]:
+        """
+        Rows offset to offset + limit in sort order, matching filters. A page that starts where a
+        previous ascending page ended is read by keyset (WHERE (sort columns, key) > last row) instead of
+        OFFSET, so paging forward does not rescan the rows before it.
+        """
+        conditions, params = self._where(filters)
+        order = [(_quote(self.columns[col]), ascending) for col, ascending in sort_spec]
+        # Descending sorts put NULLs last, which a row value comparison cannot skip past
+        keyset = all(ascending for _, ascending in sort_spec)
+        order.append((_quote(self.key), not sort_spec or sort_spec[-1][1]))
+        signature = (tuple(sort_spec), tuple(sorted(filters.items())))
+
+        boundary = self._boundaries.get((signature, offset)) if keyset and offset else None
+        if boundary is not None:
+            self._boundaries.move_to_end((signature, offset))
+            conditions.append(f"({', '.join(column for column, _ in order)}) > ({', '.join('?' * len(boundary))})")
+            params.extend(boundary)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        order_by = ", ".join(f"{column} {'ASC' if ascending else 'DESC'}" for column, ascending in order)
+        sql = (f"SELECT {', '.join(_quote(column) for column in self.columns)}, {_quote(self.key)} "
+               f"FROM {_quote(self.table)}{where} ORDER BY {order_by} LIMIT ?")
+        params.append(limit)
+        if boundary is None:
+            sql += " OFFSET ?"
+            params.append(offset)
+        rows = self.connection.execute(sql, params).fetchall()
+
+        if keyset and len(rows) == limit:
+            last = rows[-1]
+            values = tuple(last[col] for col, _ in sort_spec) + (last[-1],)
+            if None not in values:
+                self._boundaries[(signature, offset + limit)] = values
+                while len(self._boundaries) > _BOUNDARIES:
+                    self._boundaries.popitem(last=False)
+        return [row[:-1] for row in rows]
+
+    def children(self, parent: Any = None) -> List[Dict[str, Any]]:
+        """
+        Rows whose parent_column is parent (the roots for None) as Treeview items: a dict of the
+        columns plus "id" (the key) and "has_children"; "children" is None until the item is opened.
+        """
+        if self.parent_column is None:
+            raise ValueError("children needs the source's parent_column")
+        table, key, parent_column = _quote(self.table), _quote(self.key), _quote(self.parent_column)
+        rows = self.connection.execute(
+            f"SELECT {', '.join(_quote(column) for column in self.columns)}, {key}, "
+            f"EXISTS (SELECT 1 FROM {table} AS child WHERE child.{parent_column} = {table}.{key}) "
+            f"FROM {table} WHERE {parent_column} IS ? ORDER BY {key}",
+            (parent,)
+        ).fetchall()
+        items = []
+        for row in rows:
+            item = dict(zip(self.columns, row))
+            item["id"] = row[-2]
+            item["has_children"] = bool(row[-1])
+            item["children"] = None if row[-1] else []
+            items.append(item)
+        return items
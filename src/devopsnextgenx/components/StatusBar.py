@@ -3,6 +3,7 @@ from ttkbootstrap.constants import *
 import customtkinter as ctk
 from devopsnextgenx.components.messageHub.provider import set_root_frame, show_alert
 from devopsnextgenx.components.ProgressPopup import ProgressPopup
+from devopsnextgenx.utils.styleRegistry import style_registry
 
 
 class StatusBar(ttk.Frame):
@@ -59,19 +60,11 @@ class StatusBar(ttk.Frame):
         
         self.progress_frame = ttk.Frame(self, height=self.progress_thickness, bootstyle="dark", relief="sunken", borderwidth=2)  # Add bevel border
         self.progress_frame.grid(row=0, column=4, sticky="ew", padx=(5, 10), pady=(8, 8))
-        progressStyle = ttk.Style()
-        progressStyle.configure(
-            "Custom.Horizontal.TProgressbar",
-            thickness=self.progress_thickness,
-            troughcolor="#333333",
-            background="#00FF00",
-            troughrelief="flat",
-        )
         self.progress_bar = ttk.Progressbar(
             self.progress_frame,
             mode="determinate",
             bootstyle=(PRIMARY, STRIPED),
-            style="Custom.Horizontal.TProgressbar",
+            style=self._progress_style("#00FF00"),
             length=100,  
         )
         self.progress_bar["value"] = 0
@@ -83,6 +76,16 @@ class StatusBar(ttk.Frame):
         self.update_idletasks()
         self.on_initial_display()
 
+    def _progress_style(self, color: str) -> str:
+        """Progress bar style of the given colour, shared by every status bar"""
+        return style_registry.intern(
+            "Horizontal.TProgressbar",
+            thickness=self.progress_thickness,
+            troughcolor="#333333",
+            background=color,
+            troughrelief="flat",
+        )
+
     def on_initial_display(self):
         self.on_resize(None)
 
@@ -108,14 +111,10 @@ class StatusBar(ttk.Frame):
             else:
                 color = "#00FF00"  # Green
             
-            progressStyle = ttk.Style()
-            progressStyle.configure(
-                "Custom.Horizontal.TProgressbar",
-                thickness=self.progress_thickness,
-                troughcolor="#333333",
-                background=color,
-                troughrelief="flat",
-            )
+            # Switch to the interned style of the colour, other progress bars keep theirs
+            style = self._progress_style(color)
+            if str(self.progress_bar.cget("style")) != style:
+                self.progress_bar.configure(style=style)
             
             self.progress_bar.update_idletasks()
         
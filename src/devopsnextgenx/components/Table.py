@@ -1,9 +1,24 @@
+import os
 import ttkbootstrap as ttk
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import partial
 from ttkbootstrap.constants import *
-from typing import List, Any, Optional, Callable
+from typing import List, Any, Optional, Callable, Tuple, Union, Dict, Sequence, Iterator, Iterable, Type
 from pydantic import BaseModel
 from enum import Enum
-from tkinter import BooleanVar
+from tkinter import BooleanVar, StringVar
+from devopsnextgenx.components.TableModel import TableModel, ListTableModel, ColumnarTableModel, PagedTableModel, RingTableModel, to_bool, _RowView
+from devopsnextgenx.components.TableFilter import TableFilter
+from devopsnextgenx.components.TableCanvas import TableCanvas, CanvasCell
+from devopsnextgenx.components.TableLayout import PlaceLayout
+from devopsnextgenx.components.TableGroups import GroupIndex
+from devopsnextgenx.components.TableCompute import ComputedColumns
+from devopsnextgenx.components.TableJournal import ChangeJournal, Change
+from devopsnextgenx.components.TableFormat import ConditionalFormats
+from devopsnextgenx.components.TableIO import FileReader, ExportJob, coercer, coerce_rows, chunks, write_csv, write_jsonl
+from devopsnextgenx.utils.styleRegistry import style_registry
+from devopsnextgenx.utils.frameScheduler import frame_scheduler, FrameJob
 
 class WidgetType(Enum):
     TEXT = "TEXT"
@@ -14,6 +29,9 @@ class WidgetType(Enum):
     ENTRY = "ENTRY"
     BUTTON = "BUTTON"
 
+_BOOLEAN_TYPES = (WidgetType.CHECKBOX, WidgetType.SQTOGGLE, WidgetType.RNDTOGGLE, WidgetType.RADIOBTN)
+_ANCHORS = {"w": "w", "left": "w", "e": "e", "right": "e", "center": "center"}
+
 class Header(BaseModel):
     """
     Represents a table header configuration.
@@ -36,7 +54,18 @@ class Header(BaseModel):
     style: Optional[str] - Custom style for the widget (default: None)
     colNo: Optional[int] - Column number (default: None)
     action: Optional[Callable] - Action callback for header click (default: None)
-    on_change: Optional[Callable] - On change callback for cell value change (default: None)
+    sortable: bool - Let the table sort by this column on header click, shift-click adds it to the sort (default: False)
+    on_change: Optional[Callable] - On change callback for cell value change, called as on_change(data, row, col);
+               writes to data[row][col] are applied like set_cells when it returns (default: None)
+    dtype: Optional[type] - Type imported values are converted to by load_csv and load_jsonl: int, float or str;
+           boolean widget types convert to bool (default: None, values are kept as read)
+    aggregate: Optional[str] - Aggregate of the column shown in group rows: sum, count, min, max or avg (default: None)
+    compute: Optional[Callable] - Makes the column computed: compute(row) -> value, reading the other cells of the row
+             as row[col] or row["header text"]; recomputed only when a cell it read changes. The data rows hold a
+             placeholder value for it. Not computed in a paged table (default: None)
+    formats: Optional[List] - Conditional formats of the column's text cells: Threshold(">", 100, foreground="red"),
+             ColorScale(0, 100) or Match(r"^ERR", background="#b71c1c") from TableFormat; a later rule overrides
+             the options of an earlier one. Not applied in a paged table or by the canvas renderer (default: None)
     """
     text: str
     type: WidgetType = WidgetType.TEXT
@@ -50,54 +79,259 @@ class Header(BaseModel):
     style: Optional[str] = None
     colNo: Optional[int] = None
     action: Optional[Callable] = None
+    sortable: bool = False
     on_change: Optional[Callable] = None
+    dtype: Optional[Type] = None  # typing.Type, the "type" field above hides the builtin
+    aggregate: Optional[str] = None
+    compute: Optional[Callable] = None
+    formats: Optional[List[Any]] = None
+
+class _TableRow:
+    """The widgets of one grid row, the data row they show and the values they were last bound to"""
+    __slots__ = ("cells", "index", "row", "values")
+
+    def __init__(self, index: int, row: int):
+        self.cells = []
+        self.index = index
+        self.row = row
+        self.values = None
+
+class _GroupRow:
+    """The labels of a group row, the group it shows and the line it is on (1 based, see Table._position)"""
+    __slots__ = ("cells", "key", "row")
+
+    def __init__(self, key: Tuple):
+        self.cells = []
+        self.key = key
+        self.row = 0
+
+class _ChangeView:
+    """
+    The data passed to on_change callbacks: data[row][col] and get(row, col) read the model, writes
+    are queued as set_cells updates that the table applies when the callback returns
+    """
+    __slots__ = ("_table",)
+
+    def __init__(self, table: "Table"):
+        self._table = table
+
+    def __len__(self) -> int:
+        return len(self._table.model)
+
+    def __getitem__(self, row: int) -> _RowView:
+        if not 0 <= row < len(self):
+            raise IndexError("row index out of range")
+        return _RowView(self, row)
+
+    def __iter__(self) -> Iterator[_RowView]:
+        for row in range(len(self)):
+            yield _RowView(self, row)
+
+    @property
+    def column_count(self) -> int:
+        return self._table.model.column_count
+
+    def get(self, row: int, col: int) -> Any:
+        pending = self._table._pending
+        return pending[(row, col)] if (row, col) in pending else self._table.model.get(row, col)
+
+    def row(self, row: int) -> List[Any]:
+        return [self.get(row, col) for col in range(self.column_count)]
+
+    def set(self, row: int, col: int, value):
+        self._table.set_cells({(row, col): value})
+
+class _ColumnPlan:
+    """A Header resolved once into what creating and updating its cells needs"""
+    __slots__ = ("col", "kind", "anchor", "style", "text_color", "editable", "shows_text", "boolean", "factory", "handler", "format")
+
+    def __init__(self, col: int, header: "Header", edit_on_demand: bool):
+        self.col = col
+        # ENTRY columns edited on demand show as TEXT
+        self.shows_text = header.type == WidgetType.TEXT or (header.type == WidgetType.ENTRY and edit_on_demand)
+        self.kind = WidgetType.TEXT if self.shows_text else header.type
+        self.anchor = _ANCHORS.get(header.align.lower(), "w")  # default to left alignment
+        self.style = header.style
+        self.text_color = header.text_color
+        self.editable = header.editable
+        self.boolean = header.type in _BOOLEAN_TYPES
+        self.factory = None  # factory(row_idx, cell_data) -> cell widget, set by Table._compile_plan
+        self.handler = None  # Change handler of boolean cells
+        self.format = str  # Cell value -> displayed text
 
 class Table(ttk.Frame):
     """
     A table widget that displays data in rows and columns.
     master: any - The parent widget
     headers: List[Header] - List of table headers
-    data: List[List[Any]] - List of data rows
+    data: Union[List[List[Any]], TableModel] - List of data rows, or a TableModel holding them (default: None, requires fetch)
     row_height: int - Row height (default: 30)
     header_color: str - Header color (default: primary)
     row_color: str - Row color (default: dark)
     alternate_row_color: str - Alternate row color (default: secondary)
     highlight_color: str - Highlight color (default: info)
     hover_color: str - Hover color (default: #404040)
+    virtual: bool - Only create widgets for the visible rows and rebind them while scrolling (default: False)
+    visible_rows: int - Number of rows shown at once in virtual mode (default: 20)
+    filterable: bool - Show a row of per-column filter inputs under the headers (default: False)
+    fetch: Optional[Callable] - Page provider fetch(offset, limit, sort, filter) -> rows; shows the data a page at a time,
+           with sorting and filtering left to the provider. Rows are changed in the provider: insert_rows,
+           append_rows, delete_rows and move_row raise ValueError (default: None)
+    total_count: Optional[Callable] - total_count(filter) -> number of rows, required with fetch (default: None)
+    page_size: int - Rows per page when paged (default: 50)
+    renderer: str - "widgets" for a ttk widget per cell, or "canvas" to draw TEXT cells, row backgrounds and
+              the selection on one Canvas, with widgets only for the interactive columns (default: widgets)
+    edit_on_demand: bool - Show ENTRY columns as text and edit them, like editable TEXT columns, in one shared
+                    editor opened by double click; Tab and Enter move it to the next cell (default: False)
+    on_progress: Optional[Callable] - on_progress(rows created, total rows) while the rows past the first
+                 visible_rows are created in frame-budgeted chunks, see status_progress (default: None)
+    tail: Optional[int] - Follow a live feed: keep at most tail rows in a ring buffer, append_rows adds at the bottom
+          and drops the oldest rows, and the view follows the newest rows until scrolled up; implies virtual. Rows
+          are only appended: insert_rows, delete_rows and move_row raise ValueError (default: None)
+    group_by: Optional[List[int]] - Group the rows by these columns under collapsible group rows, see group_by (default: None)
+    journal: bool - Journal the cell changes for undo, redo and changes_since (default: False)
+    row_key: Optional[Callable] - row_key(row values) -> key identifying a row in the journal (e.g. lambda row: row[0]);
+             rows are identified by data row index when not given (default: None)
+    layout: str - "grid" to grid every cell, or "place" to place the cells at positions computed from row_height and
+            the cached column widths, which follow the header labels; a resize then moves only the columns whose
+            width changed. Not with the canvas renderer, which draws its rows itself (default: grid)
     """
     def __init__(
         self,
         master: any,
         headers: List[Header],
-        data: List[List[Any]],
+        data: Union[List[List[Any]], TableModel] = None,
         row_height: int = 30,
         header_color: str = "primary",
         row_color: str = "dark",
         alternate_row_color: str = "secondary",
         highlight_color: str = "info",
         hover_color: str = "#404040",  # Add hover color parameter
+        virtual: bool = False,
+        visible_rows: int = 20,
+        filterable: bool = False,
+        fetch: Optional[Callable[[int, int, List[Tuple[int, bool]], Dict[int, str]], Sequence[Sequence[Any]]]] = None,
+        total_count: Optional[Callable[[Dict[int, str]], int]] = None,
+        page_size: int = 50,
+        renderer: str = "widgets",
+        edit_on_demand: bool = False,
+        on_progress: Optional[Callable[[int, Optional[int]], None]] = None,
+        tail: Optional[int] = None,
+        group_by: Optional[List[int]] = None,
+        journal: bool = False,
+        row_key: Optional[Callable[[List[Any]], Any]] = None,
+        layout: str = "grid",
         **kwargs
     ):
+        # Options are checked before the widget exists, a table that fails to build leaves nothing to destroy
+        if fetch is not None and total_count is None:
+            raise ValueError("A paged table needs total_count along with fetch")
+        pooled = virtual or fetch is not None or tail is not None or isinstance(data, PagedTableModel)
+        if group_by and (pooled or renderer == "canvas"):
+            raise ValueError("Grouping needs a widget per row: not virtual, paged, tail or canvas rendered")
+        if renderer == "canvas" and any(header.formats for header in headers):
+            raise ValueError("Conditional formats style cell widgets, the canvas renderer draws its text cells")
+        if layout not in ("grid", "place"):
+            raise ValueError(f"Unknown layout: {layout}")
+        if layout == "place" and renderer == "canvas":
+            raise ValueError("The canvas renderer lays out its rows itself, use the grid layout")
         super().__init__(master, **kwargs)
         
+        if fetch is not None:
+            data = PagedTableModel(fetch, total_count, page_size)
+        self.tail = tail
+        if tail is not None:
+            # The pool of a virtual table is what recycles the widgets of dropped rows
+            data = self._as_tail_model(data)
+            virtual = True
+        self.auto_scroll = True  # Tail mode: keep the newest rows in view as rows are appended
         self.headers = headers
-        self.data = data
+        self.model = self._as_model(data)
         self.row_height = row_height
         self.header_color = header_color
         self.row_color = row_color
         self.alternate_row_color = alternate_row_color
         self.highlight_color = highlight_color
         self.hover_color = hover_color  # Store hover color
+        self.virtual = virtual
+        self.visible_rows = visible_rows
+        self.filterable = filterable
+        self.paged = isinstance(self.model, PagedTableModel)
+        if self.paged and not virtual:
+            self.visible_rows = self.model.page_size
+        self._pooled = self.virtual or self.paged  # Fixed pool of rows rebound to the rows shown
+        functions = {col: header.compute for col, header in enumerate(headers) if header.compute is not None}
+        self._computed = ComputedColumns(functions, {header.text: col for col, header in enumerate(headers)}) if functions else None
+        self._fill_computed(self.model, range(len(self.model)))
+        self._page = 0
+        self._page_label = None
         self._sort_ascending = {}
+        self._sort_spec = []  # [(col, ascending), ...] of the built-in sort, most significant first
+        self._sorted = None  # All data row indices in sort order
+        self._filter = TableFilter(self.model)
+        self._filter_inputs = {}
+        self._groups = GroupIndex(group_by, self._aggregate_columns()) if group_by else None  # While grouped
+        if self._groups is not None:
+            self._groups.rebuild(self.model)
+        self._group_starts = []  # Rows shown before each group row
+        self._group_keys = []  # Keys of the group rows shown, in order
+        self._laid_starts = []  # _group_starts the rows were last gridded with
+        self._group_rows = {}  # Group key -> _GroupRow
+        self._regroup_id = None
+        rules = {col: header.formats for col, header in enumerate(headers) if header.formats}
+        self._formats = ConditionalFormats(rules) if rules and not self.paged else None
+        if self._formats is not None:
+            self._formats.rebuild(self.model)
+        self.journal = ChangeJournal() if journal else None
+        self.row_key = row_key
+        self._replaying = False  # Undo and redo write cells without journaling them
+        self._order = self._compute_order()  # Data row index shown at each table row (sorted and filtered)
         self.selected_row = None
         self.selected_cell = None
         self._cells = {}
+        self._header_labels = []
+        self._rows = []  # _TableRow per grid row (the recycled pool in virtual mode)
+        self._hidden_rows = []  # Rows left out by the filter, kept for when it changes
+        self._row_offset = 1 if filterable else 0  # Grid rows between the header and the first data row
+        self._top = 0  # Index of the first data row shown in virtual mode
+        self._scrollbar = None
+        self._canvas = TableCanvas(self, row_height) if renderer == "canvas" else None
+        self._layout = PlaceLayout(self, row_height) if layout == "place" else None  # None: cells are gridded
+        self._pending = {}  # (data row, col) -> value queued by set_cells, applied once idle
+        self._flush_id = None
+        self._batch_depth = 0
+        self._hover_row = None  # Grid row under the pointer
+        self.edit_on_demand = edit_on_demand
+        self._editor = None  # Entry shared by every cell edit, created on first use
+        self._editing = None  # (data row, col, cell) the editor is open on
+        self._free_vars = []  # BooleanVars of rows no longer shown, reused by the next rows shown
+        self._radio_vars = {}  # col -> StringVar shared by the column's radio buttons, holds the selected widget
+        self._radio_selected = {}  # col -> (data row, radio button) selected in a RADIOBTN column
+        self.on_progress = on_progress
+        self._build = None  # FrameJob creating the rows past the first screen
 
-        # Define custom styles
-        style = ttk.Style()
-        
-        # Configure header style
-        style.configure(
+        # Shared bindtag for the cells: clicks, hover and scrolling cost one binding per table,
+        # the cell is found from the widget the event arrived on
+        self._bindtag = f"Table{id(self)}"
+        self.bind_class(self._bindtag, "<Button-1>", self._on_cell_click)
+        self.bind_class(self._bindtag, "<Double-Button-1>", self._on_cell_double_click)
+        self.bind_class(self._bindtag, "<Enter>", self._on_cell_enter)
+        if self._canvas is not None:
+            self.bind_class(self._bindtag, "<Destroy>", lambda e: self._canvas.forget(str(e.widget)))
+        if self._layout is not None:
+            self.bind_class(self._bindtag, "<Destroy>", lambda e: self._layout.forget(str(e.widget)))
+        self.bind("<Leave>", self._on_table_leave)
+        if self.virtual:
+            self.bind_class(self._bindtag, "<MouseWheel>", self._on_mouse_wheel)
+            self.bind_class(self._bindtag, "<Button-4>", self._on_mouse_wheel)  # For Linux
+            self.bind_class(self._bindtag, "<Button-5>", self._on_mouse_wheel)  # For Linux
+            self.bindtags((str(self), self._bindtag) + self.bindtags()[1:])
+            if self._canvas is not None:
+                canvas = self._canvas.canvas
+                canvas.bindtags((str(canvas), self._bindtag) + canvas.bindtags()[1:])
+
+        # Define custom styles, configured once per theme for every table
+        style_registry.define(
             "Header.TLabel",
             background="#00008B",  # Dark blue
             foreground="white",
@@ -107,8 +341,9 @@ class Table(ttk.Frame):
         )
         
         # Configure row styles
-        style.configure("Row.TLabel", padding=5)
-        style.configure("Alt.TLabel", padding=5)
+        style_registry.define("Row.TLabel", padding=5)
+        style_registry.define("Alt.TLabel", padding=5)
+        style_registry.define("Group.TLabel", padding=5, font=("TkDefaultFont", 10, "bold"))
         
         # Use ttk built-in styles instead of creating custom ones
         # ttkbootstrap already has predefined styles we can use:
@@ -117,8 +352,30 @@ class Table(ttk.Frame):
         
         self._create_table()
 
+    @property
+    def data(self):
+        """The table data: the row list passed in, or the TableModel for other models"""
+        return self.model.data
+
+    def _as_tail_model(self, data: Union[List[List[Any]], TableModel, None]) -> RingTableModel:
+        if isinstance(data, RingTableModel):
+            return data
+        rows = data.rows() if isinstance(data, TableModel) else (data or [])
+        return RingTableModel(self.tail, rows)
+
+    @staticmethod
+    def _as_model(data: Union[List[List[Any]], TableModel]) -> TableModel:
+        return data if isinstance(data, TableModel) else ListTableModel(data)
+
     def _get_header_text(self, header: Header) -> str:
         """Get header text with sort indicator if applicable"""
+        if header.sortable and not header.action:
+            for position, (col, ascending) in enumerate(self._sort_spec, start=1):
+                if col == header.colNo:
+                    rank = str(position) if len(self._sort_spec) > 1 else ""
+                    return f"{header.text} {'↑' if ascending else '↓'}{rank}"
+            return f"{header.text} ↕"
+
         if not header.action:
             return header.text
             
@@ -127,7 +384,43 @@ class Table(ttk.Frame):
         
         return f"{header.text} {'↑' if self._sort_ascending[header.colNo] else '↓'}"
 
+    def _compile_plan(self, col: int, header: Header) -> _ColumnPlan:
+        """Resolve a header into the style, widget factory and handlers of its cells"""
+        plan = _ColumnPlan(col, header, self.edit_on_demand)
+        match plan.kind:
+            case WidgetType.TEXT if self._canvas is not None:
+                plan.text_color = self._canvas.text_color(header)
+                plan.factory = partial(self._make_drawn_text, plan)
+            case WidgetType.CHECKBOX:
+                # Fix: Use a standard ttkbootstrap style instead of a custom one
+                plan.style = "success.TCheckbutton"
+                plan.handler = self._handle_checkbox_change
+                plan.factory = partial(self._make_check, plan)
+            case WidgetType.SQTOGGLE:
+                plan.style = "primary-square-toggle.Toolbutton"  # Use Toolbutton style class which supports toggles
+                plan.handler = self._handle_toggle_change
+                plan.factory = partial(self._make_check, plan)
+            case WidgetType.RNDTOGGLE:
+                plan.style = "primary-round-toggle.Toolbutton"  # Use Toolbutton style class with round-toggle
+                plan.handler = self._handle_toggle_change
+                plan.factory = partial(self._make_check, plan)
+            case WidgetType.RADIOBTN:
+                plan.style = "primary.TRadiobutton"
+                plan.factory = partial(self._make_radio, plan)
+            case WidgetType.ENTRY:
+                plan.style = "primary.TEntry"
+                plan.factory = partial(self._make_entry, plan)
+            case WidgetType.BUTTON:
+                plan.style = header.style if header.style is not None else "primary.TButton"
+                plan.factory = partial(self._make_button, plan)
+            case _:
+                # Text is the default type - uses Label
+                plan.factory = partial(self._make_label, plan)
+        return plan
+
     def _create_table(self):
+        self._plans = [self._compile_plan(col, header) for col, header in enumerate(self.headers)]
+        
         # Create headers
         for col, header in enumerate(self.headers):
             header_label = ttk.Label(
@@ -138,286 +431,1516 @@ class Table(ttk.Frame):
                 font=("TkDefaultFont", 10, "bold")
             )
             header.colNo = col
+            self._header_labels.append(header_label)
             
             # Add click binding if header has action
-            if header.action:
-                header_label.bind("<Button-1>", lambda e, h=header: self._handle_header_click(h))
+            if header.action or header.sortable:
+                header_label.bind("<Button-1>", lambda e, h=header: self._handle_header_click(h, e))
                 header_label.configure(cursor="hand2")  # Change cursor to hand when hoverable
                 
             header_label.grid(row=0, column=col, padx=1, pady=1, sticky="nsew")
             self.grid_columnconfigure(col, weight=header.weight)
         
-        # Create data rows
-        for row_idx, row_data in enumerate(self.data, start=1):
-            bg_color = self.alternate_row_color if row_idx % 2 == 0 else self.row_color
+        if self.filterable:
+            self._create_filter_row()
+        
+        if self.paged:
+            self._create_page_bar()
+        
+        if self._canvas is not None:
+            self._canvas.canvas.grid(row=1 + self._row_offset, column=0, columnspan=len(self.headers), sticky="nsew")
+        if self._layout is not None:
+            self._layout.body.grid(row=1 + self._row_offset, column=0, columnspan=len(self.headers), sticky="nsew")
+            self._layout.watch(self._header_labels)
+        
+        if self._pooled:
+            self._create_virtual_rows()
+            return
+
+        self._layout_groups()
+
+        # Create the first screen of data rows now, the rest in chunks between frames
+        for row_idx, data_idx in enumerate(self._order[:self.visible_rows], start=1):
+            self._rows.append(self._create_row(row_idx, data_idx))
+        self._update_row_count()
+        if len(self._order) > len(self._rows):
+            self._build = frame_scheduler(self).submit(
+                self._build_rows(), total=len(self._order), on_progress=self._on_build_progress, on_done=self._on_build_done)
+
+    def _build_rows(self) -> Iterator[int]:
+        """Steps of the initial build: create the rows not created yet, one per step, rows appended meanwhile too"""
+        while len(self._rows) < len(self._order):
+            row_idx = len(self._rows) + 1
+            self._rows.append(self._create_row(row_idx, self._order[row_idx - 1]))
+            yield row_idx
+
+    def _on_build_progress(self, done: int, total: int):
+        self._update_row_count()
+        if self.on_progress is not None:
+            self.on_progress(len(self._rows), len(self._order))
+
+    def _on_build_done(self):
+        self._build = None
+
+    def _finish_build(self):
+        """
+        Create the rows the initial build has not reached yet, before the rows are rearranged. Cell
+        updates and appends do not need it: the rows created later read the model.
+        """
+        if self._build is not None:
+            self._build.finish()
+
+    def _create_filter_row(self):
+        """Create the filter inputs under the headers"""
+        for col, header in enumerate(self.headers):
+            if header.type == WidgetType.BUTTON:
+                continue
+            if header.type in _BOOLEAN_TYPES:
+                filter_input = ttk.Combobox(self, values=("", "True", "False"), state="readonly", width=6)
+                filter_input.bind("<<ComboboxSelected>>", lambda e, c=col, w=filter_input: self.set_filter(c, w.get()))
+            else:
+                filter_input = ttk.Entry(self, style="primary.TEntry", width=8)
+                filter_input.bind("<KeyRelease>", lambda e, c=col, w=filter_input: self.set_filter(c, w.get()))
+            filter_input.grid(row=1, column=col, padx=1, pady=1, sticky="nsew")
+            self._filter_inputs[col] = filter_input
+
+    def _create_page_bar(self):
+        """Create the page navigation controls under the rows"""
+        page_bar = ttk.Frame(self)
+        for text, command in (
+            ("«", lambda: self.go_to_page(0)),
+            ("‹", lambda: self.go_to_page(self._page - 1)),
+        ):
+            ttk.Button(page_bar, text=text, style="primary.TButton", width=3, command=command).pack(side="left", padx=1)
+        self._page_label = ttk.Label(page_bar, anchor="center")
+        self._page_label.pack(side="left", padx=5)
+        for text, command in (
+            ("›", lambda: self.go_to_page(self._page + 1)),
+            ("»", lambda: self.go_to_page(self.model.page_count - 1)),
+        ):
+            ttk.Button(page_bar, text=text, style="primary.TButton", width=3, command=command).pack(side="left", padx=1)
+        page_bar.grid(row=self.visible_rows + self._row_offset + 1, column=0, columnspan=len(self.headers), pady=2)
+        self._update_page_label()
+
+    def _update_page_label(self):
+        if self._page_label is not None:
+            self._page_label.configure(text=f"Page {self._page + 1} of {self.model.page_count}")
+
+    def _create_row(self, row_idx: int, data_idx: int) -> "_TableRow":
+        """Create and grid the widgets of grid row row_idx showing data row data_idx"""
+        table_row = _TableRow(data_idx, row_idx)
+        table_row.values = self.model.row(data_idx)
+        cells = table_row.cells
+
+        for plan, cell_data in zip(self._plans, table_row.values):
+            cell_widget = plan.factory(row_idx, cell_data)
+            cell_widget.table_row = table_row
+            cells.append(cell_widget)
             
-            for col_idx, cell_data in enumerate(row_data):
-                bg_color = self.alternate_row_color if row_idx % 2 == 0 else self.row_color
-                
-                cell_widget = self._create_cell_widget(
-                    row_idx, 
-                    col_idx, 
-                    cell_data, 
-                    self.headers[col_idx],
-                    bg_color
-                )
-                
-                # Store cell reference
-                self._cells[(row_idx, col_idx)] = cell_widget
-                
-                # Bind events (only for TEXT widgets, others handle events differently)
-                if self.headers[col_idx].type == WidgetType.TEXT:
-                    cell_widget.bind("<Button-1>", lambda e, r=row_idx, c=col_idx: self._handle_cell_click(r, c))
-                    if self.headers[col_idx].editable:
-                        cell_widget.bind("<Double-Button-1>", lambda e, r=row_idx, c=col_idx: self._make_cell_editable(r, c))
-                
-                cell_widget.grid(row=row_idx, column=col_idx, padx=1, pady=1, sticky="nsew")
+            if plan.factory.func == self._make_drawn_text:
+                continue  # The canvas handles the events of drawn cells
+
+            # Events go through the table's bindtag; rows can move, so the cell is looked up when they fire
+            cell_widget.table_column = plan.col
+            cell_widget.bindtags((str(cell_widget), self._bindtag) + cell_widget.bindtags()[1:])
 
-    def _create_cell_widget(self, row_idx, col_idx, cell_data, header, bg_color):
-        fg_color = "dark"
-        text_color = header.text_color if header.text_color is not None else "white"
-        fg_color = header.fg_color if header.fg_color is not None else fg_color
-        bg_color = header.bg_color if header.bg_color is not None else bg_color
+        if self._formats is not None:
+            # Created with the row's style, formatted cells take theirs
+            base = "Row.TLabel" if row_idx % 2 == 0 else "Alt.TLabel"
+            for col in self._formats.columns:
+                style = self._formats.style(base, data_idx, col)
+                if style != base and self._plans[col].shows_text:
+                    cells[col].configure(style=style)
         
-        # Handle alignment
-        anchor = "w"
-        match header.align.lower():
-            case "w":
-                anchor = "w"
-            case "left":
-                anchor = "w"
-            case "e":
-                anchor = "e"
-            case "right":
-                anchor = "e"
-            case "center":
-                anchor = "center"
-            case _:
-                anchor = "w"  # default to left alignment
-                
-        # Determine cell widget type based on header.type
-        match header.type:
-            case WidgetType.TEXT:
-                # Text is the default type - uses Label
-                cell_widget = ttk.Label(
-                    self,
-                    text=str(cell_data),
-                    style="Row.TLabel" if row_idx % 2 == 0 else "Alt.TLabel",
-                    anchor=anchor
-                )
-                
-            case WidgetType.CHECKBOX:
-                # Create checkbox widget
-                var = BooleanVar()
-                cell_widget = ttk.Checkbutton(
-                    self,
-                    text="",
-                    # Fix: Use a standard ttkbootstrap style instead of a custom one
-                    style="success.TCheckbutton",
-                    variable=var
-                )
-                
-                # Set initial value
-                if isinstance(cell_data, bool):
-                    var.set(cell_data)
-                elif isinstance(cell_data, (int, float)):
-                    var.set(bool(cell_data))
-                elif isinstance(cell_data, str) and cell_data.lower() in ('true', 'yes', '1'):
-                    var.set(True)
-                else:
-                    var.set(False)
-                
-                # Store the BooleanVar reference
-                cell_widget.var = var
-                
-                # Add event handling
-                cell_widget.configure(command=lambda r=row_idx-1, c=col_idx, cb=cell_widget: 
-                    self._handle_checkbox_change(r, c, cb))
-                
-            case WidgetType.SQTOGGLE:
-                # Create toggle/switch widget
-                var = BooleanVar()
-                # Fix: Use standard ttkbootstrap style for toggles
-                cell_widget = ttk.Checkbutton(
-                    self,
-                    text="",
-                    style="primary-square-toggle.Toolbutton",  # Use Toolbutton style class which supports toggles
-                    variable=var
-                )
-                
-                # Set initial value
-                if isinstance(cell_data, bool):
-                    var.set(cell_data)
-                elif isinstance(cell_data, (int, float)):
-                    var.set(bool(cell_data))
-                elif isinstance(cell_data, str) and cell_data.lower() in ('true', 'yes', '1'):
-                    var.set(True)
-                else:
-                    var.set(False)
-                
-                # Store the BooleanVar reference
-                cell_widget.var = var
-                
-                # Add event handling
-                cell_widget.configure(command=lambda r=row_idx-1, c=col_idx, sw=cell_widget: 
-                    self._handle_toggle_change(r, c, sw))
-                
-            case WidgetType.RNDTOGGLE:
-                # Create toggle/switch widget
-                var = BooleanVar()
-                # Fix: Use standard ttkbootstrap style for round toggles
-                cell_widget = ttk.Checkbutton(
-                    self,
-                    text="",
-                    style="primary-round-toggle.Toolbutton",  # Use Toolbutton style class with round-toggle 
-                    variable=var
-                )
-                
-                # Set initial value
-                if isinstance(cell_data, bool):
-                    var.set(cell_data)
-                elif isinstance(cell_data, (int, float)):
-                    var.set(bool(cell_data))
-                elif isinstance(cell_data, str) and cell_data.lower() in ('true', 'yes', '1'):
-                    var.set(True)
-                else:
-                    var.set(False)
-                
-                # Store the BooleanVar reference
-                cell_widget.var = var
-                
-                # Add event handling
-                cell_widget.configure(command=lambda r=row_idx-1, c=col_idx, sw=cell_widget: 
-                    self._handle_toggle_change(r, c, sw))
-                
+        self._grid_row(table_row, row_idx)
+        return table_row
+
+    def _grid_row(self, table_row: "_TableRow", row_idx: int):
+        """Grid the widgets of a row at grid row row_idx and store the cell references"""
+        table_row.row = row_idx
+        for col_idx, cell_widget in enumerate(table_row.cells):
+            self._cells[(row_idx, col_idx)] = cell_widget
+            self._place_cell(cell_widget, row_idx, col_idx)
+
+    def _place_cell(self, cell_widget, row_idx: int, col_idx: int):
+        """Show a cell widget at table row row_idx (1 based), on the grid, placed or on the canvas"""
+        if self._canvas is not None:
+            self._canvas.place(cell_widget, row_idx, col_idx)
+        else:
+            # Group rows take lines of their own above their first row
+            self._position(cell_widget, row_idx + bisect_left(self._group_starts, row_idx), col_idx)
+
+    def _position(self, widget, line: int, col_idx: int):
+        """Show a widget of a data or group row at line (1 based) under the headers"""
+        if self._layout is not None:
+            self._layout.place(widget, line, col_idx)
+        else:
+            widget.grid(row=line + self._row_offset, column=col_idx, padx=1, pady=1, sticky="nsew")
+
+    def _hide_cell(self, cell_widget):
+        if self._canvas is not None:
+            self._canvas.hide(cell_widget)
+        elif self._layout is not None:
+            self._layout.hide(cell_widget)
+        else:
+            cell_widget.grid_remove()
+
+    def _column_edges(self, area) -> List[int]:
+        """
+        x of each column's left edge, then the right end of the last column, relative to area (the
+        canvas or the placed body) and following the header labels; their requested widths until they
+        are laid out.
+        """
+        labels = self._header_labels
+        offset = area.winfo_x()
+        if labels and labels[-1].winfo_width() > 1:
+            edges = [label.winfo_x() - offset for label in labels]
+            edges.append(labels[-1].winfo_x() + labels[-1].winfo_width() - offset)
+        else:
+            edges = [0]
+            for label in labels:
+                edges.append(edges[-1] + label.winfo_reqwidth() + 2)
+        return edges
+
+    def _update_row_count(self):
+        """Fit the canvas or the placed lines to the rows shown"""
+        if self._canvas is not None:
+            self._canvas.set_row_count(len(self._rows))
+        elif self._layout is not None:
+            self._layout.set_line_count(len(self._rows) + len(self._group_keys))
+
+    def _create_virtual_rows(self):
+        """Create the scrollbar and the recycled row pool used in virtual and paged mode"""
+        if self.virtual:
+            self._scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+            self._scrollbar.grid(row=1 + self._row_offset, column=len(self.headers), rowspan=self.visible_rows, sticky="ns")
+        self._resize_pool()
+        self._refresh_rows()
+
+    def _resize_pool(self):
+        """Grow or shrink the row pool to fit min(visible_rows, shown rows)"""
+        target = min(self.visible_rows, len(self._order))
+        self._top = max(0, min(self._top, len(self._order) - target))
+        
+        while len(self._rows) > target:
+            row_idx = len(self._rows)
+            for col_idx in range(len(self.headers)):
+                del self._cells[(row_idx, col_idx)]
+            self._destroy_row(self._rows.pop())
+        
+        while len(self._rows) < target:
+            row_idx = len(self._rows) + 1
+            self._rows.append(self._create_row(row_idx, self._order[self._top + row_idx - 1]))
+        self._update_row_count()
+
+    def _refresh_rows(self):
+        """Rebind every pooled row to the data rows starting at self._top"""
+        for row_idx, table_row in enumerate(self._rows, start=1):
+            self._bind_row(table_row, self._order[self._top + row_idx - 1])
+            row = self._top + row_idx
+            if row == self.selected_row:
+                self._highlight_row(row)
+            else:
+                self._update_row_colors(row)
+        self._update_scrollbar()
+
+    def _bind_row(self, table_row: "_TableRow", data_idx: int):
+        """Point an existing row of widgets at data row data_idx, updating only the cells that differ"""
+        table_row.index = data_idx
+        row_data = self.model.row(data_idx)
+        for col_idx, cell_data in enumerate(row_data):
+            if table_row.values[col_idx] != cell_data:
+                self._set_cell_value(table_row.cells[col_idx], self._plans[col_idx], cell_data)
+        table_row.values = row_data
+
+    def _set_cell_value(self, cell_widget, plan: _ColumnPlan, cell_data):
+        """Show cell_data in a recycled cell widget without recreating it"""
+        match plan.kind:
             case WidgetType.RADIOBTN:
-                # Create radio button widget
-                var = BooleanVar()
-                cell_widget = ttk.Radiobutton(
-                    self,
-                    text="",
-                    style="primary.TRadiobutton",
-                    variable=var
-                )
-                
-                # Set initial value
-                if isinstance(cell_data, bool):
-                    var.set(cell_data)
-                elif isinstance(cell_data, (int, float)):
-                    var.set(bool(cell_data))
-                elif isinstance(cell_data, str) and cell_data.lower() in ('true', 'yes', '1'):
-                    var.set(True)
-                else:
-                    var.set(False)
-                
-                # Store the BooleanVar reference
-                cell_widget.var = var
-                
-                # Add event handling
-                cell_widget.configure(command=lambda r=row_idx-1, c=col_idx, sw=cell_widget: 
-                    self._handle_toggle_change(r, c, sw))
-                
+                if cell_widget.var is None:
+                    return  # Not shown, attached again by _attach_vars
+                if to_bool(cell_data):
+                    cell_widget.var.set(str(cell_widget))
+                elif cell_widget.var.get() == str(cell_widget):
+                    cell_widget.var.set("")
+            case WidgetType.CHECKBOX | WidgetType.SQTOGGLE | WidgetType.RNDTOGGLE:
+                if cell_widget.var is not None:
+                    cell_widget.var.set(to_bool(cell_data))
             case WidgetType.ENTRY:
-                # Create entry widget
-                cell_widget = ttk.Entry(
-                    self,
-                    # Fix: Use standard ttkbootstrap styles
-                    style="primary.TEntry",
-                )
-                
-                # Set initial value
-                cell_widget.insert(0, str(cell_data))
-                
-                # Enable/disable based on editable
-                if not header.editable:
+                cell_widget.configure(state="normal")
+                cell_widget.delete(0, "end")
+                cell_widget.insert(0, plan.format(cell_data))
+                if not plan.editable:
                     cell_widget.configure(state="readonly")
-                
-                # Add event handling
-                if header.editable:
-                    cell_widget.bind("<FocusOut>", lambda e, r=row_idx-1, c=col_idx, entry=cell_widget: 
-                        self._handle_entry_change(r, c, entry))
-                    cell_widget.bind("<Return>", lambda e, r=row_idx-1, c=col_idx, entry=cell_widget: 
-                        self._handle_entry_change(r, c, entry))
-                
-            case WidgetType.BUTTON:
-                # Create button widget
-                cell_widget = ttk.Button(
-                    self,
-                    text=str(cell_data),
-                    style=header.style if header.style is not None else "primary.TButton",
-                )
-                
-                # Add event handling
-                cell_widget.configure(command=lambda r=row_idx-1, c=col_idx: 
-                    self._handle_button_click(r, c))
-                
             case _:
-                # Default to text if unknown widget type
-                cell_widget = ttk.Label(
-                    self,
-                    text=str(cell_data),
-                    style="Row.TLabel" if row_idx % 2 == 0 else "Alt.TLabel",
-                    anchor=anchor
-                )
+                cell_widget.configure(text=plan.format(cell_data))
+
+    def _destroy_row(self, table_row: "_TableRow"):
+        self._detach_vars(table_row)
+        for cell_widget in table_row.cells:
+            cell_widget.destroy()
+
+    def _acquire_var(self, value) -> BooleanVar:
+        """A BooleanVar for a boolean cell being shown, reused from rows no longer shown"""
+        var = self._free_vars.pop() if self._free_vars else BooleanVar()
+        var.set(to_bool(value))
+        return var
+
+    def _radio_var(self, col: int) -> StringVar:
+        var = self._radio_vars.get(col)
+        if var is None:
+            var = self._radio_vars[col] = StringVar(value="")
+        return var
+
+    def _detach_vars(self, table_row: "_TableRow"):
+        """Unbind the boolean cells of a row that is no longer shown from their variables"""
+        for col_idx, cell_widget in enumerate(table_row.cells):
+            var = getattr(cell_widget, "var", None)
+            if var is None:
+                continue
+            cell_widget.configure(variable="")
+            if self._plans[col_idx].kind == WidgetType.RADIOBTN:
+                if var.get() == str(cell_widget):
+                    var.set("")
+            else:
+                self._free_vars.append(var)
+            cell_widget.var = None
+
+    def _attach_vars(self, table_row: "_TableRow"):
+        """Bind the boolean cells of a row being shown again to variables holding its values"""
+        for plan, cell_widget in zip(self._plans, table_row.cells):
+            if not plan.boolean or cell_widget.var is not None:
+                continue
+            if plan.kind == WidgetType.RADIOBTN:
+                cell_widget.var = self._radio_var(plan.col)
+            else:
+                cell_widget.var = self._acquire_var(table_row.values[plan.col])
+            cell_widget.configure(variable=cell_widget.var)
+            self._set_cell_value(cell_widget, plan, table_row.values[plan.col])
+
+    def _make_drawn_text(self, plan: _ColumnPlan, row_idx: int, cell_data) -> CanvasCell:
+        # Drawn on the table canvas, no widget
+        return CanvasCell(
+            self._canvas,
+            plan.format(cell_data),
+            anchor=plan.anchor,
+            fill=plan.text_color,
+            style="Row.TLabel" if row_idx % 2 == 0 else "Alt.TLabel"
+        )
+
+    def _make_label(self, plan: _ColumnPlan, row_idx: int, cell_data) -> ttk.Label:
+        return ttk.Label(
+            self,
+            text=plan.format(cell_data),
+            style="Row.TLabel" if row_idx % 2 == 0 else "Alt.TLabel",
+            anchor=plan.anchor
+        )
+
+    def _make_check(self, plan: _ColumnPlan, row_idx: int, cell_data) -> ttk.Checkbutton:
+        """Checkbox or toggle switch, depending on the plan's style"""
+        var = self._acquire_var(cell_data)
+        cell_widget = ttk.Checkbutton(self, text="", style=plan.style, variable=var)
+        
+        # Store the BooleanVar reference
+        cell_widget.var = var
+        
+        # Add event handling
+        cell_widget.configure(command=lambda c=plan.col, cb=cell_widget, handler=plan.handler:
+            handler(cb.table_row.index, c, cb))
+        return cell_widget
+
+    def _make_radio(self, plan: _ColumnPlan, row_idx: int, cell_data) -> ttk.Radiobutton:
+        # One variable per column makes the column a single-selection group
+        var = self._radio_var(plan.col)
+        cell_widget = ttk.Radiobutton(self, text="", style=plan.style, variable=var)
+        cell_widget.configure(value=str(cell_widget))
+        if to_bool(cell_data):
+            var.set(str(cell_widget))
+        
+        # Store the shared variable reference
+        cell_widget.var = var
+        
+        # Add event handling
+        cell_widget.configure(command=lambda c=plan.col, sw=cell_widget:
+            self._handle_radio_change(sw.table_row.index, c, sw))
+        return cell_widget
+
+    def _make_entry(self, plan: _ColumnPlan, row_idx: int, cell_data) -> ttk.Entry:
+        cell_widget = ttk.Entry(self, style=plan.style)
+        
+        # Set initial value
+        cell_widget.insert(0, plan.format(cell_data))
+        
+        # Enable/disable based on editable
+        if not plan.editable:
+            cell_widget.configure(state="readonly")
         
+        # Add event handling
+        if plan.editable:
+            cell_widget.bind("<FocusOut>", lambda e, c=plan.col, entry=cell_widget: 
+                self._handle_entry_change(entry.table_row.index, c, entry))
+            cell_widget.bind("<Return>", lambda e, c=plan.col, entry=cell_widget: 
+                self._handle_entry_change(entry.table_row.index, c, entry))
         return cell_widget
 
+    def _make_button(self, plan: _ColumnPlan, row_idx: int, cell_data) -> ttk.Button:
+        cell_widget = ttk.Button(self, text=plan.format(cell_data), style=plan.style)
+        
+        # Add event handling
+        cell_widget.configure(command=lambda c=plan.col, btn=cell_widget: 
+            self._handle_button_click(btn.table_row.index, c))
+        return cell_widget
+
+    def _store_value(self, row: int, col: int, new_value, table_row: Optional["_TableRow"] = None) -> bool:
+        """
+        Write an edited value through the model and into the row's bound values.
+        Returns False, and puts the stored value back in the widget, if the model rejects the value.
+        """
+        tracked = self._groups is not None or self._computed is not None or self.journal is not None
+        old_value = self.model.get(row, col) if tracked else None
+        try:
+            new_value = self.model.set(row, col, new_value)
+        except (TypeError, ValueError):
+            if table_row is not None:
+                self._set_cell_value(table_row.cells[col], self._plans[col], self.model.get(row, col))
+            return False
+        if table_row is not None:
+            table_row.values[col] = new_value
+        self._filter.update([(row, col)])
+        self._record(row, col, old_value, new_value)
+        self._format_cells([(row, col)])
+        regroup = self._groups is not None and self._group_changed(row, col, old_value, new_value)
+        if self._computed is not None and new_value != old_value:
+            regroup = self._show_computed(self._computed.update(self.model, row, [col])) or regroup
+        if regroup and self._regroup_id is None:
+            # Moved to another group; regrouped once idle, not under the handler that made the edit
+            self._regroup_id = self.after_idle(self._regroup)
+        return True
+
+    def _notify_change(self, row: int, col: int):
+        """
+        Call the column's on_change callback with a view of the data whose writes go through set_cells,
+        then apply them, so the sort, filter, formats, groups and computed cells follow
+        """
+        if not self.headers[col].on_change:
+            return
+        self.headers[col].on_change(_ChangeView(self), row, col)
+        if self._pending and self._batch_depth == 0:
+            self.flush_cells()
+
+    def _fill_computed(self, model: TableModel, rows: Iterable[int]):
+        """Compute the computed cells of new rows"""
+        if self._computed is not None and not isinstance(model, PagedTableModel):
+            self._computed.fill(model, rows)
+
+    def _show_computed(self, changes: Dict[Tuple[int, int], Tuple[Any, Any]]) -> bool:
+        """
+        Repaint the computed cells that changed (see ComputedColumns.update) and follow them in the
+        filter and group aggregates. Returns True when one moved its row to another group.
+        """
+        if not changes:
+            return False
+        regroup = False
+        self._format_cells(changes)
+        self._filter.update(changes)
+        shown = self._shown_rows()
+        for (row, col), (old_value, new_value) in changes.items():
+            if self._groups is not None:
+                regroup = self._group_changed(row, col, old_value, new_value) or regroup
+            table_row = shown.get(row)
+            if table_row is not None and table_row.values[col] != new_value:
+                self._set_cell_value(table_row.cells[col], self._plans[col], new_value)
+                table_row.values[col] = new_value
+        return regroup
+
+    def _format_cells(self, cells: Iterable[Tuple[int, int]]):
+        """Evaluate the conditional formats of cells that changed, given as (data row, col)"""
+        if self._formats is not None:
+            self._show_formats(self._formats.update(self.model, cells))
+
+    def _show_formats(self, cells: List[Tuple[int, int]]):
+        """Restyle the cells shown among cells whose conditional format changed; the selected row keeps its highlight"""
+        if not cells:
+            return
+        shown = self._shown_rows()
+        for row, col in cells:
+            table_row = shown.get(row)
+            if table_row is not None and table_row.row and table_row.row + self._top != self.selected_row:
+                self._update_cell_color(table_row.row + self._top, col)
+
     def _handle_checkbox_change(self, row: int, col: int, checkbox):
         """Handle checkbox value change"""
         # Update data
         new_value = checkbox.var.get()
-        self.data[row][col] = new_value
+        if not self._store_value(row, col, new_value, checkbox.table_row):
+            return
         
         # Trigger on_change callback if exists
-        if self.headers[col].on_change:
-            self.headers[col].on_change(self.data, row, col)
+        self._notify_change(row, col)
 
     def _handle_toggle_change(self, row: int, col: int, switch):
         """Handle toggle/switch value change"""
         # Update data
         new_value = switch.var.get()
-        self.data[row][col] = new_value
+        if not self._store_value(row, col, new_value, switch.table_row):
+            return
+        
+        # Trigger on_change callback if exists
+        self._notify_change(row, col)
+
+    def _radio_selection(self, col: int) -> Optional[Tuple[int, Any]]:
+        """(data row, radio button) selected in a RADIOBTN column, found by a scan only when not known"""
+        selected = self._radio_selected.get(col)
+        if selected is not None and selected[0] < len(self.model) and to_bool(self.model.get(selected[0], col)):
+            return selected
+        self._radio_selected.pop(col, None)
+        for row, value in enumerate(self.model.column(col)):
+            if to_bool(value):
+                self._radio_selected[col] = (row, None)
+                return self._radio_selected[col]
+        return None
+
+    def _handle_radio_change(self, row: int, col: int, radio):
+        """Select data row row in a RADIOBTN column, clearing the previously selected row"""
+        selected = self._radio_selection(col)
+        if selected is not None and selected[0] == row:
+            return
+        with self._grouped_changes():  # Selecting and clearing are one undo step
+            if not self._store_value(row, col, True, radio.table_row):
+                return
+            if selected is not None:
+                previous, previous_radio = selected
+                self._store_value(previous, col, False)
+                if previous_radio is not None and previous_radio.table_row.index == previous:
+                    previous_radio.table_row.values[col] = False
+        self._radio_selected[col] = (row, radio)
         
         # Trigger on_change callback if exists
-        if self.headers[col].on_change:
-            self.headers[col].on_change(self.data, row, col)
+        self._notify_change(row, col)
+
+    def set_column(self, col: int, value: bool):
+        """
+        Check or uncheck every row of a boolean column ("select all"), a word at a time with ColumnarTableModel.
+        RADIOBTN columns can only be cleared.
+        col: int - Column index
+        value: bool - The value for every row
+        """
+        if self.headers[col].type == WidgetType.RADIOBTN and to_bool(value):
+            raise ValueError("A RADIOBTN column has at most one selected row")
+        self.flush_cells()
+        old_values = list(self.model.column(col)) if self.journal is not None else None
+        self.model.fill_column(col, to_bool(value))
+        self._column_changed(col, old_values)
+
+    def invert_column(self, col: int):
+        """Flip every row of a CHECKBOX or toggle column, a word at a time with ColumnarTableModel"""
+        if self.headers[col].type == WidgetType.RADIOBTN:
+            raise ValueError("A RADIOBTN column has at most one selected row")
+        self.flush_cells()
+        old_values = list(self.model.column(col)) if self.journal is not None else None
+        self.model.invert_column(col)
+        self._column_changed(col, old_values)
+
+    def count_checked(self, col: int) -> int:
+        """Number of rows checked in a boolean column, a popcount with ColumnarTableModel"""
+        return self.model.count_true(col)
+
+    def _column_changed(self, col: int, old_values: Optional[List[Any]] = None):
+        """Show a column that was rewritten in the model, old_values are journaled as one transaction"""
+        if old_values is not None:
+            with self._grouped_changes():
+                for row, (old_value, new_value) in enumerate(zip(old_values, self.model.column(col))):
+                    self._record(row, col, old_value, new_value)
+        self._radio_selected.pop(col, None)
+        self._filter.invalidate(col)
+        for table_row in self._shown_rows().values():
+            value = self.model.get(table_row.index, col)
+            if table_row.values[col] != value:
+                self._set_cell_value(table_row.cells[col], self._plans[col], value)
+                table_row.values[col] = value
+        if self._formats is not None:
+            self._show_formats(self._formats.update_column(self.model, col))
+        columns = {col}
+        if self._computed is not None:
+            changes = self._computed.update_column(self.model, col)
+            self._show_computed(changes)
+            columns.update(computed for _, computed in changes)
+        resort = bool(columns & {sort_col for sort_col, _ in self._sort_spec})
+        regroup = False
+        if self._groups is not None:
+            self._groups.rebuild(self.model)
+            self._refresh_group_rows()
+            regroup = bool(columns & set(self._groups.columns))
+        if not self.paged and (resort or regroup or columns & self._filter.columns):
+            self._show_order(self._compute_order(resort=resort))
 
     def _handle_entry_change(self, row: int, col: int, entry):
         """Handle entry value change"""
         # Update data
         new_value = entry.get()
-        self.data[row][col] = new_value
+        if not self._store_value(row, col, new_value, entry.table_row):
+            return
         
         # Trigger on_change callback if exists
-        if self.headers[col].on_change:
-            self.headers[col].on_change(self.data, row, col)
+        self._notify_change(row, col)
 
     def _handle_button_click(self, row: int, col: int):
         """Handle button click"""
         # For buttons, we just trigger the on_change callback
-        if self.headers[col].on_change:
-            self.headers[col].on_change(self.data, row, col)
-
-    def update_data(self, new_data: List[List[Any]]):
-        """Update table with new data"""
-        # Clear existing data cells
-        for widget in self.winfo_children():
-            widget.destroy()
-            
-        self.data = new_data
-        self._create_table()
+        self._notify_change(row, col)
+
+    def update_data(self, new_data: Union[List[List[Any]], TableModel], key: Optional[Callable[[List[Any]], Any]] = None):
+        """
+        Update table with new data, reusing the widgets of the rows already shown.
+        new_data: Union[List[List[Any]], TableModel] - The new data rows, a PagedTableModel for a paged table
+        key: Optional[Callable] - Row key function used to match new rows with existing ones
+             (e.g. lambda row: row[0]); rows are matched by position when not given
+        """
+        self._finish_build()
+        new_model = self._as_tail_model(new_data) if self.tail is not None else self._as_model(new_data)
+        self._fill_computed(new_model, range(len(new_model)))
+        if self._formats is not None:
+            self._formats.rebuild(new_model)
+        self._pending.clear()  # Queued cell updates refer to the old rows
+        self._radio_selected.clear()
+        if self.journal is not None:
+            self.journal.clear()  # The changes to undo were made to the old rows
+        self._close_editor()
+        if self.paged:
+            # The provider sorts and filters, hand it the table's current query
+            new_model.set_query(self._sort_spec, self.model.filters)
+            self._page = min(self._page, new_model.page_count - 1)
+        else:
+            self._filter.set_model(new_model)
+        if self._pooled:
+            # Keep the pool, only rebind it to the new rows
+            self.model = new_model
+            self._order = self._compute_order()
+            self._resize_pool()
+            self._refresh_rows()
+            self._update_page_label()
+            return
+
+        old_rows = self._rows + self._hidden_rows
+        by_position = sorted(old_rows, key=lambda table_row: table_row.index)
+
+        # Match every new row with an existing row of widgets, None means it has to be created
+        if key is None:
+            matched = by_position[:len(new_model)] + [None] * (len(new_model) - len(old_rows))
+            removed = by_position[len(new_model):]
+        else:
+            by_key = {}
+            for table_row in reversed(by_position):
+                by_key.setdefault(key(table_row.values), []).append(table_row)
+            matched = []
+            for row_data in new_model.rows():
+                candidates = by_key.get(key(row_data))
+                matched.append(candidates.pop() if candidates else None)
+            removed = [table_row for candidates in by_key.values() for table_row in candidates]
+
+        for table_row in removed:
+            self._destroy_row(table_row)
+
+        self.model = new_model
+        if self._groups is not None:
+            self._groups.rebuild(new_model)
+            self._refresh_group_rows()
+        self._order = self._compute_order()
+        self._arrange_rows({data_idx: table_row for data_idx, table_row in enumerate(matched) if table_row is not None},
+                           rebind=True)
+
+    def set_cells(self, updates: Dict[Tuple[int, int], Any]):
+        """
+        Queue cell updates, applied together once the UI is idle (see flush_cells). A cell written
+        several times before that takes the last value, and each widget is configured at most once.
+        on_change callbacks are not called for these updates.
+        updates: Dict[Tuple[int, int], Any] - Values by (data row, column)
+        """
+        self._pending.update(updates)
+        if self._batch_depth == 0 and self._flush_id is None and self._pending:
+            self._flush_id = self.after_idle(self.flush_cells)
+
+    @contextmanager
+    def batch(self) -> Iterator["Table"]:
+        """Hold back the updates of set_cells until the outermost batch ends, then apply them in one pass"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._flush_id is None and self._pending:
+                self._flush_id = self.after_idle(self.flush_cells)
+
+    def flush_cells(self):
+        """Apply the cell updates queued by set_cells now"""
+        if self._flush_id is not None:
+            self.after_cancel(self._flush_id)
+            self._flush_id = None
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        stored = {}
+        regroup = False
+        tracked = self._groups is not None or self._computed is not None or self.journal is not None
+        sources = {}  # Data row -> columns changed, for the computed columns
+        with self._grouped_changes():  # One undo step per flush
+            for (row, col), value in pending.items():
+                old_value = self.model.get(row, col) if tracked else None
+                try:
+                    stored[(row, col)] = self.model.set(row, col, value)
+                except (TypeError, ValueError):
+                    continue  # The model keeps its value
+                self._record(row, col, old_value, stored[(row, col)])
+                if self._groups is not None:
+                    regroup = self._group_changed(row, col, old_value, stored[(row, col)]) or regroup
+                if self._computed is not None and stored[(row, col)] != old_value:
+                    sources.setdefault(row, []).append(col)
+        if self._computed is not None and not self.paged:
+            for row, columns in sources.items():
+                for cell, (old_value, new_value) in self._computed.update(self.model, row, columns).items():
+                    stored[cell] = new_value  # Shown, filtered and sorted like the cells set
+                    if self._groups is not None:
+                        regroup = self._group_changed(*cell, old_value, new_value) or regroup
+        self._format_cells(stored)
+        self._filter.update(stored)
+        columns = {col for _, col in stored}
+
+        resort = bool(columns & {col for col, _ in self._sort_spec})
+        # Updated values can move rows or change what the filter lets through
+        reorder = not self.paged and (resort or regroup or bool(columns & self._filter.columns))
+        if reorder and self._pooled:
+            # Rebinding the pool configures only the cells that differ
+            self._show_order(self._compute_order(resort=resort))
+            return
+
+        shown = self._shown_rows()
+        for (row, col), value in stored.items():
+            table_row = shown.get(row)
+            if table_row is not None and table_row.values[col] != value:
+                self._set_cell_value(table_row.cells[col], self._plans[col], value)
+                table_row.values[col] = value
+        if reorder:
+            self._show_order(self._compute_order(resort=resort))
+
+    def _shown_rows(self) -> Dict[int, "_TableRow"]:
+        """Rows that have widgets, by data row index"""
+        if self._pooled:
+            return {table_row.index: table_row for table_row in self._rows}
+        return self._rows_by_index()
+
+    def _record(self, row: int, col: int, old_value, new_value):
+        """Journal a cell change made through the table"""
+        if self.journal is None or self._replaying or old_value == new_value:
+            return
+        key = self.row_key(self.model.row(row)) if self.row_key is not None else row
+        self.journal.record(Change(key, col, old_value, new_value, row))
+
+    @contextmanager
+    def _grouped_changes(self) -> Iterator[None]:
+        """Journal the changes made inside as one transaction"""
+        if self.journal is None:
+            yield
+            return
+        self.journal.begin()
+        try:
+            yield
+        finally:
+            self.journal.end()
+
+    @contextmanager
+    def transaction(self) -> Iterator["Table"]:
+        """
+        Group the cell changes made inside, by edits or set_cells, into one journal entry that undo and
+        redo revert and apply together. Queued set_cells updates are applied when it ends.
+        """
+        with self._grouped_changes():
+            yield self
+            self.flush_cells()
+
+    def undo(self) -> bool:
+        """Revert the last journaled transaction, writing back only its cells; False when there is nothing to undo"""
+        return self._replay(revert=True)
+
+    def redo(self) -> bool:
+        """Apply the last undone transaction again; False when there is nothing to redo"""
+        return self._replay(revert=False)
+
+    def changes_since(self, token: int, net: bool = True) -> List[Change]:
+        """
+        Cell changes since token (from table.journal.token), oldest first, as Change(key, col, old, new, row);
+        undo and redo show as changes too. With net each cell is merged into one change (see ChangeJournal.changes_since).
+        """
+        return self._journal().changes_since(token, net)
+
+    def _journal(self) -> ChangeJournal:
+        if self.journal is None:
+            raise ValueError("The table keeps no journal, see Table(journal=True)")
+        return self.journal
+
+    def _replay(self, revert: bool) -> bool:
+        journal = self._journal()
+        self._commit_editor()
+        self.flush_cells()  # Journals what is queued, before taking the transaction
+        changes = journal.undo() if revert else journal.redo()
+        if changes is None:
+            return False
+        updates = {}
+        # A cell changed twice ends on its first old value when reverted, on its last new value otherwise
+        for change in (reversed(changes) if revert else changes):
+            row = self._journal_row(change)
+            if row is not None:
+                updates[(row, change.col)] = change.old if revert else change.new
+        self._replaying = True
+        try:
+            self._pending.update(updates)
+            self.flush_cells()  # Repaints, recomputes, regroups and resorts only what the cells touch
+        finally:
+            self._replaying = False
+        return True
+
+    def _journal_row(self, change: Change) -> Optional[int]:
+        """Data row a journaled change belongs to now, None when the row is gone"""
+        if self.row_key is None:
+            return change.row if change.row < len(self.model) else None
+        row = change.row
+        if row < len(self.model) and self.row_key(self.model.row(row)) == change.key:
+            return row
+        # Rows moved since, look the key up
+        for row, row_data in enumerate(self.model.rows()):
+            if self.row_key(row_data) == change.key:
+                return row
+        return None
+
+    def append_rows(self, rows: List[List[Any]]):
+        """
+        Add rows at the end of the data. Without an active sort or filter only the new rows' widgets are created.
+        rows: List[List[Any]] - The rows to add
+        """
+        if self.tail is not None:
+            self._append_tail(rows)
+            return
+        self.insert_rows(len(self.model), rows)
+
+    def _append_tail(self, rows: List[List[Any]]):
+        """Append to the ring buffer of a tail table; the dropped rows' widgets are rebound to the new rows"""
+        self.flush_cells()
+        self._commit_editor()  # Both use the data row indices from before the append
+        order = self._order
+        selected_idx = order[self.selected_row - 1] if self.selected_row and self.selected_row <= len(order) else None
+        top_idx = order[self._top] if order and not self.auto_scroll else None
+        size = len(self.model)
+        evicted = self.model.append(rows)
+        if not evicted and len(self.model) == size:
+            return
+        self._fill_computed(self.model, range(max(0, len(self.model) - len(rows)), len(self.model)))
+        if self._formats is not None:
+            self._formats.append_ring(self.model, len(rows))
+        if self.journal is not None and evicted:
+            self.journal.remap(lambda data_idx: data_idx - evicted if data_idx >= evicted else None, keys=self.row_key is None)
+        self._radio_selected.clear()
+        self._sorted = None
+        self._filter.set_model(self.model)  # The rows of the indexes kept without a filter shifted too
+        if self._sort_spec or self._filter.active:
+            order = self._compute_order()
+        else:
+            order = range(len(self.model))  # Data order, without building a list per append
+        self._order = order
+
+        def position(data_idx):
+            """Index in order of a data row from before the append, None when it was dropped or filtered out"""
+            if data_idx is None or data_idx < evicted:
+                return None
+            try:
+                return order.index(data_idx - evicted)
+            except ValueError:
+                return None
+
+        row = position(selected_idx)
+        self.selected_row = row + 1 if row is not None else None
+        if self.selected_cell:
+            self.selected_cell = (self.selected_row, self.selected_cell[1]) if self.selected_row else None
+        if self.auto_scroll:
+            self._top = max(0, len(order) - self.visible_rows)
+        else:
+            # Paused: stay on the rows shown, unless they were dropped
+            self._top = position(top_idx) or 0
+        self._resize_pool()
+        self._refresh_rows()
+
+    def pause_scroll(self):
+        """Tail mode: stop following the newest rows, scrolling up does the same"""
+        self.auto_scroll = False
+
+    def resume_scroll(self):
+        """Tail mode: show the newest rows and follow them again"""
+        self.auto_scroll = True
+        self._scroll_to(len(self._order))
+
+    def load_csv(self, path: str, has_header: bool = True, chunk_size: int = 100, status_bar=None,
+                 on_done: Optional[Callable[[], None]] = None) -> FrameJob:
+        """
+        Replace the data with the rows of a CSV file, streamed in between frames a chunk at a time.
+        Values are converted with the column types of the headers (see Header.dtype).
+        path: str - File to read
+        has_header: bool - The first line names the columns, matched with the header texts (default: True)
+        chunk_size: int - Rows appended per step (default: 100)
+        status_bar: Optional[StatusBar] - Status bar showing the progress (default: None)
+        on_done: Optional[Callable] - Called once every row is loaded (default: None)
+        """
+        return self._load(FileReader(path, self._column_names(), "csv", has_header), chunk_size, status_bar, on_done)
+
+    def load_jsonl(self, path: str, chunk_size: int = 100, status_bar=None,
+                   on_done: Optional[Callable[[], None]] = None) -> FrameJob:
+        """
+        Replace the data with the rows of a JSONL file, one object keyed by header text (or one list) per line,
+        arguments as for load_csv. Other lines are skipped, counted in the status bar.
+        """
+        return self._load(FileReader(path, self._column_names(), "jsonl"), chunk_size, status_bar, on_done)
+
+    def _column_names(self) -> List[str]:
+        return [header.text for header in self.headers]
+
+    def _load(self, reader: FileReader, chunk_size: int, status_bar, on_done: Optional[Callable[[], None]]) -> FrameJob:
+        if self.paged:
+            raise ValueError("A paged table reads its rows from its provider")
+        # Start empty with the same kind of model, a columnar model keeps its column types
+        types = getattr(self.model, "types", None)
+        self.update_data(ColumnarTableModel([], types=list(types)) if types is not None else [])
+        coercers = [coercer(bool if header.type in _BOOLEAN_TYPES else header.dtype) for header in self.headers]
+        # Read, convert and append lazily, one chunk per step: no list of every row is built
+        steps = map(self.append_rows, chunks(coerce_rows(reader, coercers), chunk_size))
+        name = os.path.basename(reader.path)
+
+        def skipped() -> str:
+            return f", {reader.skipped} bad lines skipped" if reader.skipped else ""
+
+        def progress(done: int, total: Optional[int]):
+            if status_bar is not None:
+                status_bar.update_status(f"Loading {name} {len(self.model)} rows{skipped()}", reader.progress)
+
+        def done():
+            if status_bar is not None:
+                status_bar.update_status(f"Loaded {len(self.model)} rows from {name}{skipped()}", 1.0)
+            if on_done is not None:
+                on_done()
+        return frame_scheduler(self).submit(steps, on_progress=progress, on_done=done)
+
+    def export_csv(self, path: str, status_bar=None,
+                   on_done: Optional[Callable[[Optional[Exception]], None]] = None) -> ExportJob:
+        """
+        Write the rows shown, in the order shown (sorted and filtered), to a CSV file with a header
+        line. The file is written in a background thread from a snapshot of the data, so the table
+        stays responsive and can be changed meanwhile.
+        path: str - File to write
+        status_bar: Optional[StatusBar] - Status bar showing the progress (default: None)
+        on_done: Optional[Callable] - on_done(error) once written, error is None on success (default: None)
+        """
+        return self._export(write_csv, path, status_bar, on_done)
+
+    def export_jsonl(self, path: str, status_bar=None,
+                     on_done: Optional[Callable[[Optional[Exception]], None]] = None) -> ExportJob:
+        """Write the rows shown to a JSONL file, one object keyed by header text per line, arguments as for export_csv"""
+        return self._export(write_jsonl, path, status_bar, on_done)
+
+    def _export(self, write: Callable, path: str, status_bar,
+                on_done: Optional[Callable[[Optional[Exception]], None]]) -> ExportJob:
+        if self.paged:
+            raise ValueError("A paged table holds only the pages shown, export from its provider")
+        self.flush_cells()
+        self._commit_editor()
+        snapshot = self.model.snapshot()
+        order = list(self._order)
+        rows = (snapshot.row(data_idx) for data_idx in order)  # Read in the export thread
+        return ExportJob(self, write, path, rows, len(order), self._column_names(), status_bar, on_done).start()
+
+    def insert_rows(self, index: int, rows: List[List[Any]]):
+        """
+        Insert rows into the data before data row index; the rows after them are re-gridded, not recreated.
+        index: int - Data row index to insert at, clamped to the number of rows
+        rows: List[List[Any]] - The rows to insert
+        Raises ValueError in a tail table, which only appends rows, and in a paged table.
+        """
+        self._check_row_changes()
+        self.flush_cells()  # Queued updates use the current row indices
+        index = max(0, min(index, len(self.model)))
+        appended = index == len(self.model) and not self._sort_spec and not self._filter.active and self._groups is None
+        if not appended:
+            self._finish_build()  # The rows after index are renumbered
+        count = self.model.insert(index, rows)
+        if not count:
+            return
+        self._fill_computed(self.model, range(index, index + count))
+        if self._formats is not None:
+            self._formats.insert(self.model, index, count)
+        if appended:
+            # Appended in data order, nothing that is shown moves
+            self._sorted = None
+            self._filter.set_model(self.model)
+            start = len(self._order)
+            self._order.extend(range(index, index + count))
+            if self._pooled:
+                self._resize_pool()
+                self._refresh_rows()
+            elif self._build is not None:
+                self._build.total = len(self._order)  # The build goes on with the new rows
+            else:
+                for row_idx, data_idx in enumerate(self._order[start:], start=start + 1):
+                    self._rows.append(self._create_row(row_idx, data_idx))
+                self._update_row_count()
+            return
+        regroup = True
+        if self._groups is not None and index + count == len(self.model):
+            # Appended: the rows before keep their indices and groups
+            for key in self._groups.add_rows(self.model, range(index, index + count)):
+                self._update_group_row(key)
+            regroup = False
+        self._renumber_rows(lambda data_idx: data_idx + count if data_idx >= index else data_idx, regroup)
+
+    def delete_rows(self, indices: List[int]):
+        """
+        Remove data rows, destroying only their widgets; the rows after them are re-gridded.
+        indices: List[int] - Data row indices to remove
+        Raises ValueError in a tail table, which only appends rows, and in a paged table.
+        """
+        self._check_row_changes()
+        self.flush_cells()
+        self._finish_build()
+        indices = self.model.delete(indices)
+        if not indices:
+            return
+        if self._formats is not None:
+            self._formats.delete(indices)
+        removed = set(indices)
+        if not self._pooled:
+            for table_row in self._rows + self._hidden_rows:
+                if table_row.index in removed:
+                    self._destroy_row(table_row)
+        self._renumber_rows(lambda data_idx: None if data_idx in removed else data_idx - bisect_left(indices, data_idx))
+
+    def move_row(self, src: int, dst: int):
+        """
+        Move data row src to index dst, keeping its widgets; the rows in between are re-gridded.
+        src: int - Data row index to move
+        dst: int - Data row index it ends up at
+        Raises ValueError in a tail table, which only appends rows, and in a paged table.
+        """
+        self._check_row_changes()
+        if not (0 <= src < len(self.model) and 0 <= dst < len(self.model)):
+            raise IndexError("row index out of range")
+        if src == dst:
+            return
+        self.flush_cells()
+        self._finish_build()
+        self.model.move(src, dst)
+        if self._formats is not None:
+            self._formats.move(src, dst)
+
+        def remap(data_idx):
+            if data_idx == src:
+                return dst
+            if src < data_idx <= dst:
+                return data_idx - 1
+            if dst <= data_idx < src:
+                return data_idx + 1
+            return data_idx
+        self._renumber_rows(remap)
+
+    def _check_row_changes(self):
+        """Refuse to insert, delete or move rows of the models that cannot"""
+        if self.tail is not None:
+            raise ValueError("A tail table only appends rows, see append_rows")
+        if self.paged:
+            raise ValueError("A paged table reads its rows from its provider, change them there and call update_data")
+
+    def _renumber_rows(self, remap: Callable[[int], Optional[int]], regroup: bool = True):
+        """
+        Follow rows inserted, removed or moved in the model: remap gives the new data row index of an
+        old one (None when removed). The rows are then laid out again, selection follows its row.
+        regroup: bool - Group the rows again, unless the group index already follows the change (default: True)
+        """
+        if self._groups is not None and regroup:
+            self._groups.rebuild(self.model)
+            self._refresh_group_rows()
+        if self.journal is not None:
+            self.journal.remap(remap, keys=self.row_key is None)
+        self._sorted = None
+        self._filter.set_model(self.model)
+        self._radio_selected.clear()
+        if self._pooled:
+            # Pooled rows are rebound anyway, only the selection has to follow its data row
+            self._order = [remap(data_idx) for data_idx in self._order]
+        else:
+            for table_row in self._rows + self._hidden_rows:
+                table_row.index = remap(table_row.index)
+        self._show_order(self._compute_order())
+
+    def _arrange_rows(self, rows_by_index: Dict[int, "_TableRow"], rebind: bool = False):
+        """
+        Lay out rows_by_index[data_idx] in the order of self._order, creating the missing rows,
+        re-gridding only the rows that moved and hiding the rows left out. Selection follows its row.
+        """
+        selected = None
+        if self.selected_row and self.selected_row <= len(self._rows):
+            selected = self._rows[self.selected_row - 1]
+
+        old_count = len(self._rows)
+        self._rows = []
+        moved = []
+        regrid = self._group_starts != self._laid_starts  # Group rows moved, the rows below them too
+        for row_idx, data_idx in enumerate(self._order, start=1):
+            table_row = rows_by_index.get(data_idx)
+            if table_row is None:
+                table_row = self._create_row(row_idx, data_idx)
+            else:
+                if rebind:
+                    self._bind_row(table_row, data_idx)
+                if not table_row.row:
+                    self._attach_vars(table_row)  # Shown again after being filtered out
+                if table_row.row != row_idx or regrid:
+                    self._grid_row(table_row, row_idx)
+                    moved.append(row_idx)
+                elif rebind and self._formats is not None:
+                    moved.append(row_idx)  # New values in place, their conditional formats may differ
+            self._rows.append(table_row)
+
+        self._hidden_rows = []
+        for table_row in rows_by_index.values():
+            if not self._is_shown(table_row):
+                if self._groups is not None and self._groups.is_collapsed(table_row.index):
+                    self._destroy_row(table_row)  # Collapsed groups hold no widgets
+                    continue
+                if table_row.row:
+                    for cell_widget in table_row.cells:
+                        self._hide_cell(cell_widget)
+                    self._detach_vars(table_row)
+                    table_row.row = 0
+                self._hidden_rows.append(table_row)
+        for row_idx in range(len(self._rows) + 1, old_count + 1):
+            for col_idx in range(len(self.headers)):
+                self._cells.pop((row_idx, col_idx), None)
+        self._update_row_count()
+        self._layout_groups()
+
+        # Moved and rebound rows take the style of their new position and values
+        if selected is not None and self._is_shown(selected):
+            if self.selected_cell:
+                self.selected_cell = (selected.row, self.selected_cell[1])
+            self.selected_row = selected.row
+        else:
+            self.selected_row = None
+            self.selected_cell = None
+        for row_idx in moved:
+            if row_idx == self.selected_row:
+                self._highlight_row(row_idx)
+            else:
+                self._update_row_colors(row_idx)
+
+    def _is_shown(self, table_row: "_TableRow") -> bool:
+        return 1 <= table_row.row <= len(self._rows) and self._rows[table_row.row - 1] is table_row
 
-    def _handle_header_click(self, header: Header):
-        """Handle header click events"""
-        if header.action:
+    def _rows_by_index(self) -> Dict[int, "_TableRow"]:
+        """Every created row (shown or hidden) by its data row index, removed rows left out"""
+        return {table_row.index: table_row for table_row in self._rows + self._hidden_rows if table_row.index is not None}
+
+    def sort(self, sort_spec: List[Tuple[int, bool]]):
+        """
+        Sort the table rows without touching the order of the data.
+        sort_spec: List[Tuple[int, bool]] - (column, ascending) pairs, most significant first;
+                   an empty list restores the data order
+        """
+        self._sort_spec = list(sort_spec)
+        if self.paged:
+            self.model.set_query(sort_spec=self._sort_spec)
+        for header in self.headers:
+            if header.sortable and not header.action:
+                self._header_labels[header.colNo].configure(text=self._get_header_text(header))
+        self._show_page(0)
+
+    def set_filter(self, col: int, query: str):
+        """
+        Filter the rows by column col, an empty query removes the column's filter.
+        Boolean columns take true/false. Other columns take "10..20", ">=10" or "<20" for numeric
+        ranges, "^abc" for a prefix and plain text for a case-insensitive substring.
+        """
+        self._top = 0
+        if self.paged:
+            # Filters go to the provider as the raw query text
+            self.model.set_query(filters={**self.model.filters, col: query})
+            self._show_page(0)
+            return
+        self._filter.set(col, query, self.headers[col].type in _BOOLEAN_TYPES)
+        self._show_order(self._compute_order(resort=False))
+
+    def clear_filters(self):
+        """Remove every filter and empty the filter inputs"""
+        self._filter.clear()
+        for filter_input in self._filter_inputs.values():
+            if isinstance(filter_input, ttk.Combobox):
+                filter_input.set("")
+            else:
+                filter_input.delete(0, "end")
+        if self.paged:
+            self.model.set_query(filters={})
+            self._show_page(0)
+            return
+        self._show_order(self._compute_order(resort=False))
+
+    def _compute_order(self, resort: bool = True) -> List[int]:
+        """Data row indices to show: stable sort by self._sort_spec, then the filter"""
+        if self.paged:
+            # The provider already sorted and filtered, show the rows of the current page
+            start = self._page * self.model.page_size
+            return list(range(start, min(start + self.model.page_size, len(self.model))))
+        if resort or self._sorted is None:
+            self._sorted = self.model.order_by(self._sort_spec)
+        order = self._filter.filter_order(self._sorted)
+        if self._groups is not None:
+            order, self._group_starts, self._group_keys = self._groups.arrange(order)
+        return order
+
+    def _show_order(self, order: List[int]):
+        """Show the data rows of order, keeping the selection on its data row"""
+        self._commit_editor()
+        if not self._pooled:
+            self._finish_build()
+            self._order = order
+            self._arrange_rows(self._rows_by_index())
+            return
+
+        selected_idx = None
+        if self.selected_row and self.selected_row <= len(self._order):
+            selected_idx = self._order[self.selected_row - 1]
+        self._order = order
+        if selected_idx is not None:
+            try:
+                row = order.index(selected_idx) + 1
+                self.selected_cell = (row, self.selected_cell[1]) if self.selected_cell else None
+            except ValueError:
+                row = None
+                self.selected_cell = None
+            self.selected_row = row
+        self._resize_pool()
+        self._refresh_rows()
+
+    def group_by(self, columns: Sequence[int], collapsed: bool = False):
+        """
+        Group the rows by columns under group rows showing each group's key, its row count and the
+        aggregates chosen by Header.aggregate; clicking a group row collapses or expands it. The rows
+        of a collapsed group have no widgets. An empty list removes the grouping.
+        columns: Sequence[int] - Grouped columns, most significant first
+        collapsed: bool - Start with every group collapsed (default: False)
+        """
+        if columns and (self._pooled or self._canvas is not None):
+            raise ValueError("Grouping needs a widget per row: not virtual, paged, tail or canvas rendered")
+        self.flush_cells()
+        if self._regroup_id is not None:
+            self.after_cancel(self._regroup_id)
+            self._regroup_id = None
+        if columns:
+            self._groups = GroupIndex(columns, self._aggregate_columns())
+            self._groups.rebuild(self.model)
+            if collapsed:
+                self._groups.collapsed = set(self._groups.groups)
+        else:
+            self._groups = None
+            self._group_starts, self._group_keys = [], []
+        for key in list(self._group_rows):
+            self._destroy_group_row(key)  # Columns and aggregates may differ
+        self._show_order(self._compute_order(resort=False))
+
+    def set_group_expanded(self, key: Any, expanded: bool):
+        """
+        Expand or collapse a group.
+        key: Any - Values of the grouped columns as a tuple, or the value when grouped by one column
+        expanded: bool - Show the group's rows
+        """
+        if self._groups is None:
+            raise ValueError("The table is not grouped")
+        key = key if isinstance(key, tuple) else (key,)
+        if expanded == (key not in self._groups.collapsed):
+            return
+        if expanded:
+            self._groups.collapsed.discard(key)
+        else:
+            self._groups.collapsed.add(key)
+        self._show_order(self._compute_order(resort=False))
+        self._update_group_row(key)
+
+    def toggle_group(self, key: Any):
+        """Collapse an expanded group or expand a collapsed one, key as for set_group_expanded"""
+        key = key if isinstance(key, tuple) else (key,)
+        self.set_group_expanded(key, key in self._groups.collapsed)
+
+    def group_aggregates(self, key: Any) -> Dict[int, Dict[str, Any]]:
+        """count, sum, min, max and avg of a group, by column, for the columns with a Header.aggregate"""
+        key = key if isinstance(key, tuple) else (key,)
+        group = self._groups.groups[key]
+        return {col: aggregate.as_dict() for col, aggregate in group.aggregates.items()}
+
+    def _aggregate_columns(self) -> List[int]:
+        return [col for col, header in enumerate(self.headers) if header.aggregate]
+
+    def _group_changed(self, row: int, col: int, old_value, new_value) -> bool:
+        """Update the aggregates of the group rows after a cell changed; True when the row moved to another group"""
+        keys = self._groups.update(self.model, row, col, old_value, new_value)
+        for key in keys:
+            self._update_group_row(key)
+        return len(keys) > 1
+
+    def _regroup(self):
+        self._regroup_id = None
+        self._show_order(self._compute_order(resort=False))
+
+    def _layout_groups(self):
+        """Lay out a group row above the rows of each group shown, creating the missing ones and destroying the others"""
+        shown = set(self._group_keys)
+        for key in [key for key in self._group_rows if key not in shown]:
+            self._destroy_group_row(key)
+        for position, (key, start) in enumerate(zip(self._group_keys, self._group_starts)):
+            group_row = self._group_rows.get(key)
+            if group_row is None:
+                group_row = self._create_group_row(key)
+            line = start + position + 1
+            if group_row.row != line:
+                group_row.row = line
+                for col, label in enumerate(group_row.cells):
+                    self._position(label, line, col)
+        self._laid_starts = list(self._group_starts)
+
+    def _create_group_row(self, key: Tuple) -> _GroupRow:
+        group_row = _GroupRow(key)
+        for plan in self._plans:
+            label = ttk.Label(self, style="Group.TLabel", anchor=plan.anchor, cursor="hand2")
+            label.bind("<Button-1>", lambda e, k=key: self.toggle_group(k))
+            group_row.cells.append(label)
+        self._group_rows[key] = group_row
+        self._update_group_row(key)
+        return group_row
+
+    def _destroy_group_row(self, key: Tuple):
+        for label in self._group_rows.pop(key).cells:
+            if self._layout is not None:
+                self._layout.forget(str(label))
+            label.destroy()
+
+    def _update_group_row(self, key: Tuple):
+        """Show the current row count and aggregates of a group in its group row, if it has one"""
+        group_row = self._group_rows.get(key)
+        group = self._groups.groups.get(key) if self._groups is not None else None
+        if group_row is None or group is None:
+            return  # Laid out or removed by the next _layout_groups
+        for col, label in enumerate(group_row.cells):
+            name = self.headers[col].aggregate
+            text = f"{name} {self._format_aggregate(group.aggregates[col].get(name))}" if name else ""
+            if col == 0:
+                arrow = "▸" if key in self._groups.collapsed else "▾"
+                title = f"{arrow} {' / '.join(map(str, key))} ({len(group)})"
+                text = f"{title} {text}" if text else title
+            label.configure(text=text)
+
+    def _refresh_group_rows(self):
+        for key in self._group_rows:
+            self._update_group_row(key)
+
+    @staticmethod
+    def _format_aggregate(value) -> str:
+        if value is None:
+            return ""
+        return str(round(value, 2)) if isinstance(value, float) else str(value)
+
+    @property
+    def page(self) -> int:
+        """Current page (0 based) of a paged table"""
+        return self._page
+
+    def go_to_page(self, page: int):
+        """Show page (0 based) of a paged table, clamped to the available pages"""
+        if not self.paged:
+            return
+        page = max(0, min(page, self.model.page_count - 1))
+        if page != self._page:
+            self._commit_focused_entry()
+            self._show_page(page)
+
+    def next_page(self):
+        self.go_to_page(self._page + 1)
+
+    def previous_page(self):
+        self.go_to_page(self._page - 1)
+
+    def _show_page(self, page: int):
+        """Show the rows of page, then load the neighbouring pages once idle"""
+        if not self.paged:
+            self._show_order(self._compute_order())
+            return
+        # A new page, sort or filter brings other rows, the selection does not carry over
+        self._page = page
+        self._top = 0
+        self.selected_row = None
+        self.selected_cell = None
+        self._show_order(self._compute_order())
+        self._update_page_label()
+        self.after_idle(self.model.prefetch, page)
+
+    def yview(self, *args):
+        """Scrollbar protocol for virtual mode ("moveto", fraction) or ("scroll", number, what)"""
+        if args and args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * len(self._order)))
+        elif args and args[0] == "scroll":
+            step = len(self._rows) if args[2] == "pages" else 1
+            self._scroll_to(self._top + int(args[1]) * step)
+        return self._view_fractions()
+
+    def yview_scroll(self, number: int, what: str = "units"):
+        """Scroll the virtual rows by number units (rows) or pages"""
+        self.yview("scroll", number, what)
+
+    def _scroll_to(self, top: int):
+        """Show the data rows starting at top by rebinding the pool"""
+        top = max(0, min(top, len(self._order) - len(self._rows)))
+        if self.tail is not None:
+            # Scrolling up pauses following the newest rows, scrolling back to the bottom resumes it
+            self.auto_scroll = top >= len(self._order) - len(self._rows)
+        if top == self._top:
+            return
+        self._commit_focused_entry()
+        self._top = top
+        self._refresh_rows()
+
+    def _view_fractions(self):
+        """Visible part of the data as (first, last) fractions"""
+        if not self._order:
+            return 0.0, 1.0
+        return self._top / len(self._order), (self._top + len(self._rows)) / len(self._order)
+
+    def _update_scrollbar(self):
+        if self._scrollbar is not None:
+            self._scrollbar.set(*self._view_fractions())
+
+    def _commit_focused_entry(self):
+        """Save a pooled ENTRY or the shared editor being edited before its widget is rebound to another row"""
+        self._commit_editor()
+        try:
+            focused = self.focus_get()
+        except KeyError:  # Focus is on a widget tkinter does not know about
+            return
+        table_row = getattr(focused, "table_row", None)
+        if table_row is None or focused.master is not self or not isinstance(focused, ttk.Entry):
+            return
+        col = table_row.cells.index(focused)
+        if self.headers[col].editable:
+            self._handle_entry_change(table_row.index, col, focused)
+        self.focus_set()
+
+    def _on_mouse_wheel(self, event):
+        if event.num == 5 or event.delta < 0:
+            self.yview_scroll(1, "units")
+        elif event.num == 4 or event.delta > 0:
+            self.yview_scroll(-1, "units")
+        return "break"  # Prevent the event from propagating to the parent
+
+    def destroy(self):
+        """Remove the table level bindings and pending updates before destroying the widget"""
+        if self._flush_id is not None:
+            self.after_cancel(self._flush_id)
+            self._flush_id = None
+        if self._build is not None:
+            self._build.cancel()
+            self._build = None
+        if self._regroup_id is not None:
+            self.after_cancel(self._regroup_id)
+            self._regroup_id = None
+        if self._layout is not None:
+            self._layout.cancel()
+        for sequence in self.bind_class(self._bindtag):
+            self.unbind_class(self._bindtag, sequence)
+        super().destroy()
+
+    def _handle_header_click(self, header: Header, event=None):
+        """Handle header click events, shift-click adds a sortable column to the current sort"""
+        if header.sortable and not header.action:
+            spec = list(self._sort_spec)
+            columns = [col for col, _ in spec]
+            shift = event is not None and bool(event.state & 0x0001)
+            if header.colNo in columns and (shift or columns[0] == header.colNo):
+                # Flip the direction of a column that is already sorted
+                position = columns.index(header.colNo)
+                spec[position] = (header.colNo, not spec[position][1])
+            elif shift:
+                spec.append((header.colNo, True))
+            else:
+                spec = [(header.colNo, True)]
+            self.sort(spec)
+        elif header.action:
             # Toggle ascending/descending
             if not hasattr(self, '_sort_ascending'):
                 self._sort_ascending = {}
             self._sort_ascending[header.colNo] = not self._sort_ascending.get(header.colNo, True)
+            self._header_labels[header.colNo].configure(text=self._get_header_text(header))
             header.action(self._sort_ascending[header.colNo])
 
+    def _event_cell(self, event) -> Optional[Tuple[int, int]]:
+        """(grid row, column) of the cell widget an event arrived on, None for other widgets"""
+        table_row = getattr(event.widget, "table_row", None)
+        if table_row is None or not table_row.row:
+            return None
+        return table_row.row, event.widget.table_column
+
+    def _on_cell_click(self, event):
+        cell = self._event_cell(event)
+        if cell is not None:
+            self._handle_canvas_click(*cell)
+
+    def _on_cell_double_click(self, event):
+        cell = self._event_cell(event)
+        if cell is not None:
+            self._handle_canvas_click(*cell, double=True)
+
+    def _on_cell_enter(self, event):
+        cell = self._event_cell(event)
+        if cell is not None:
+            self._hover(cell[0])
+
+    def _on_table_leave(self, event):
+        # Leave also fires when the pointer moves onto a cell, only clear the hover once it is outside the table
+        try:
+            inside = self.winfo_containing(event.x_root, event.y_root)
+        except KeyError:  # Pointer over a widget tkinter does not know about
+            inside = None
+        while inside is not None and inside is not self:
+            inside = getattr(inside, "master", None)
+        if inside is None:
+            self._hover(None)
+
+    def _hover(self, row: Optional[int]):
+        """Move the hover highlight to grid row row (1 based), None removes it"""
+        if row == self._hover_row:
+            return
+        if self._hover_row is not None and self._hover_row <= len(self._rows):
+            self._handle_row_leave(self._hover_row + self._top)
+        self._hover_row = row
+        if row is not None:
+            self._handle_row_enter(row + self._top)
+
+    def _handle_canvas_click(self, row: int, col: int, double: bool = False):
+        """Click on the cell at grid row row (1 based) and column col, from the canvas or a cell widget"""
+        if not self._plans[col].shows_text:
+            return
+        if double:
+            self._make_cell_editable(row, col)
+        else:
+            if self._hover_row == row:
+                # The selection colour replaces the hover colour
+                self._handle_row_leave(row + self._top)
+                self._hover_row = None
+            self._handle_cell_click(row, col)
+
     def _handle_cell_click(self, row: int, col: int):
         """Handle cell click for selection"""
+        # row is the grid row of the clicked cell, selection is kept in table rows
+        row += self._top
+
         # Reset previous selections
         if self.selected_row:
             self._update_row_colors(self.selected_row)
@@ -428,65 +1951,128 @@ class Table(ttk.Frame):
         self.selected_row = row
         self.selected_cell = (row, col)
         
-        # Highlight selected row
+        self._highlight_row(row)
+
+    def _highlight_row(self, row: int):
+        """Highlight a table row (1 based) if it is currently shown"""
         for c in range(len(self.headers)):
-            cell = self._cells.get((row, c))
+            cell = self._cells.get((row - self._top, c))
             if cell and hasattr(cell, 'configure') and callable(getattr(cell, 'configure')):
-                if self.headers[c].type == WidgetType.TEXT:
+                if self._plans[c].shows_text:
                     cell.configure(style="info.TLabel")
-        
-        # Extra highlight for selected cell
-        selected_cell = self._cells.get((row, col))
-        if selected_cell and hasattr(selected_cell, 'configure') and callable(getattr(selected_cell, 'configure')):
-            if self.headers[col].type == WidgetType.TEXT:
-                selected_cell.configure(style="info.TLabel")
+
+    def _edits_text(self, col: int) -> bool:
+        """Whether the column's cells show text that opens the shared editor"""
+        return self._plans[col].editable and self._plans[col].shows_text
 
     def _make_cell_editable(self, row: int, col: int):
-        """Make cell editable on double click (for TEXT type only)"""
-        if not self.headers[col].editable or self.headers[col].type != WidgetType.TEXT:
+        """Open the shared editor over the cell at grid row row (1 based) and column col"""
+        if not self._edits_text(col):
             return
             
         cell = self._cells.get((row, col))
         if not cell:
             return
-            
-        current_text = cell.cget("text")
+        self._commit_editor()
         
-        # Create entry widget
-        entry = ttk.Entry(self)
-        entry.insert(0, current_text)
-        entry.grid(row=row, column=col, padx=1, pady=1, sticky="nsew")
-        entry.focus_set()
-        
-        def save_changes(event=None):
-            new_value = entry.get()
-            self.data[row-1][col] = new_value
-            cell.configure(text=new_value)
-            entry.destroy()
+        editor = self._get_editor()
+        editor.delete(0, "end")
+        editor.insert(0, cell.cget("text"))
+        editor.select_range(0, "end")
+        self._editing = (cell.table_row.index, col, cell)
+        if self._canvas is not None:
+            self._canvas.place(editor, row, col)
+        else:
+            # Float over the cell, so the grid layout does not change
+            editor.place(in_=cell, x=0, y=0, relwidth=1, relheight=1)
+        editor.lift()
+        editor.focus_set()
+
+    def _get_editor(self) -> ttk.Entry:
+        if self._editor is None:
+            self._editor = ttk.Entry(self)
+            self._editor.bind("<Return>", lambda e: self._move_editor(1, 0))
+            self._editor.bind("<Tab>", lambda e: self._move_editor(0, 1))
+            self._editor.bind("<Shift-Tab>", lambda e: self._move_editor(0, -1))
+            self._editor.bind("<ISO_Left_Tab>", lambda e: self._move_editor(0, -1))  # Shift-Tab on X11
+            self._editor.bind("<Escape>", lambda e: self._close_editor())
+            self._editor.bind("<FocusOut>", lambda e: self._commit_editor())
+        return self._editor
+
+    def _close_editor(self):
+        """Hide the editor without saving"""
+        if self._editing is None:
+            return
+        self._editing = None
+        if self._canvas is not None:
+            self._canvas.hide(self._editor)
+        else:
+            self._editor.place_forget()
+        self.focus_set()
+
+    def _commit_editor(self) -> Optional[Tuple[int, int]]:
+        """Save the editor's value and hide it. Returns the (grid row, col) edited, None if it was closed."""
+        if self._editing is None:
+            return None
+        data_idx, col, cell = self._editing
+        new_value = self._editor.get()
+        self._close_editor()
+        # The cell may have been rebound to another row while editing
+        shown = cell.table_row.index == data_idx and cell.table_row.row > 0
+        if self._store_value(data_idx, col, new_value):
+            if shown:
+                self._set_cell_value(cell, self._plans[col], self.model.get(data_idx, col))
+                cell.table_row.values[col] = self.model.get(data_idx, col)
             
             # Trigger on_change callback if exists
-            if self.headers[col].on_change:
-                self.headers[col].on_change(self.data, row-1, col)
-        
-        entry.bind("<Return>", save_changes)
-        entry.bind("<FocusOut>", save_changes)
+            self._notify_change(data_idx, col)
+        return (cell.table_row.row, col) if shown else None
+
+    def _move_editor(self, rows: int, cols: int) -> str:
+        """Save and move the editor by rows, or by cols over the editable columns wrapping to the next row"""
+        position = self._commit_editor()
+        if position is None:
+            return "break"
+        row, col = position
+        if cols:
+            columns = [c for c in range(len(self.headers)) if self._edits_text(c)]
+            position = columns.index(col) + cols
+            rows, col = divmod(position, len(columns))
+            col = columns[col]
+        row += rows
+        if row > len(self._rows) and self._top + len(self._rows) < len(self._order):
+            self._scroll_to(self._top + 1)
+            row = len(self._rows)
+        elif row < 1 and self._top > 0:
+            self._scroll_to(self._top - 1)
+            row = 1
+        if 1 <= row <= len(self._rows):
+            self._make_cell_editable(row, col)
+        return "break"
 
     def _update_row_colors(self, row: int):
         """Reset row colors to default"""
         bg_color = self.alternate_row_color if row % 2 == 0 else self.row_color
         for col in range(len(self.headers)):
-            cell = self._cells.get((row, col))
+            cell = self._cells.get((row - self._top, col))
             if cell and hasattr(cell, 'configure') and callable(getattr(cell, 'configure')):
-                if self.headers[col].type == WidgetType.TEXT:
-                    cell.configure(style="Row.TLabel" if row % 2 == 0 else "Alt.TLabel")
+                if self._plans[col].shows_text:
+                    cell.configure(style=self._text_style(row, col, cell.table_row.index))
 
     def _update_cell_color(self, row: int, col: int):
         """Reset cell color to match its row"""
-        cell = self._cells.get((row, col))
+        cell = self._cells.get((row - self._top, col))
         if cell and hasattr(cell, 'configure') and callable(getattr(cell, 'configure')):
             bg_color = self.alternate_row_color if row % 2 == 0 else self.row_color
-            if self.headers[col].type == WidgetType.TEXT:
-                cell.configure(style="Row.TLabel" if row % 2 == 0 else "Alt.TLabel")
+            if self._plans[col].shows_text:
+                cell.configure(style=self._text_style(row, col, cell.table_row.index))
+
+    def _text_style(self, row: int, col: int, data_idx: int) -> str:
+        """Style of a text cell on table row row (1 based): the row's style, with the conditional format of the cell"""
+        base = "Row.TLabel" if row % 2 == 0 else "Alt.TLabel"
+        if self._formats is None:
+            return base
+        return self._formats.style(base, data_idx, col)
 
     def _lighten_color(self, color: str, factor: float = 1.2) -> str:
         """Lighten a hex color"""
@@ -504,12 +2090,16 @@ class Table(ttk.Frame):
         """Handle mouse enter event for row hover effect"""
         if row != self.selected_row:  # Don't apply hover to selected row
             for col in range(len(self.headers)):
-                cell = self._cells.get((row, col))
+                cell = self._cells.get((row - self._top, col))
                 if cell and hasattr(cell, 'configure'):
-                    if self.headers[col].type == WidgetType.TEXT:
+                    if self._plans[col].shows_text:
                         cell.configure(background=self.hover_color)
 
     def _handle_row_leave(self, row: int):
         """Handle mouse leave event to restore original row color"""
         if row != self.selected_row:  # Don't remove highlight from selected row
+            for col in range(len(self.headers)):
+                cell = self._cells.get((row - self._top, col))
+                if cell and self._plans[col].shows_text:
+                    cell.configure(background="")  # Back to the style's background
             self._update_row_colors(row)
\ No newline at end of file
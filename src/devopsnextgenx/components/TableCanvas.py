@@ -0,0 +1,223 @@
+import ttkbootstrap as ttk
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+
+_PADDING = 5  # Space between a column edge and its text, as the padding of Row.TLabel
+
+
+class CanvasCell:
+    """
+    A TEXT cell drawn as a text item on the table canvas. Offers the parts of the ttk.Label
+    interface Table uses (configure/cget of text, style and background, destroy). A style or a
+    background colours the whole row, which has one background; mark colours the cell alone.
+    """
+    __slots__ = ("renderer", "item", "text", "anchor", "fill", "style", "table_row", "box", "marker")
+
+    def __init__(self, renderer: "TableCanvas", text: str, anchor: str = "w", fill: Optional[str] = None, style: str = ""):
+        self.renderer = renderer
+        self.item = None  # Created when the cell is first placed
+        self.text = text
+        self.anchor = anchor
+        self.fill = fill
+        self.style = style
+        self.table_row = None
+        self.box = None  # (left, top, right, bottom) where the cell was last placed
+        self.marker = None  # Rectangle filling the box, see mark
+
+    def configure(self, **kwargs):
+        if "text" in kwargs:
+            self.text = kwargs["text"]
+            if self.item is not None:
+                self.renderer.canvas.itemconfigure(self.item, text=self.text)
+        if "style" in kwargs:
+            self.style = kwargs["style"]
+            self.renderer.paint_row(self.table_row.row, self.renderer.style_color(self.style))
+        if kwargs.get("background"):
+            self.renderer.paint_row(self.table_row.row, kwargs["background"])
+
+    config = configure
+
+    def mark(self, color: Optional[str]):
+        """Fill the cell's box with color over the row background, None removes the fill"""
+        self.renderer.mark(self, color)
+
+    def cget(self, key: str) -> Any:
+        return {"text": self.text, "style": self.style, "anchor": self.anchor}.get(key, "")
+
+    def destroy(self):
+        self.mark(None)
+        if self.item is not None:
+            self.renderer.canvas.delete(self.item)
+            self.item = None
+
+
+class TableCanvas:
+    """
+    Draws the data rows of a Table on one Canvas: TEXT cells as text items and one background
+    rectangle per row, which carries the alternating row colours and the selection. Interactive
+    cells stay real widgets, shown as canvas windows. Columns line up with the header labels.
+    table: Table - The table whose rows are drawn
+    row_height: int - Height of a row in pixels
+    """
+    def __init__(self, table, row_height: int):
+        self.table = table
+        self.row_height = row_height
+        self.canvas = ttk.Canvas(table, highlightthickness=0, borderwidth=0)
+        self._edges: List[int] = []  # x of each column's left edge, then the right end of the last column
+        self._backgrounds: Dict[int, int] = {}  # row_idx -> background rectangle item
+        self._colors: Dict[int, str] = {}  # row_idx -> current background colour
+        self._windows: Dict[str, int] = {}  # widget path -> canvas window item
+        self._row_count = 0
+        self._style = ttk.Style()
+        self.canvas.bind("<Configure>", lambda e: self.relayout())
+        self.canvas.bind("<Button-1>", lambda e: self._on_click(e, False))
+        self.canvas.bind("<Double-Button-1>", lambda e: self._on_click(e, True))
+        self.canvas.bind("<Motion>", self._on_motion)
+        self.canvas.bind("<Leave>", lambda e: self.table._hover(None))
+
+    def color(self, name: Optional[str]) -> Optional[str]:
+        """Hex colour of a theme colour name (primary, dark, ...), other names are passed through"""
+        if name is None:
+            return None
+        colors = getattr(self._style, "colors", None)
+        value = colors.get(name) if colors is not None else None
+        return value or name
+
+    def style_color(self, style: str) -> Optional[str]:
+        """Row background colour for the label style Table gives a row"""
+        match style:
+            case "Row.TLabel":
+                return self.color(self.table.alternate_row_color)
+            case "Alt.TLabel":
+                return self.color(self.table.row_color)
+            case _:
+                return self.color(style.split(".")[0])
+
+    def text_color(self, header) -> Optional[str]:
+        if header.text_color is not None:
+            return self.color(header.text_color)
+        colors = getattr(self._style, "colors", None)
+        return getattr(colors, "fg", None)
+
+    def column_edges(self) -> List[int]:
+        """Column edges on the canvas, see Table._column_edges"""
+        self._edges = self.table._column_edges(self.canvas)
+        return self._edges
+
+    def cell_at(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        """(row_idx, col) under canvas window coordinates x, y, None outside the rows"""
+        edges = self._edges or self.column_edges()
+        row_idx = int(self.canvas.canvasy(y) // self.row_height) + 1
+        col = bisect_right(edges, self.canvas.canvasx(x)) - 1
+        if not 1 <= row_idx <= self._row_count or not 0 <= col < len(edges) - 1:
+            return None
+        return row_idx, col
+
+    def _on_click(self, event, double: bool):
+        cell = self.cell_at(event.x, event.y)
+        if cell is not None:
+            self.table._handle_canvas_click(*cell, double)
+
+    def _on_motion(self, event):
+        cell = self.cell_at(event.x, event.y)
+        self.table._hover(cell[0] if cell is not None else None)
+
+    def _cell_box(self, row_idx: int, col: int) -> Tuple[int, int, int, int]:
+        edges = self._edges or self.column_edges()
+        top = (row_idx - 1) * self.row_height
+        return edges[col], top, edges[col + 1], top + self.row_height
+
+    def place(self, cell, row_idx: int, col: int):
+        """Show a CanvasCell or a widget in the cell at grid row row_idx (1 based) and column col"""
+        self._ensure_background(row_idx)
+        left, top, right, bottom = self._cell_box(row_idx, col)
+        if isinstance(cell, CanvasCell):
+            x = {"w": left + _PADDING, "e": right - _PADDING}.get(cell.anchor, (left + right) // 2)
+            y = (top + bottom) // 2
+            cell.box = (left, top, right, bottom)
+            if cell.item is None:
+                cell.item = self.canvas.create_text(
+                    x, y, text=cell.text, anchor=cell.anchor, fill=cell.fill, font="TkDefaultFont", tags=("cell",))
+            else:
+                self.canvas.coords(cell.item, x, y)
+                self.canvas.itemconfigure(cell.item, state="normal")
+            if cell.marker is not None:
+                self.canvas.coords(cell.marker, *cell.box)
+                self.canvas.itemconfigure(cell.marker, state="normal")
+            return
+        item = self._windows.get(str(cell))
+        if item is None:
+            item = self._windows[str(cell)] = self.canvas.create_window(
+                left + 1, top + 1, anchor="nw", window=cell, width=right - left - 2, height=bottom - top - 2)
+            tags = cell.bindtags()
+            if self.table._bindtag not in tags:
+                # The table's bindtag calls forget when the widget is destroyed
+                cell.bindtags((tags[0], self.table._bindtag) + tuple(tags[1:]))
+        else:
+            self.canvas.coords(item, left + 1, top + 1)
+            self.canvas.itemconfigure(item, state="normal", width=right - left - 2, height=bottom - top - 2)
+
+    def hide(self, cell):
+        """Hide a placed cell without deleting it, see place"""
+        item = cell.item if isinstance(cell, CanvasCell) else self._windows.get(str(cell))
+        if item is not None:
+            self.canvas.itemconfigure(item, state="hidden")
+        if isinstance(cell, CanvasCell) and cell.marker is not None:
+            self.canvas.itemconfigure(cell.marker, state="hidden")
+
+    def forget(self, path: str):
+        """Delete the canvas window of a destroyed widget"""
+        item = self._windows.pop(path, None)
+        if item is not None:
+            self.canvas.delete(item)
+
+    def _ensure_background(self, row_idx: int):
+        if row_idx in self._backgrounds:
+            return
+        edges = self._edges or self.column_edges()
+        top = (row_idx - 1) * self.row_height
+        color = self.style_color("Row.TLabel" if row_idx % 2 == 0 else "Alt.TLabel")
+        self._backgrounds[row_idx] = self.canvas.create_rectangle(
+            edges[0], top, edges[-1], top + self.row_height, fill=color, width=0, tags=("background",))
+        self._colors[row_idx] = color
+        self.canvas.tag_lower(self._backgrounds[row_idx])  # Under the cells, not restacking the other rows
+
+    def paint_row(self, row_idx: int, color: Optional[str]):
+        """Fill the background of grid row row_idx, once per colour change"""
+        item = self._backgrounds.get(row_idx)
+        if item is not None and self._colors.get(row_idx) != color:
+            self.canvas.itemconfigure(item, fill=color)
+            self._colors[row_idx] = color
+
+    def mark(self, cell: CanvasCell, color: Optional[str]):
+        """Fill the box of a placed CanvasCell, just under its text; None deletes the fill"""
+        if color is None:
+            if cell.marker is not None:
+                self.canvas.delete(cell.marker)
+                cell.marker = None
+        elif cell.marker is not None:
+            self.canvas.itemconfigure(cell.marker, fill=color)
+        elif cell.item is not None:
+            cell.marker = self.canvas.create_rectangle(*cell.box, fill=color, width=0, tags=("marker",))
+            self.canvas.tag_lower(cell.marker, cell.item)
+
+    def set_row_count(self, count: int):
+        """Drop the backgrounds of rows past count and size the canvas to count rows"""
+        for row_idx in [row_idx for row_idx in self._backgrounds if row_idx > count]:
+            self.canvas.delete(self._backgrounds.pop(row_idx))
+            self._colors.pop(row_idx, None)
+        if count != self._row_count:
+            self._row_count = count
+            self.canvas.configure(height=count * self.row_height)
+
+    def relayout(self):
+        """Move every item to the current column edges, after the table was resized"""
+        edges = self._edges
+        if edges == self.column_edges():
+            return
+        for row_idx, item in self._backgrounds.items():
+            top = (row_idx - 1) * self.row_height
+            self.canvas.coords(item, self._edges[0], top, self._edges[-1], top + self.row_height)
+        for table_row in self.table._rows:
+            for col, cell in enumerate(table_row.cells):
+                self.place(cell, table_row.row, col)
@@ -0,0 +1,103 @@
+from typing import List, Any, Optional, Iterable, Sequence, Tuple, Dict, Set, Callable
+from devopsnextgenx.components.TableModel import TableModel
+
+
+class _RecordingRow:
+    """The values of a row as a computed column sees them, recording the columns it reads"""
+    __slots__ = ("_values", "_names", "read")
+
+    def __init__(self, values: List[Any], names: Dict[str, int]):
+        self._values = values
+        self._names = names
+        self.read: Set[int] = set()
+
+    def __getitem__(self, col):
+        if isinstance(col, str):
+            col = self._names[col]
+        self.read.add(col)
+        return self._values[col]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+class ComputedColumns:
+    """
+    The computed columns of a table (see Header.compute) and the source columns they depend on.
+    The columns a compute function reads are recorded whenever it runs, so a change to a cell
+    recomputes only the computed cells of its row that read it, directly or through another computed
+    column. Results are stored in the model's cells, which memoize them per row until a source changes.
+    A computed column may read computed columns to its left.
+    functions: Dict[int, Callable] - compute(row) by computed column
+    names: Dict[str, int] - Column index by header text, for row["text"] reads
+    """
+    def __init__(self, functions: Dict[int, Callable[[Any], Any]], names: Dict[str, int]):
+        self.functions = dict(sorted(functions.items()))  # Evaluated in column order
+        self.names = names
+        self.sources: Dict[int, Set[int]] = {col: set() for col in self.functions}  # Computed column -> columns read
+        self._affected: Dict[int, List[int]] = {}  # Source column -> computed columns to recompute, cached
+
+    def _evaluate(self, col: int, values: List[Any]) -> Any:
+        row = _RecordingRow(values, self.names)
+        try:
+            return self.functions[col](row)
+        except (TypeError, ValueError, ArithmeticError):
+            return None  # Sources that do not compute, like an empty quantity
+        finally:
+            if not row.read <= self.sources[col]:
+                self.sources[col] |= row.read
+                self._affected.clear()
+
+    def affected(self, col: int) -> List[int]:
+        """Computed columns to recompute when col changes, in column order"""
+        affected = self._affected.get(col)
+        if affected is None:
+            changed = {col}
+            affected = []
+            for computed, sources in self.sources.items():
+                if sources & changed:
+                    affected.append(computed)
+                    changed.add(computed)
+            self._affected[col] = affected
+        return affected
+
+    def fill(self, model: TableModel, rows: Iterable[int]):
+        """Compute every computed cell of rows, e.g. new rows"""
+        for row in rows:
+            self._recompute(model, row, self.functions)
+
+    def update(self, model: TableModel, row: int, columns: Optional[Iterable[int]] = None) -> Dict[Tuple[int, int], Tuple[Any, Any]]:
+        """
+        Recompute the computed cells of a row that depend on columns (every computed cell when None).
+        Returns the cells whose value changed, (row, col) -> (old value, new value).
+        """
+        if columns is None:
+            computed = self.functions
+        else:
+            computed = sorted({col for source in columns for col in self.affected(source)})
+        return self._recompute(model, row, computed) if computed else {}
+
+    def update_column(self, model: TableModel, col: int) -> Dict[Tuple[int, int], Tuple[Any, Any]]:
+        """Recompute the cells depending on col in every row, after the whole column was rewritten"""
+        changes = {}
+        computed = self.affected(col)
+        if computed:
+            for row in range(len(model)):
+                changes.update(self._recompute(model, row, computed))
+        return changes
+
+    def _recompute(self, model: TableModel, row: int, computed: Sequence[int]) -> Dict[Tuple[int, int], Tuple[Any, Any]]:
+        values = model.row(row)
+        changes = {}
+        for col in computed:
+            old_value = values[col]
+            new_value = self._evaluate(col, values)
+            if new_value == old_value and type(new_value) is type(old_value):
+                continue
+            try:
+                new_value = model.set(row, col, new_value)
+            except (TypeError, ValueError):
+                continue  # The model keeps its value
+            values[col] = new_value  # Read by the computed columns to its right
+            changes[(row, col)] = (old_value, new_value)
+        return changes
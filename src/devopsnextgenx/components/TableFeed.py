@@ -0,0 +1,246 @@
+import queue
+from time import monotonic
+from tkinter import TclError
+from typing import List, Any, Optional, Iterable, Tuple, Dict, Union
+from devopsnextgenx.components.TableCanvas import CanvasCell
+from devopsnextgenx.utils.styleRegistry import style_registry
+
+FLASH_LEVELS = 6  # Steps a flash fades in, each one style shared by every cell on it
+
+
+class CellFlash:
+    """
+    Highlights changed cells of a Table with a colour that fades back to the cell's colour, its row
+    colour or the background of its conditional format. The flashes have no timer of their own: tick
+    advances all of them, and a cell is restyled only when it reaches the next of FLASH_LEVELS steps.
+    The styles of the steps are interned, so any number of flashing cells share FLASH_LEVELS styles
+    per cell style. Only cells showing text flash; a flash follows its data row when the row is
+    scrolled, sorted or filtered out of view.
+    table: Table - The table whose cells flash
+    color: str - Colour at the start of a flash (default: #ffb300)
+    duration_ms: int - Time a flash takes to fade out, in milliseconds (default: 800)
+    """
+    def __init__(self, table, color: str = "#ffb300", duration_ms: int = 800):
+        self.table = table
+        self.color = color
+        self.duration = duration_ms / 1000
+        self._flashing: Dict[Tuple[int, int], List[Any]] = {}  # (data row, col) -> [start, level, widget shown]
+        self._steps: Dict[str, List[str]] = {}  # Cell style -> background colour of each level
+
+    def __len__(self) -> int:
+        return len(self._flashing)
+
+    def flash(self, cells: Iterable[Tuple[int, int]], now: Optional[float] = None):
+        """Start (or restart) the flash of cells, given as (data row, col)"""
+        now = monotonic() if now is None else now
+        plans = self.table._plans
+        for row, col in cells:
+            if not plans[col].shows_text:
+                continue
+            entry = self._flashing.get((row, col))
+            if entry is None:
+                self._flashing[(row, col)] = [now, -1, None]
+            else:
+                entry[0], entry[1] = now, -1
+
+    def tick(self, now: Optional[float] = None):
+        """Move every flash to its current step, ending those that faded out"""
+        if not self._flashing:
+            return
+        now = monotonic() if now is None else now
+        shown = self.table._shown_rows()
+        paint = []
+        for cell, entry in list(self._flashing.items()):
+            start, level, widget = entry
+            table_row = shown.get(cell[0])
+            current = table_row.cells[cell[1]] if table_row is not None else None
+            if widget is not None and widget is not current:
+                self._reset(widget, cell[1])  # Rebound to another data row, which may paint it below
+            new_level = int((now - start) / self.duration * FLASH_LEVELS) if self.duration > 0 else FLASH_LEVELS
+            if new_level >= FLASH_LEVELS:
+                if current is not None:
+                    self._reset(current, cell[1])
+                del self._flashing[cell]
+                continue
+            if current is not None and (new_level != level or current is not widget):
+                paint.append((current, cell[1], new_level))
+            entry[1], entry[2] = new_level, current
+        for widget, col, level in paint:
+            self._paint(widget, col, level)
+
+    def clear(self):
+        """End every flash now"""
+        for (_, col), (_, _, widget) in self._flashing.items():
+            if widget is not None:
+                self._reset(widget, col)
+        self._flashing.clear()
+
+    def _cell_style(self, widget, col: int) -> str:
+        """Style of a cell when it does not flash, as Table._update_cell_color gives it"""
+        return self.table._text_style(widget.table_row.row + self.table._top, col, widget.table_row.index)
+
+    def _level_color(self, base: str, level: int) -> str:
+        steps = self._steps.get(base)
+        if steps is None:
+            background = style_registry.style.lookup(base, "background") or "#000000"
+            start = [value // 257 for value in self.table.winfo_rgb(self.color)]
+            end = [value // 257 for value in self.table.winfo_rgb(background)]
+            steps = self._steps[base] = []
+            for step in range(FLASH_LEVELS):
+                weight = step / FLASH_LEVELS
+                steps.append("#%02x%02x%02x" % tuple(round(a + (b - a) * weight) for a, b in zip(start, end)))
+        return steps[level]
+
+    def _paint(self, widget, col: int, level: int):
+        base = self._cell_style(widget, col)
+        color = self._level_color(base, level)
+        try:
+            if isinstance(widget, CanvasCell):
+                widget.mark(color)  # Over the row background the canvas draws
+            else:
+                widget.configure(style=style_registry.intern(base, background=color))
+        except TclError:
+            pass  # Destroyed with its row
+
+    def _reset(self, widget, col: int):
+        """Give a cell its style again"""
+        if isinstance(widget, CanvasCell):
+            widget.mark(None)
+        if not widget.table_row.row:
+            return  # Not shown, restyled when it is shown again
+        row = widget.table_row.row + self.table._top
+        try:
+            widget.configure(style="info.TLabel" if row == self.table.selected_row else self._cell_style(widget, col))
+        except TclError:
+            pass
+
+
+class LiveFeed:
+    """
+    Binds a Table to a ticking source of (row key, column, value) updates. The source is read on a
+    single timer at most max_fps times a second: the updates that arrived since the last frame are
+    coalesced, the last value of a cell wins, and applied in one set_cells pass. The cells whose value
+    changed flash (see CellFlash), the flashes fading on the same timer.
+    Row keys are matched with table.row_key, or are data row indices when the table has none; updates
+    of unknown rows are dropped and counted in dropped.
+    table: Table - Table the updates are applied to
+    source: Union[queue.Queue, Iterable] - A queue filled by other threads, read without blocking, or an iterable
+            read on the UI thread; an iterator yields None when it has nothing more for now, and the feed stops
+            when it is exhausted
+    max_fps: int - Frames per second at most (default: 30)
+    max_updates: int - Updates read per frame at most, the rest wait for the next frame (default: 10000)
+    flash_ms: int - Duration of the change flash in milliseconds, 0 for none (default: 800)
+    flash_color: str - Colour at the start of the change flash (default: #ffb300)
+    """
+    def __init__(
+        self,
+        table,
+        source: Union[queue.Queue, Iterable[Optional[Tuple[Any, int, Any]]]],
+        max_fps: int = 30,
+        max_updates: int = 10000,
+        flash_ms: int = 800,
+        flash_color: str = "#ffb300"
+    ):
+        self.table = table
+        self._queue = source if hasattr(source, "get_nowait") else None
+        self._iterator = iter(source) if self._queue is None else None
+        self.interval_ms = max(1, round(1000 / max_fps))
+        self.max_updates = max_updates
+        self.flash = CellFlash(table, flash_color, flash_ms) if flash_ms else None
+        self.dropped = 0  # Updates of rows not found
+        self._rows: Dict[Any, int] = {}  # Row key -> data row, checked on use and rebuilt when stale
+        self._after_id = None
+
+    @property
+    def running(self) -> bool:
+        return self._after_id is not None
+
+    def start(self):
+        """Start reading the source"""
+        if self._after_id is None:
+            self._after_id = self.table.after(0, self._tick)
+
+    def stop(self):
+        """Stop reading the source, ending the flashes"""
+        if self._after_id is not None:
+            self.table.after_cancel(self._after_id)
+            self._after_id = None
+        if self.flash is not None and self.table.winfo_exists():
+            self.flash.clear()
+
+    def _tick(self):
+        self._after_id = None
+        if not self.table.winfo_exists():
+            return
+        try:
+            self.poll()
+        finally:
+            # An exhausted iterator keeps the timer until the last flash faded
+            done = self._queue is None and self._iterator is None and not (self.flash and len(self.flash))
+            if self.table.winfo_exists() and not done:
+                self._after_id = self.table.after(self.interval_ms, self._tick)
+
+    def read(self) -> List[Tuple[Any, int, Any]]:
+        """The updates waiting in the source, at most max_updates"""
+        updates = []
+        if self._queue is not None:
+            while len(updates) < self.max_updates:
+                try:
+                    updates.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+        elif self._iterator is not None:
+            while len(updates) < self.max_updates:
+                try:
+                    update = next(self._iterator)
+                except StopIteration:
+                    self._iterator = None
+                    break
+                if update is None:
+                    break  # Nothing more for this frame
+                updates.append(update)
+        return updates
+
+    def poll(self, now: Optional[float] = None) -> int:
+        """Apply the updates waiting in the source and advance the flashes, returns the number of cells updated"""
+        now = monotonic() if now is None else now
+        latest = {}
+        for key, col, value in self.read():
+            latest[(key, col)] = value
+        updates = self._resolve(latest)
+        if updates:
+            model = self.table.model
+            old_values = {cell: model.get(*cell) for cell in updates}
+            self.table.set_cells(updates)
+            self.table.flush_cells()
+            if self.flash is not None:
+                self.flash.flash([cell for cell, old_value in old_values.items() if model.get(*cell) != old_value], now)
+        if self.flash is not None:
+            self.flash.tick(now)
+        return len(updates)
+
+    def _resolve(self, latest: Dict[Tuple[Any, int], Any]) -> Dict[Tuple[int, int], Any]:
+        """Updates by (data row, col) from updates by (row key, col)"""
+        model = self.table.model
+        size = len(model)
+        row_key = self.table.row_key
+        rows = {}
+        rebuilt = False
+        for key in {key for key, _ in latest}:
+            if row_key is None:
+                rows[key] = key if isinstance(key, int) and 0 <= key < size else None
+                continue
+            row = self._rows.get(key)
+            if (row is None or row >= size or row_key(model.row(row)) != key) and not rebuilt:
+                # Rows were added, removed or moved since the index was built
+                self._rows = {row_key(row_data): row for row, row_data in enumerate(model.rows())}
+                rebuilt = True
+                row = self._rows.get(key)
+            rows[key] = row
+        updates = {}
+        for (key, col), value in latest.items():
+            if rows[key] is None:
+                self.dropped += 1
+            else:
+                updates[(rows[key], col)] = value
+        return updates
@@ -0,0 +1,300 @@
+import re
+from bisect import bisect_left, bisect_right, insort
+from typing import List, Any, Optional, Sequence, Tuple, Dict, Set, Iterable
+from devopsnextgenx.components.TableModel import TableModel, to_bool, np
+
+_NUMBER = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+_RANGE = re.compile(rf"^\s*({_NUMBER})?\s*\.\.\s*({_NUMBER})?\s*$")
+_COMPARISON = re.compile(rf"^\s*(>=|<=|>|<|=)\s*({_NUMBER})\s*$")
+
+
+def parse_query(text: str, boolean: bool = False) -> Optional[Tuple[str, Any]]:
+    """
+    Turn the text of a filter input into (kind, value), None for an empty filter.
+    - boolean columns: "true"/"yes"/"1" or anything else for False -> ("bool", bool)
+    - "10..20", "10..", "..20", ">=10", "<20", "=15" -> ("range", (low, high, low_open, high_open))
+    - "^abc" -> ("prefix", "abc"), case-insensitive
+    - anything else -> ("substring", text), case-insensitive
+    """
+    if not text.strip():
+        return None
+    if boolean:
+        return ("bool", to_bool(text.strip()))
+    match = _RANGE.match(text)
+    if match and (match.group(1) or match.group(2)):
+        low, high = match.groups()
+        return ("range", (float(low) if low else None, float(high) if high else None, False, False))
+    match = _COMPARISON.match(text)
+    if match:
+        op, number = match.group(1), float(match.group(2))
+        return ("range", {
+            ">=": (number, None, False, False),
+            ">": (number, None, True, False),
+            "<=": (None, number, False, False),
+            "<": (None, number, False, True),
+            "=": (number, number, False, False),
+        }[op])
+    if text.startswith("^") and len(text) > 1:
+        return ("prefix", text[1:].casefold())
+    return ("substring", text.casefold())
+
+
+def _number(value) -> Optional[float]:
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return value if value == value else None  # NaN is in no range
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if number == number else None
+
+
+def _text(value) -> str:
+    return ("" if value is None else str(value)).casefold()
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _move(keys: List[Any], rows: List[int], old, new, row: int):
+    """Move row from key old to key new in a sorted index, ordered by key then row; None keys are not indexed"""
+    if old is not None:
+        at = bisect_left(rows, row, bisect_left(keys, old), bisect_right(keys, old))
+        del keys[at], rows[at]
+    if new is not None:
+        at = bisect_left(rows, row, bisect_left(keys, new), bisect_right(keys, new))
+        keys.insert(at, new)
+        rows.insert(at, row)
+
+
+class ColumnIndex:
+    """
+    Search indexes of one column. Each index is built on first use and then answers queries
+    without scanning the column: a sorted text index for prefixes, a trigram index for
+    substrings and a sorted value index for numeric ranges. An edited value updates the indexes
+    built so far in place, see update.
+    values: Sequence[Any] - The column values, indexed by data row
+    """
+    def __init__(self, values: Sequence[Any]):
+        self.values = values
+        self.text = [_text(value) for value in values]
+        self._sorted_text = None  # (keys, rows) ordered by text, then row
+        self._sorted_numbers = None  # (keys, rows) ordered by numeric value, then row
+        self._numbers = None  # Numeric value of each row, None for the rows out of _sorted_numbers
+        self._trigrams = None  # trigram -> rows containing it, in order
+
+    def prefix(self, prefix: str) -> List[int]:
+        if self._sorted_text is None:
+            order = sorted(range(len(self.text)), key=self.text.__getitem__)
+            self._sorted_text = ([self.text[row] for row in order], order)
+        keys, rows = self._sorted_text
+        return rows[bisect_left(keys, prefix):bisect_left(keys, prefix + "\U0010ffff")]
+
+    def substring(self, query: str) -> List[int]:
+        if len(query) < 3:
+            return [row for row, text in enumerate(self.text) if query in text]
+        if self._trigrams is None:
+            self._trigrams = {}
+            for row, text in enumerate(self.text):
+                for gram in _trigrams(text):
+                    self._trigrams.setdefault(gram, []).append(row)
+        postings = [self._trigrams.get(query[i:i + 3], ()) for i in range(len(query) - 2)]
+        # Verify the candidates of the rarest trigram instead of intersecting every list
+        candidates = min(postings, key=len)
+        return [row for row in candidates if query in self.text[row]]
+
+    def range(self, low=None, high=None, low_open=False, high_open=False) -> List[int]:
+        if self._sorted_numbers is None:
+            self._index_numbers()
+        keys, rows = self._sorted_numbers
+        start = 0 if low is None else (bisect_right if low_open else bisect_left)(keys, low)
+        end = len(keys) if high is None else (bisect_left if high_open else bisect_right)(keys, high)
+        return rows[start:end]
+
+    def _index_numbers(self):
+        values = self.values
+        if np is not None and isinstance(values, np.ndarray) and values.dtype.kind in "iuf":
+            # A NumPy column sorts as an array, NaN last
+            order = np.argsort(values, kind="stable")
+            self._numbers = values.tolist()
+            count = len(order) - int(np.isnan(values).sum()) if values.dtype.kind == "f" else len(order)
+            if count < len(order):
+                self._numbers = [None if number != number else number for number in self._numbers]
+            order = order[:count]
+            self._sorted_numbers = (values[order].tolist(), order.tolist())
+            return
+        self._numbers = [_number(value) for value in values]
+        order = sorted((row for row, number in enumerate(self._numbers) if number is not None), key=self._numbers.__getitem__)
+        self._sorted_numbers = ([self._numbers[row] for row in order], order)
+
+    def update(self, row: int, value):
+        """Follow the edit of the value of data row row"""
+        if isinstance(self.values, list):
+            self.values[row] = value  # A copy of the column, a column store is already updated
+        old, text = self.text[row], _text(value)
+        if old != text:
+            self.text[row] = text
+            if self._sorted_text is not None:
+                _move(*self._sorted_text, old, text, row)
+            if self._trigrams is not None:
+                old_grams, new_grams = _trigrams(old), _trigrams(text)
+                for gram in old_grams - new_grams:
+                    rows = self._trigrams[gram]
+                    del rows[bisect_left(rows, row)]
+                for gram in new_grams - old_grams:
+                    insort(self._trigrams.setdefault(gram, []), row)
+        if self._numbers is not None:
+            old, number = self._numbers[row], _number(value)
+            if old != number:
+                self._numbers[row] = number
+                _move(*self._sorted_numbers, old, number, row)
+
+    def boolean(self, value: bool) -> List[int]:
+        return [row for row, cell in enumerate(self.values) if to_bool(cell) == value]
+
+    def matches(self, row: int, kind: str, value) -> bool:
+        """Check a single row, used to narrow a previous result"""
+        if kind == "substring":
+            return value in self.text[row]
+        if kind == "prefix":
+            return self.text[row].startswith(value)
+        if kind == "bool":
+            return to_bool(self.values[row]) == value
+        number = _number(self.values[row])
+        low, high, low_open, high_open = value
+        return number is not None and \
+            (low is None or number > low or (number == low and not low_open)) and \
+            (high is None or number < high or (number == high and not high_open))
+
+    def lookup(self, kind: str, value) -> List[int]:
+        if kind == "substring":
+            return self.substring(value)
+        if kind == "prefix":
+            return self.prefix(value)
+        if kind == "bool":
+            return self.boolean(value)
+        return self.range(*value)
+
+
+class TableFilter:
+    """
+    Per-column filters over a TableModel. When a query refines the previous query of the same
+    column (a longer substring or prefix, as happens while typing) only the previous result rows
+    are checked again; otherwise the column index answers the query. Edited cells update the
+    indexes and are checked again one by one (see update).
+    model: TableModel - The data to filter
+    """
+    def __init__(self, model: TableModel):
+        self.model = model
+        self._indexes: Dict[int, ColumnIndex] = {}
+        self._queries: Dict[int, Tuple[str, Any]] = {}
+        self._results: Dict[int, Set[int]] = {}
+        self._texts: Dict[int, Tuple[str, bool]] = {}
+        self._rows: Optional[Set[int]] = None
+
+    @property
+    def active(self) -> bool:
+        return bool(self._queries)
+
+    @property
+    def columns(self) -> Set[int]:
+        """Columns with a filter"""
+        return set(self._queries)
+
+    def _index(self, col: int) -> ColumnIndex:
+        index = self._indexes.get(col)
+        if index is None:
+            index = self._indexes[col] = ColumnIndex(self.model.column(col))
+        return index
+
+    def set(self, col: int, text: str, boolean: bool = False):
+        """Filter column col with the text of its filter input, see parse_query"""
+        self._texts[col] = (text, boolean)
+        query = parse_query(text, boolean)
+        previous = self._queries.get(col)
+        if query == previous:
+            return
+        self._rows = None
+        if query is None:
+            self._queries.pop(col, None)
+            self._results.pop(col, None)
+            self._texts.pop(col, None)
+            return
+
+        kind, value = query
+        index = self._index(col)
+        if previous is not None and previous[0] == kind and (
+                (kind == "substring" and previous[1] in value) or
+                (kind == "prefix" and value.startswith(previous[1]))):
+            result = {row for row in self._results[col] if index.matches(row, kind, value)}
+        else:
+            result = set(index.lookup(kind, value))
+        self._queries[col] = query
+        self._results[col] = result
+
+    def clear(self):
+        """Remove every filter"""
+        self._queries.clear()
+        self._results.clear()
+        self._texts.clear()
+        self._rows = None
+
+    def update(self, cells: Iterable[Tuple[int, int]]):
+        """Follow edited cells, given as (data row, col): their indexes are updated and the rows filtered again"""
+        for row, col in cells:
+            index = self._indexes.get(col)
+            if index is None:
+                continue
+            index.update(row, self.model.get(row, col))
+            query = self._queries.get(col)
+            if query is None:
+                continue
+            matched = index.matches(row, *query)
+            if matched:
+                self._results[col].add(row)
+            else:
+                self._results[col].discard(row)
+            if self._rows is not None:
+                if matched and all(row in result for result in self._results.values()):
+                    self._rows.add(row)
+                else:
+                    self._rows.discard(row)
+
+    def invalidate(self, col: int):
+        """Forget the index of a rewritten column and rerun its filter"""
+        self._indexes.pop(col, None)
+        if col in self._queries:
+            text, boolean = self._texts[col]
+            self._queries.pop(col)
+            self.set(col, text, boolean)
+
+    def set_model(self, model: TableModel):
+        """Switch to new data, keeping the current filters"""
+        texts = dict(self._texts)
+        self.model = model
+        self._indexes.clear()
+        self.clear()
+        for col, (text, boolean) in texts.items():
+            self.set(col, text, boolean)
+
+    def rows(self) -> Optional[Set[int]]:
+        """Data rows matching every filter, None when nothing is filtered"""
+        if not self._queries:
+            return None
+        if self._rows is None:
+            results = sorted(self._results.values(), key=len)
+            rows = set(results[0])
+            for result in results[1:]:
+                rows.intersection_update(result)
+            self._rows = rows
+        return self._rows
+
+    def filter_order(self, order: List[int]) -> List[int]:
+        """Keep the rows of order that match, in order"""
+        rows = self.rows()
+        if rows is None:
+            return order
+        return [row for row in order if row in rows]
@@ -0,0 +1,226 @@
+import operator
+import re
+from abc import ABC, abstractmethod
+from typing import List, Any, Optional, Iterable, Sequence, Tuple, Dict, Set
+from devopsnextgenx.components.TableModel import TableModel, np
+from devopsnextgenx.utils.styleRegistry import style_registry
+
+_OPERATORS = {">": operator.gt, ">=": operator.ge, "<": operator.lt, "<=": operator.le, "==": operator.eq, "!=": operator.ne}
+
+Options = Tuple[Tuple[str, Any], ...]  # Style options of a formatted cell, frozen to be shared and interned
+
+
+def _number(value) -> Optional[float]:
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return value if value == value else None  # NaN compares with nothing
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _numeric_array(values: Sequence[Any]) -> bool:
+    """Whether values is a NumPy array of numbers, evaluated with array operations"""
+    return np is not None and isinstance(values, np.ndarray) and values.dtype.kind in "iuf"
+
+
+def _freeze(options: Dict[str, Any]) -> Optional[Options]:
+    return tuple(sorted(options.items())) if options else None
+
+
+def _hex(color: str) -> Tuple[int, int, int]:
+    color = color.lstrip("#")
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+class Rule(ABC):
+    """A conditional format of a column: evaluate gives the style options of every value of a batch"""
+    @abstractmethod
+    def evaluate(self, values: Sequence[Any]) -> List[Optional[Options]]:
+        """Options by value, None for the values the rule leaves alone"""
+
+
+class Threshold(Rule):
+    """
+    Style the cells whose numeric value compares true with a threshold.
+    op: str - One of > >= < <= == !=
+    value: float - The threshold
+    options: Style options of the matching cells, e.g. foreground="#ef5350" or background="#1b5e20"
+    """
+    def __init__(self, op: str, value: float, **options):
+        if op not in _OPERATORS:
+            raise ValueError(f"Unknown operator: {op}")
+        self.compare = _OPERATORS[op]
+        self.value = value
+        self.options = _freeze(options)
+
+    def evaluate(self, values: Sequence[Any]) -> List[Optional[Options]]:
+        options = self.options
+        if _numeric_array(values):
+            with np.errstate(invalid="ignore"):
+                matches = self.compare(values, self.value)
+            return [options if match else None for match in matches.tolist()]
+        compare, threshold = self.compare, self.value
+        return [options if (number := _number(value)) is not None and compare(number, threshold) else None
+                for value in values]
+
+
+class ColorScale(Rule):
+    """
+    Colour the cells by their numeric value, from the first colour at low to the last at high. The
+    range is cut into steps colours, so a column uses at most steps styles per row style.
+    low: float - Value of the first colour, lower values take it too
+    high: float - Value of the last colour, higher values take it too
+    colors: Tuple[str, ...] - Colours the scale goes through, as #rrggbb (default: red, yellow, green)
+    steps: int - Colours of the scale (default: 8)
+    option: str - Style option coloured: background or foreground (default: background)
+    """
+    def __init__(self, low: float, high: float, colors: Tuple[str, ...] = ("#c62828", "#f9a825", "#2e7d32"),
+                 steps: int = 8, option: str = "background"):
+        if high <= low:
+            raise ValueError("ColorScale needs low < high")
+        self.low = low
+        self.high = high
+        self.steps = max(2, steps)
+        stops = [_hex(color) for color in colors]
+        self.options: List[Options] = []
+        for step in range(self.steps):
+            # Position on the scale, then between the two stops around it
+            position = step / (self.steps - 1) * (len(stops) - 1)
+            index = min(int(position), len(stops) - 2)
+            weight = position - index
+            rgb = tuple(round(a + (b - a) * weight) for a, b in zip(stops[index], stops[index + 1]))
+            self.options.append(((option, "#%02x%02x%02x" % rgb),))
+
+    def evaluate(self, values: Sequence[Any]) -> List[Optional[Options]]:
+        options, scale, last = self.options, (self.steps - 1) / (self.high - self.low), self.steps - 1
+        if _numeric_array(values):
+            positions = (np.clip(values, self.low, self.high) - self.low) * scale
+            return [options[int(round(position))] if position == position else None for position in positions.tolist()]
+        low, high = self.low, self.high
+        return [options[round((min(max(number, low), high) - low) * scale)] if (number := _number(value)) is not None else None
+                for value in values]
+
+
+class Match(Rule):
+    """
+    Style the cells whose text matches a regular expression, searched anywhere in the text.
+    pattern: str - Regular expression
+    options: Style options of the matching cells
+    """
+    def __init__(self, pattern: str, flags: int = 0, **options):
+        self.search = re.compile(pattern, flags).search
+        self.options = _freeze(options)
+
+    def evaluate(self, values: Sequence[Any]) -> List[Optional[Options]]:
+        if np is not None and isinstance(values, np.ndarray):
+            values = values.tolist()
+        search, options = self.search, self.options
+        return [options if value is not None and search(str(value)) else None for value in values]
+
+
+class ConditionalFormats:
+    """
+    The conditional formats of a table's columns (see Header.formats) and the options they give each
+    cell. A whole column is evaluated in one batch per rule, with array operations on NumPy columns of
+    ColumnarTableModel; after that only the cells that change are evaluated again. The rules of a
+    column are applied in order, a later rule overriding the options of an earlier one. Cells share
+    their options, interned into one ttk style per row style and options, so a column of any length
+    uses a few styles.
+    rules: Dict[int, List[Rule]] - Rules by column
+    """
+    def __init__(self, rules: Dict[int, List[Rule]]):
+        self.rules = rules
+        self._options: Dict[int, List[Optional[Options]]] = {col: [] for col in rules}  # Options by data row
+        self._merged: Dict[Tuple[Options, Options], Options] = {}
+        self._styles: Dict[Tuple[str, Options], str] = {}  # (row style, options) -> interned style
+
+    @property
+    def columns(self) -> Set[int]:
+        return set(self.rules)
+
+    def _evaluate(self, col: int, values: Sequence[Any]) -> List[Optional[Options]]:
+        rules = self.rules[col]
+        result = rules[0].evaluate(values)
+        for rule in rules[1:]:
+            result = [self._merge(a, b) for a, b in zip(result, rule.evaluate(values))]
+        return result
+
+    def _merge(self, first: Optional[Options], second: Optional[Options]) -> Optional[Options]:
+        if first is None or second is None:
+            return second if first is None else first
+        merged = self._merged.get((first, second))
+        if merged is None:
+            merged = self._merged[(first, second)] = _freeze({**dict(first), **dict(second)})
+        return merged
+
+    def _column(self, model: TableModel, col: int, start: int = 0) -> Sequence[Any]:
+        values = model.column(col)
+        if start == 0 and len(values) == len(model):
+            return values
+        if np is not None and isinstance(values, np.ndarray):
+            return values[start:len(model)]
+        return [model.get(row, col) for row in range(start, len(model))]
+
+    def rebuild(self, model: TableModel):
+        """Evaluate every cell of model"""
+        for col in self.rules:
+            self._options[col] = self._evaluate(col, self._column(model, col))
+
+    def insert(self, model: TableModel, index: int, count: int):
+        """Evaluate the count rows inserted into model at index"""
+        for col, options in self._options.items():
+            options[index:index] = self._evaluate(col, [model.get(row, col) for row in range(index, index + count)])
+
+    def delete(self, indices: Sequence[int]):
+        """Forget the data rows removed from the model, indices sorted"""
+        removed = set(indices)
+        for col, options in self._options.items():
+            options[:] = [value for row, value in enumerate(options) if row not in removed]
+
+    def move(self, src: int, dst: int):
+        for options in self._options.values():
+            options.insert(dst, options.pop(src))
+
+    def append_ring(self, model: TableModel, count: int):
+        """Follow count rows appended to a ring buffer model, which dropped its oldest rows to make room"""
+        kept = len(model) - min(count, len(model))
+        for col, options in self._options.items():
+            del options[:len(options) - kept]
+            options.extend(self._evaluate(col, self._column(model, col, kept)))
+
+    def update(self, model: TableModel, cells: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Evaluate cells of model that changed, given as (data row, col), returns those whose options changed"""
+        by_column: Dict[int, List[int]] = {}
+        for row, col in cells:
+            if col in self.rules:
+                by_column.setdefault(col, []).append(row)
+        changed = []
+        for col, rows in by_column.items():
+            options = self._options[col]
+            for row, new in zip(rows, self._evaluate(col, [model.get(row, col) for row in rows])):
+                if options[row] != new:
+                    options[row] = new
+                    changed.append((row, col))
+        return changed
+
+    def update_column(self, model: TableModel, col: int) -> List[Tuple[int, int]]:
+        """Evaluate a column that was rewritten as a whole, returns the cells whose options changed"""
+        if col not in self.rules:
+            return []
+        old = self._options[col]
+        new = self._options[col] = self._evaluate(col, self._column(model, col))
+        return [(row, col) for row, (a, b) in enumerate(zip(old, new)) if a != b]
+
+    def style(self, base: str, row: int, col: int) -> str:
+        """Style of the cell at data row row and column col, derived from the row style base"""
+        options = self._options.get(col)
+        if options is None or row >= len(options) or options[row] is None:
+            return base
+        key = (base, options[row])
+        name = self._styles.get(key)
+        if name is None:
+            name = self._styles[key] = style_registry.intern(base, **dict(options[row]))
+        return name
@@ -0,0 +1,172 @@
+from bisect import bisect_left, insort
+from typing import List, Any, Iterable, Sequence, Tuple, Dict, Set
+from devopsnextgenx.components.TableModel import TableModel, sort_key
+
+AGGREGATES = ("sum", "count", "min", "max", "avg")
+
+
+def _numeric(value) -> bool:
+    # NaN is left out, it has no place in the sorted values
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value == value
+
+
+class Aggregate:
+    """
+    Running count, sum, min, max and avg of one column of a group, as TableModel.aggregate computes
+    them. The numeric values are kept sorted, so removing the current minimum or maximum is a
+    bisect rather than a scan of the group.
+    """
+    __slots__ = ("count", "total", "values")
+
+    def __init__(self):
+        self.count = 0  # Rows, numeric or not
+        self.total = 0
+        self.values = []  # Numeric values, sorted
+
+    def add(self, value):
+        self.count += 1
+        if _numeric(value):
+            self.total += value
+            insort(self.values, value)
+
+    def remove(self, value):
+        self.count -= 1
+        if _numeric(value):
+            index = bisect_left(self.values, value)
+            if index < len(self.values) and self.values[index] == value:
+                del self.values[index]
+                # Start again from 0 rather than carry float rounding left over by the removed values
+                self.total = self.total - value if self.values else 0
+
+    def get(self, name: str) -> Any:
+        """Value of the aggregate name, one of AGGREGATES"""
+        values = self.values
+        match name:
+            case "count":
+                return self.count
+            case "sum":
+                return self.total
+            case "min":
+                return values[0] if values else None
+            case "max":
+                return values[-1] if values else None
+            case "avg":
+                return self.total / len(values) if values else None
+        raise ValueError(f"Unknown aggregate: {name}")
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: self.get(name) for name in AGGREGATES}
+
+
+class Group:
+    """The data rows sharing one value of the grouped columns, with the aggregates of their columns"""
+    __slots__ = ("key", "rows", "aggregates")
+
+    def __init__(self, key: Tuple, columns: Iterable[int]):
+        self.key = key
+        self.rows: Set[int] = set()
+        self.aggregates = {col: Aggregate() for col in columns}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
+class GroupIndex:
+    """
+    Rows of a model grouped by the values of one or more columns. The aggregates are maintained as
+    cells change (see update) and rows are appended (see add_rows); only removing, inserting or
+    moving rows, which renumbers them, rebuilds the index.
+    columns: Sequence[int] - Grouped columns, most significant first
+    aggregate_columns: Iterable[int] - Columns aggregated per group
+    """
+    def __init__(self, columns: Sequence[int], aggregate_columns: Iterable[int]):
+        self.columns = list(columns)
+        self.aggregate_columns = list(aggregate_columns)
+        self.groups: Dict[Tuple, Group] = {}
+        self.collapsed: Set[Tuple] = set()  # Keys of the collapsed groups, kept across rebuilds
+        self._keys: List[Tuple] = []  # Group key of each data row
+
+    def rebuild(self, model: TableModel):
+        """Group every row of model again"""
+        self.groups = {}
+        self._keys = []
+        self.add_rows(model, range(len(model)))
+
+    def add_rows(self, model: TableModel, rows: Iterable[int]) -> Set[Tuple]:
+        """Add the data rows appended to model, returns the keys of the groups they joined"""
+        keys = set()
+        for row in rows:
+            row_data = model.row(row)
+            key = tuple(row_data[col] for col in self.columns)
+            self._keys.append(key)
+            self._add(key, row, row_data)
+            keys.add(key)
+        return keys
+
+    def _add(self, key: Tuple, row: int, row_data: Sequence[Any]):
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = Group(key, self.aggregate_columns)
+        group.rows.add(row)
+        for col, aggregate in group.aggregates.items():
+            aggregate.add(row_data[col])
+
+    def _remove(self, key: Tuple, row: int, row_data: Sequence[Any]):
+        group = self.groups[key]
+        group.rows.discard(row)
+        for col, aggregate in group.aggregates.items():
+            aggregate.remove(row_data[col])
+        if not group.rows:
+            del self.groups[key]
+
+    def key_of(self, row: int) -> Tuple:
+        return self._keys[row]
+
+    def is_collapsed(self, row: int) -> bool:
+        """Whether data row row belongs to a collapsed group"""
+        return row < len(self._keys) and self._keys[row] in self.collapsed
+
+    def update(self, model: TableModel, row: int, col: int, old, new) -> List[Tuple]:
+        """
+        Follow a cell of model that changed from old to new, returns the keys of the groups whose
+        aggregates or rows changed. A change in a grouped column moves the row to another group.
+        """
+        key = self._keys[row]
+        if col in self.columns:
+            new_key = tuple(new if column == col else value for column, value in zip(self.columns, key))
+            if new_key == key:
+                return []
+            row_data = model.row(row)
+            old_data = list(row_data)
+            old_data[col] = old
+            self._remove(key, row, old_data)
+            self._keys[row] = new_key
+            self._add(new_key, row, row_data)
+            return [key, new_key]
+        aggregate = self.groups[key].aggregates.get(col)
+        if aggregate is None or old == new:
+            return []
+        aggregate.remove(old)
+        aggregate.add(new)
+        return [key]
+
+    def arrange(self, order: Sequence[int]) -> Tuple[List[int], List[int], List[Tuple]]:
+        """
+        Lay out the data rows of order (sorted and filtered) by group: groups follow their key's
+        order, and the rows of a group keep their order. Returns the rows shown, leaving out those of
+        collapsed groups, the number of rows shown before each group, and the keys of the groups.
+        """
+        buckets: Dict[Tuple, List[int]] = {}
+        keys = self._keys
+        for row in order:
+            bucket = buckets.get(keys[row])
+            if bucket is None:
+                bucket = buckets[keys[row]] = []
+            bucket.append(row)
+        shown, starts = [], []
+        group_keys = sorted(buckets, key=lambda key: tuple(map(sort_key, key)))
+        for key in group_keys:
+            starts.append(len(shown))
+            if key not in self.collapsed:
+                shown.extend(buckets[key])
+        return shown, starts, group_keys
@@ -0,0 +1,212 @@
+import csv
+import json
+import os
+import threading
+from itertools import islice
+from typing import List, Any, Optional, Iterable, Iterator, Sequence, Callable
+from devopsnextgenx.components.TableModel import to_bool
+
+
+def _to_int(value) -> Any:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        try:
+            return int(float(value))
+        except (TypeError, ValueError):
+            return value  # Kept as read, like "N/A"
+
+
+def _to_float(value) -> Any:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def _to_str(value) -> Any:
+    return "" if value is None else str(value)
+
+
+def _keep(value) -> Any:
+    return value
+
+
+_COERCERS = {bool: to_bool, int: _to_int, float: _to_float, str: _to_str}
+
+
+def coercer(dtype: Optional[type]) -> Callable[[Any], Any]:
+    """Function converting an imported value to dtype, values that do not convert are kept as read"""
+    return _COERCERS.get(dtype, _keep)
+
+
+class FileReader:
+    """
+    Rows of a CSV or JSONL file, read lazily one line at a time. CSV columns are matched to
+    columns by the names in the header line when they match, else by position; JSONL lines are
+    objects keyed by column name, or lists. Short rows are padded; JSONL lines that are not valid
+    JSON, or hold another value, are skipped and counted in skipped.
+    path: str - File to read
+    columns: List[str] - Column names, in table order
+    format: Optional[str] - "csv" or "jsonl", from the file extension when not given (default: None)
+    has_header: bool - The first line of a CSV file names the columns (default: True)
+    """
+    def __init__(self, path: str, columns: List[str], format: Optional[str] = None, has_header: bool = True):
+        self.path = path
+        self.columns = columns
+        self.format = format or ("jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv")
+        if self.format not in ("csv", "jsonl"):
+            raise ValueError(f"Unsupported format: {self.format}")
+        self.has_header = has_header
+        self.size = os.path.getsize(path)
+        self.position = 0  # Characters read so far, about the bytes read for progress
+        self.skipped = 0  # Lines that hold no row
+
+    @property
+    def progress(self) -> float:
+        return min(1.0, self.position / self.size) if self.size else 1.0
+
+    def _lines(self, stream) -> Iterator[str]:
+        for line in stream:
+            self.position += len(line)
+            yield line
+
+    def __iter__(self) -> Iterator[List[Any]]:
+        width = len(self.columns)
+        with open(self.path, newline="", encoding="utf-8") as stream:
+            if self.format == "csv":
+                rows = csv.reader(self._lines(stream))
+                index = None
+                if self.has_header:
+                    names = next(rows, [])
+                    if any(column in names for column in self.columns):
+                        index = [names.index(column) if column in names else None for column in self.columns]
+                for row in rows:
+                    if not row:
+                        continue
+                    if index is not None:
+                        yield [row[i] if i is not None and i < len(row) else "" for i in index]
+                    else:
+                        yield row[:width] + [""] * (width - len(row))
+                return
+            for line in self._lines(stream):
+                if not line.strip():
+                    continue
+                try:
+                    value = json.loads(line)
+                except ValueError:
+                    self.skipped += 1
+                    continue
+                if isinstance(value, dict):
+                    yield [value.get(column) for column in self.columns]
+                elif isinstance(value, list):
+                    yield value[:width] + [None] * (width - len(value))
+                else:
+                    self.skipped += 1
+
+
+def coerce_rows(rows: Iterable[Sequence[Any]], coercers: Sequence[Callable[[Any], Any]]) -> Iterator[List[Any]]:
+    """Convert every value with the coercer of its column"""
+    for row in rows:
+        yield [coerce(value) for coerce, value in zip(coercers, row)]
+
+
+def chunks(rows: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Group rows into lists of size rows, the last one shorter"""
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def write_csv(path: str, rows: Iterable[Sequence[Any]], columns: List[str], progress: Optional[Callable[[int], None]] = None,
+              chunk_size: int = 1000):
+    """Write a header line and rows to a CSV file, calling progress(rows written) after every chunk"""
+    with open(path, "w", newline="", encoding="utf-8") as stream:
+        writer = csv.writer(stream)
+        writer.writerow(columns)
+        done = 0
+        for chunk in chunks(rows, chunk_size):
+            writer.writerows(chunk)
+            done += len(chunk)
+            if progress is not None:
+                progress(done)
+
+
+def write_jsonl(path: str, rows: Iterable[Sequence[Any]], columns: List[str], progress: Optional[Callable[[int], None]] = None,
+                chunk_size: int = 1000):
+    """Write rows to a JSONL file, one object keyed by column name per line"""
+    with open(path, "w", encoding="utf-8") as stream:
+        done = 0
+        for chunk in chunks(rows, chunk_size):
+            stream.writelines(json.dumps(dict(zip(columns, row)), default=str) + "\n" for row in chunk)
+            done += len(chunk)
+            if progress is not None:
+                progress(done)
+
+
+class ExportJob:
+    """
+    Writes rows to a file in a background thread. The Tk side polls the job through after(), so
+    the status bar and on_done are only touched from the UI thread.
+    widget: Any - Widget whose after() polls the job
+    write: Callable - write_csv or write_jsonl
+    path: str - File to write
+    rows: Iterable[Sequence[Any]] - Rows to write, read in the background thread
+    total: int - Number of rows, for the progress
+    columns: List[str] - Column names
+    status_bar: Optional[StatusBar] - Status bar showing the progress (default: None)
+    on_done: Optional[Callable] - on_done(error), error is None when the export succeeded (default: None)
+    """
+    POLL_MS = 100
+
+    def __init__(self, widget, write: Callable, path: str, rows: Iterable[Sequence[Any]], total: int, columns: List[str],
+                 status_bar=None, on_done: Optional[Callable[[Optional[Exception]], None]] = None):
+        self.widget = widget
+        self.path = path
+        self.total = total
+        self.status_bar = status_bar
+        self.on_done = on_done
+        self.done = 0
+        self.error: Optional[Exception] = None
+        self.thread = threading.Thread(target=self._run, args=(write, rows, columns), daemon=True)
+
+    def start(self) -> "ExportJob":
+        self.thread.start()
+        self.widget.after(self.POLL_MS, self._poll)
+        return self
+
+    def _run(self, write: Callable, rows: Iterable[Sequence[Any]], columns: List[str]):
+        try:
+            write(self.path, rows, columns, self._progress)
+        except Exception as error:
+            self.error = error
+
+    def _progress(self, done: int):
+        self.done = done
+
+    @property
+    def finished(self) -> bool:
+        return not self.thread.is_alive()
+
+    def join(self, timeout: Optional[float] = None):
+        """Wait for the background thread"""
+        self.thread.join(timeout)
+
+    def _poll(self):
+        finished = self.finished
+        name = os.path.basename(self.path)
+        if self.status_bar is not None:
+            if self.error is not None:
+                self.status_bar.update_status(f"Export of {name} failed: {self.error}")
+            elif finished:
+                self.status_bar.update_status(f"Exported {self.done} rows to {name}", 1.0)
+            else:
+                self.status_bar.update_status(f"Exporting {name} {self.done}/{self.total}",
+                                              self.done / self.total if self.total else 0.0)
+        if not finished:
+            self.widget.after(self.POLL_MS, self._poll)
+        elif self.on_done is not None:
+            self.on_done(self.error)
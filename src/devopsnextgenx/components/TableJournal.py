@@ -0,0 +1,138 @@
+from collections import deque
+from itertools import islice
+from typing import List, Any, Optional, NamedTuple, Dict, Tuple, Callable
+
+
+class Change(NamedTuple):
+    """One cell change: the row's key, the column, and the values before and after"""
+    key: Any  # Row key (see Table row_key), the data row index without one
+    col: int
+    old: Any
+    new: Any
+    row: int  # Data row index when recorded, tried first when the change is replayed
+
+
+class ChangeJournal:
+    """
+    Journal of the cell changes of a table. Changes are kept twice: in an append-only log read by
+    changes_since, with undone and redone changes logged again as they happen, and as transactions
+    for undo and redo. A change made outside begin/end is a transaction of its own.
+    max_undo: int - Transactions that can be undone (default: 100)
+    max_log: int - Changes kept in the log, older tokens expire (default: 100000)
+    """
+    def __init__(self, max_undo: int = 100, max_log: int = 100_000):
+        self.max_log = max_log
+        self._log = deque(maxlen=max_log)  # The oldest changes drop out as new ones are logged
+        self._logged = 0  # Changes ever logged, the token after the last one
+        self._undo = deque(maxlen=max_undo)  # Transactions, most recent last
+        self._redo: List[List[Change]] = []
+        self._open: Optional[List[Change]] = None
+        self._depth = 0
+
+    @property
+    def token(self) -> int:
+        """Position in the log, for changes_since"""
+        return self._logged
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def begin(self):
+        """Start a transaction, transactions nest into the outermost one"""
+        self._depth += 1
+        if self._depth == 1:
+            self._open = []
+
+    def end(self):
+        """End a transaction; the outermost end makes its changes one undo step"""
+        self._depth -= 1
+        if self._depth == 0:
+            changes, self._open = self._open, None
+            if changes:
+                self._undo.append(changes)
+
+    def record(self, change: Change):
+        self._log_changes([change])
+        self._redo.clear()  # A new change ends the redo history
+        if self._open is not None:
+            self._open.append(change)
+        else:
+            self._undo.append([change])
+
+    def undo(self) -> Optional[List[Change]]:
+        """The last transaction, to be reverted (change.old written back, last change first); None when there is none"""
+        self._check_closed()
+        if not self._undo:
+            return None
+        changes = self._undo.pop()
+        self._redo.append(changes)
+        self._log_changes([change._replace(old=change.new, new=change.old) for change in reversed(changes)])
+        return changes
+
+    def redo(self) -> Optional[List[Change]]:
+        """The last undone transaction, to be applied again (change.new written); None when there is none"""
+        self._check_closed()
+        if not self._redo:
+            return None
+        changes = self._redo.pop()
+        self._undo.append(changes)
+        self._log_changes(changes)
+        return changes
+
+    def changes_since(self, token: int, net: bool = True) -> List[Change]:
+        """
+        Changes logged after token (see token), oldest first.
+        net: bool - Merge the changes of each cell into one, from its first old value to its last new
+             value, and leave out the cells that ended where they started (default: True)
+        """
+        base = self._logged - len(self._log)
+        if token < base:
+            raise ValueError(f"Token {token} expired, the log starts at {base}")
+        changes = list(islice(reversed(self._log), max(0, self._logged - token)))[::-1]  # Read from the recent end
+        if not net:
+            return changes
+        merged: Dict[Tuple[Any, int], Change] = {}
+        for change in changes:
+            previous = merged.get((change.key, change.col))
+            merged[(change.key, change.col)] = change if previous is None else previous._replace(new=change.new, row=change.row)
+        return [change for change in merged.values() if change.old != change.new]
+
+    def remap(self, remap: Callable[[int], Optional[int]], keys: bool = False):
+        """
+        Follow rows inserted, removed or moved in the table: remap gives the new data row index of an
+        old one, None when it was removed. The undo and redo history is updated, the log keeps the
+        changes as they were recorded.
+        keys: bool - The keys are data row indices (no row key) and follow their rows; the changes of
+              removed rows then leave the history. Otherwise they stay, found again by key (default: False)
+        """
+        def follow(changes: List[Change]) -> List[Change]:
+            moved = []
+            for change in changes:
+                row = remap(change.row)
+                if row is not None:
+                    moved.append(change._replace(row=row, key=row if keys else change.key))
+                elif not keys:
+                    moved.append(change)  # The row hint is checked against the key when replayed
+            return moved
+        self._undo = deque((changes for changes in map(follow, self._undo) if changes), maxlen=self._undo.maxlen)
+        self._redo = [changes for changes in map(follow, self._redo) if changes]
+        if self._open is not None:
+            self._open[:] = follow(self._open)
+
+    def clear(self):
+        """Forget the undo and redo history, e.g. after the data was replaced; the log keeps its tokens"""
+        self._undo.clear()
+        self._redo.clear()
+
+    def _log_changes(self, changes: List[Change]):
+        self._log.extend(changes)
+        self._logged += len(changes)
+
+    def _check_closed(self):
+        if self._depth:
+            raise ValueError("Cannot undo or redo inside a transaction")
@@ -0,0 +1,90 @@
+import ttkbootstrap as ttk
+from typing import Any, Dict, List, Tuple
+
+
+class PlaceLayout:
+    """
+    Lays out the cells of a Table with place() instead of one grid slave per cell. A cell's
+    position is computed from its line and the fixed row height, and its column's cached edges, so
+    adding, moving or removing rows costs no geometry recomputation of the other cells. The column
+    edges follow the header labels; when they change (the window is resized, a header text changes)
+    only the cells of the columns whose edges moved are placed again.
+    table: Table - The table whose cells are placed
+    row_height: int - Height of a line in pixels
+    """
+    def __init__(self, table, row_height: int):
+        self.table = table
+        self.row_height = row_height
+        self.body = ttk.Frame(table, height=0)  # Area the lines are placed in, under the headers
+        self._edges: List[int] = []  # x of each column's left edge, then the right end of the last column
+        self._columns: List[Dict[str, Tuple[Any, int]]] = []  # Per column: widget path -> (widget, line)
+        self._column_of: Dict[str, int] = {}  # Widget path -> column it is placed in
+        self._relayout_id = None
+        self.body.bind("<Configure>", lambda e: self.invalidate())
+
+    def watch(self, labels: List[Any]):
+        """Relayout when a header label is resized"""
+        self._columns = [{} for _ in labels]
+        for label in labels:
+            label.bind("<Configure>", lambda e: self.invalidate(), add="+")
+
+    def column_edges(self) -> List[int]:
+        """Column edges in the body, see Table._column_edges"""
+        return self.table._column_edges(self.body)
+
+    def place(self, widget, line: int, col: int):
+        """Show a widget in the cell at line (1 based) and column col"""
+        edges = self._edges or self._update_edges()
+        path = str(widget)
+        previous = self._column_of.get(path)
+        if previous is not None and previous != col:
+            del self._columns[previous][path]
+        self._columns[col][path] = (widget, line)
+        self._column_of[path] = col
+        widget.place(in_=self.body, x=edges[col] + 1, y=(line - 1) * self.row_height + 1,
+                     width=edges[col + 1] - edges[col] - 2, height=self.row_height - 2)
+
+    def hide(self, widget):
+        """Remove a placed widget from the layout, see place"""
+        self.forget(str(widget))
+        widget.place_forget()
+
+    def forget(self, path: str):
+        """Stop tracking a widget, e.g. once it is destroyed"""
+        col = self._column_of.pop(path, None)
+        if col is not None:
+            del self._columns[col][path]
+
+    def set_line_count(self, count: int):
+        """Size the body to count lines"""
+        self.body.configure(height=max(1, count * self.row_height))
+
+    def invalidate(self):
+        """Relayout once idle, after the column widths may have changed"""
+        if self._relayout_id is None:
+            self._relayout_id = self.body.after_idle(self.relayout)
+
+    def cancel(self):
+        """Drop a pending relayout, e.g. before the table is destroyed"""
+        if self._relayout_id is not None:
+            self.body.after_cancel(self._relayout_id)
+            self._relayout_id = None
+
+    def _update_edges(self) -> List[int]:
+        self._edges = self.column_edges()
+        return self._edges
+
+    def relayout(self) -> List[int]:
+        """Place again the cells of the columns whose edges moved, returns those columns"""
+        self._relayout_id = None
+        old = self._edges
+        edges = self._update_edges()
+        if len(old) != len(edges):
+            changed = list(range(len(edges) - 1))
+        else:
+            changed = [col for col in range(len(edges) - 1) if (old[col], old[col + 1]) != (edges[col], edges[col + 1])]
+        for col in changed:
+            x, width = edges[col] + 1, edges[col + 1] - edges[col] - 2
+            for widget, line in self._columns[col].values():
+                widget.place_configure(x=x, width=width)
+        return changed
@@ -0,0 +1,709 @@
+import array
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import List, Any, Optional, Iterable, Iterator, Sequence, Tuple, Dict, Callable
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, numeric columns fall back to array.array
+    np = None
+
+
+def to_bool(value) -> bool:
+    """Interpret a cell value for the boolean widget types"""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return bool(value)
+    return isinstance(value, str) and value.lower() in ('true', 'yes', '1')
+
+def sort_key(value) -> tuple:
+    """Typed sort key: numbers (and numeric text) first, then text case-insensitively, None last"""
+    if isinstance(value, (int, float)):
+        return (0, value, "")
+    if value is None:
+        return (2, 0, "")
+    text = str(value)
+    try:
+        return (0, float(text), "")
+    except ValueError:
+        return (1, 0, text.casefold())
+
+
+class Bitmap:
+    """
+    Packed booleans, one bit per row.
+    values: Iterable[Any] - Initial values, interpreted with to_bool
+    """
+    __slots__ = ("_bits", "_size")
+
+    def __init__(self, values: Iterable[Any] = ()):
+        self._bits = bytearray()
+        self._size = 0
+        for value in values:
+            self.append(value)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> bool:
+        if not 0 <= index < self._size:
+            raise IndexError("Bitmap index out of range")
+        return bool(self._bits[index >> 3] >> (index & 7) & 1)
+
+    def __setitem__(self, index: int, value):
+        if not 0 <= index < self._size:
+            raise IndexError("Bitmap index out of range")
+        if to_bool(value):
+            self._bits[index >> 3] |= 1 << (index & 7)
+        else:
+            self._bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def __iter__(self) -> Iterator[bool]:
+        for index in range(self._size):
+            yield self[index]
+
+    def append(self, value):
+        """Add a value at the end"""
+        if self._size % 8 == 0:
+            self._bits.append(0)
+        self._size += 1
+        self[self._size - 1] = value
+
+    def count(self) -> int:
+        """Number of True values"""
+        return int.from_bytes(self._bits, "little").bit_count()
+
+    def _mask(self) -> int:
+        return (1 << self._size) - 1
+
+    def fill(self, value):
+        """Set every value, a word at a time"""
+        word = self._mask() if to_bool(value) else 0
+        self._bits[:] = word.to_bytes(len(self._bits), "little")
+
+    def invert(self):
+        """Flip every value, a word at a time"""
+        word = int.from_bytes(self._bits, "little") ^ self._mask()
+        self._bits[:] = word.to_bytes(len(self._bits), "little")
+
+
+class _RowView:
+    """A row of a TableModel that supports model[row][col] reads and writes"""
+    __slots__ = ("_model", "_row")
+
+    def __init__(self, model: "TableModel", row: int):
+        self._model = model
+        self._row = row
+
+    def __getitem__(self, col: int):
+        return self._model.get(self._row, col)
+
+    def __setitem__(self, col: int, value):
+        self._model.set(self._row, col, value)
+
+    def __len__(self) -> int:
+        return self._model.column_count
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._model.row(self._row))
+
+    def __repr__(self) -> str:
+        return repr(self._model.row(self._row))
+
+
+class TableModel(ABC):
+    """
+    Storage behind a Table. Table reads and writes cells only through this interface, so the
+    data can live in any layout. Sort keys are cached per column and kept up to date by set().
+    """
+    def __init__(self):
+        self._sort_keys = {}
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of rows"""
+
+    @property
+    @abstractmethod
+    def column_count(self) -> int:
+        """Number of columns"""
+
+    @abstractmethod
+    def get(self, row: int, col: int) -> Any:
+        """Value of a cell"""
+
+    @abstractmethod
+    def _write(self, row: int, col: int, value) -> Any:
+        """Store a cell value and return it as stored (after any type coercion)"""
+
+    def _insert(self, index: int, rows: List[List[Any]]):
+        """Store rows before index"""
+        raise NotImplementedError(f"{type(self).__name__} does not support adding rows")
+
+    def _delete(self, indices: List[int]):
+        """Remove the rows at indices (sorted, unique)"""
+        raise NotImplementedError(f"{type(self).__name__} does not support removing rows")
+
+    @property
+    def data(self):
+        """What Table exposes as Table.data and passes to on_change callbacks"""
+        return self
+
+    def set(self, row: int, col: int, value) -> Any:
+        """Store a cell value, returns the stored value. Raises ValueError if the column cannot hold it."""
+        value = self._write(row, col, value)
+        keys = self._sort_keys.get(col)
+        if keys is not None:
+            keys[row] = sort_key(value)
+        return value
+
+    def insert(self, index: int, rows: Iterable[Sequence[Any]]) -> int:
+        """Insert rows before index (clamped to the row count), returns the number of rows inserted"""
+        rows = [row_data if isinstance(row_data, list) else list(row_data) for row_data in rows]
+        if not rows:
+            return 0
+        index = max(0, min(index, len(self)))
+        self._insert(index, rows)
+        for col, keys in self._sort_keys.items():
+            keys[index:index] = [sort_key(row_data[col]) for row_data in rows]
+        return len(rows)
+
+    def delete(self, indices: Iterable[int]) -> List[int]:
+        """Remove the rows at indices, returns the removed indices sorted. Raises IndexError for a missing row."""
+        indices = sorted(set(indices))
+        if not indices:
+            return indices
+        if indices[0] < 0 or indices[-1] >= len(self):
+            raise IndexError("row index out of range")
+        self._delete(indices)
+        removed = set(indices)
+        for col, keys in self._sort_keys.items():
+            self._sort_keys[col] = [key for row, key in enumerate(keys) if row not in removed]
+        return indices
+
+    def fill_column(self, col: int, value):
+        """Set every value of a column"""
+        for row in range(len(self)):
+            self._write(row, col, value)
+        self._sort_keys.pop(col, None)
+
+    def invert_column(self, col: int):
+        """Flip every value of a boolean column"""
+        for row in range(len(self)):
+            self._write(row, col, not to_bool(self.get(row, col)))
+        self._sort_keys.pop(col, None)
+
+    def count_true(self, col: int) -> int:
+        """Number of rows whose value in col is true"""
+        return sum(1 for value in self.column(col) if to_bool(value))
+
+    def move(self, src: int, dst: int):
+        """Move row src so that it ends up at index dst"""
+        row_data = self.row(src)
+        self.delete([src])
+        self.insert(dst, [row_data])
+
+    def row(self, row: int) -> List[Any]:
+        """Values of a row"""
+        return [self.get(row, col) for col in range(self.column_count)]
+
+    def snapshot(self) -> "TableModel":
+        """
+        The current rows for a reader in another thread, e.g. an export. Rows inserted, removed or
+        appended later do not show in it. The default copies the rows; the models below share their
+        storage instead, so values written into existing cells later may show.
+        """
+        return ListTableModel([self.row(row) for row in range(len(self))])
+
+    def rows(self) -> Iterator[List[Any]]:
+        """Iterate over the rows as lists"""
+        for row in range(len(self)):
+            yield self.row(row)
+
+    def column(self, col: int) -> Sequence[Any]:
+        """Values of a column, in the storage's native type where there is one"""
+        return [self.get(row, col) for row in range(len(self))]
+
+    def __getitem__(self, row: int) -> _RowView:
+        if not 0 <= row < len(self):
+            raise IndexError("row index out of range")
+        return _RowView(self, row)
+
+    def __iter__(self) -> Iterator[_RowView]:
+        for row in range(len(self)):
+            yield _RowView(self, row)
+
+    def sort_keys(self, col: int) -> Sequence[Any]:
+        """Sort keys of a column, computed once and then maintained by set()"""
+        keys = self._sort_keys.get(col)
+        if keys is None:
+            keys = self._sort_keys[col] = [sort_key(value) for value in self.column(col)]
+        return keys
+
+    def order_by(self, sort_spec: List[Tuple[int, bool]]) -> List[int]:
+        """Row indices ordered by (col, ascending) pairs, most significant first; stable"""
+        order = list(range(len(self)))
+        for col, ascending in reversed(sort_spec):
+            order.sort(key=self.sort_keys(col).__getitem__, reverse=not ascending)
+        return order
+
+    def select(self, col: int, low=None, high=None) -> List[int]:
+        """Row indices whose numeric value in col is within [low, high], None means unbounded"""
+        result = []
+        for row, value in enumerate(self.column(col)):
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            if (low is None or value >= low) and (high is None or value <= high):
+                result.append(row)
+        return result
+
+    def aggregate(self, col: int, rows: Optional[Sequence[int]] = None) -> Dict[str, Any]:
+        """count, sum, min, max and avg of the numeric values of col (over rows, or all rows)"""
+        values = self.column(col)
+        if rows is not None:
+            values = [values[row] for row in rows]
+        numbers = [value for value in values if isinstance(value, (int, float)) and not isinstance(value, bool)]
+        if not numbers:
+            return {"count": len(values), "sum": 0, "min": None, "max": None, "avg": None}
+        total = sum(numbers)
+        return {"count": len(values), "sum": total, "min": min(numbers), "max": max(numbers), "avg": total / len(numbers)}
+
+
+class ListTableModel(TableModel):
+    """
+    The default model: the List[List[Any]] passed to Table, used in place.
+    rows: List[List[Any]] - The data rows
+    """
+    def __init__(self, rows: List[List[Any]]):
+        super().__init__()
+        self._rows = rows
+
+    @property
+    def data(self) -> List[List[Any]]:
+        return self._rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def column_count(self) -> int:
+        return len(self._rows[0]) if self._rows else 0
+
+    def get(self, row: int, col: int) -> Any:
+        return self._rows[row][col]
+
+    def _write(self, row: int, col: int, value) -> Any:
+        self._rows[row][col] = value
+        return value
+
+    def _insert(self, index: int, rows: List[List[Any]]):
+        self._rows[index:index] = rows
+
+    def _delete(self, indices: List[int]):
+        removed = set(indices)
+        # Slice assignment keeps the caller's list object
+        self._rows[:] = [row_data for row, row_data in enumerate(self._rows) if row not in removed]
+
+    def move(self, src: int, dst: int):
+        # Keep the row's list object, the caller may hold on to it
+        self._rows.insert(dst, self._rows.pop(src))
+        for keys in self._sort_keys.values():
+            keys.insert(dst, keys.pop(src))
+
+    def row(self, row: int) -> List[Any]:
+        return list(self._rows[row])
+
+    def snapshot(self) -> "ListTableModel":
+        # A copy of the row list only, the rows themselves are shared
+        return ListTableModel(list(self._rows))
+
+    def column(self, col: int) -> List[Any]:
+        return [row_data[col] for row_data in self._rows]
+
+
+class ColumnarTableModel(TableModel):
+    """
+    Column oriented storage for large datasets. int and float columns are typed NumPy arrays
+    (array.array when NumPy is not installed), bool columns are Bitmaps and anything else is a list.
+    NumPy columns keep spare capacity past the last row, so appended rows are written in place.
+    rows: Iterable[Sequence[Any]] - The data rows
+    types: Optional[List[type]] - Column types (bool, int, float or str); inferred from the rows when not given
+    """
+    def __init__(self, rows: Iterable[Sequence[Any]], types: Optional[List[type]] = None):
+        super().__init__()
+        rows = rows if isinstance(rows, list) else list(rows)
+        width = len(types) if types is not None else (len(rows[0]) if rows else 0)
+        self.types = []
+        self._columns = []
+        for col in range(width):
+            # One column at a time, so only a single temporary list is alive
+            values = [row_data[col] for row_data in rows]
+            kind = types[col] if types is not None else self._infer_type(values)
+            self.types.append(kind)
+            self._columns.append(self._make_column(kind, values))
+        self._size = len(rows)
+
+    @staticmethod
+    def _infer_type(values: List[Any]) -> type:
+        if not values:
+            return str
+        if all(isinstance(value, bool) for value in values):
+            return bool
+        if all(isinstance(value, int) and not isinstance(value, bool) for value in values):
+            return int
+        if all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in values):
+            return float
+        return str
+
+    @staticmethod
+    def _make_column(kind: type, values: List[Any]):
+        if kind is bool:
+            return Bitmap(values)
+        if kind in (int, float):
+            if np is not None:
+                return np.array(values, dtype=np.int64 if kind is int else np.float64)
+            return array.array("q" if kind is int else "d", values)
+        return list(values)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def column_count(self) -> int:
+        return len(self._columns)
+
+    def get(self, row: int, col: int) -> Any:
+        value = self._columns[col][row]
+        # Hand out plain Python values, not NumPy scalars
+        return value.item() if np is not None and isinstance(value, np.generic) else value
+
+    def _coerce(self, col: int, value) -> Any:
+        kind = self.types[col]
+        if kind is bool:
+            return to_bool(value)
+        if kind is int:
+            return int(value)
+        if kind is float:
+            return float(value)
+        return value
+
+    def _write(self, row: int, col: int, value) -> Any:
+        value = self._coerce(col, value)
+        self._columns[col][row] = value
+        return value
+
+    def _live(self, col: int):
+        """The values of a column, without the spare capacity of a NumPy column"""
+        store = self._columns[col]
+        if np is not None and isinstance(store, np.ndarray) and len(store) != self._size:
+            return store[:self._size]
+        return store
+
+    def _insert(self, index: int, rows: List[List[Any]]):
+        # Coerce every value first, so a bad value leaves the model unchanged
+        columns = [[self._coerce(col, row_data[col]) for row_data in rows] for col in range(len(self._columns))]
+        for col, values in enumerate(columns):
+            store = self._columns[col]
+            if np is not None and isinstance(store, np.ndarray):
+                self._columns[col] = self._insert_array(store, index, values)
+            elif isinstance(store, Bitmap) and index != self._size:
+                current = list(store)
+                current[index:index] = values
+                self._columns[col] = Bitmap(current)
+            elif isinstance(store, Bitmap):
+                for value in values:
+                    store.append(value)
+            elif index == self._size:
+                store.extend(values)  # array.array or list, amortized O(1) per row
+            else:
+                # A new store rather than a shift in place, a snapshot may share the old one
+                current = store[:index]
+                current.extend(values)
+                current.extend(store[index:])
+                self._columns[col] = current
+        self._size += len(rows)
+
+    def _insert_array(self, store, index: int, values: List[Any]):
+        """Insert into a NumPy column: in place at the end, growing the capacity geometrically when full"""
+        size = self._size
+        if index < size:
+            return np.insert(store[:size], index, values)
+        end = size + len(values)
+        if end > len(store):
+            grown = np.empty(max(end, 2 * len(store), 16), dtype=store.dtype)
+            grown[:size] = store[:size]
+            store = grown
+        store[size:end] = values
+        return store
+
+    def _delete(self, indices: List[int]):
+        removed = set(indices)
+        for col, store in enumerate(self._columns):
+            if np is not None and isinstance(store, np.ndarray):
+                self._columns[col] = np.delete(store[:self._size], indices)
+            else:
+                self._columns[col] = self._make_column(
+                    self.types[col], [value for row, value in enumerate(store) if row not in removed])
+        self._size -= len(indices)
+
+    def column(self, col: int) -> Sequence[Any]:
+        return self._live(col)
+
+    def snapshot(self) -> "ColumnarTableModel":
+        # Inserts and deletes build new column stores or append past the snapshot's size
+        snapshot = ColumnarTableModel([], types=list(self.types))
+        snapshot._columns = list(self._columns)
+        snapshot._size = self._size
+        return snapshot
+
+    def fill_column(self, col: int, value):
+        store = self._columns[col]
+        if isinstance(store, Bitmap):
+            store.fill(value)
+        elif np is not None and isinstance(store, np.ndarray):
+            store[:self._size] = self._coerce(col, value)
+        else:
+            super().fill_column(col, value)
+            return
+        self._sort_keys.pop(col, None)
+
+    def invert_column(self, col: int):
+        store = self._columns[col]
+        if not isinstance(store, Bitmap):
+            super().invert_column(col)
+            return
+        store.invert()
+        self._sort_keys.pop(col, None)
+
+    def count_true(self, col: int) -> int:
+        store = self._columns[col]
+        if isinstance(store, Bitmap):
+            return store.count()
+        return super().count_true(col)
+
+    def _numeric(self, col: int):
+        """The column as a NumPy array, or None when it cannot be one"""
+        if np is None or self.types[col] not in (bool, int, float):
+            return None
+        store = self._columns[col]
+        if isinstance(store, Bitmap):
+            return np.unpackbits(np.frombuffer(bytes(store._bits), dtype=np.uint8), bitorder="little")[:len(store)]
+        return self._live(col)
+
+    def sort_keys(self, col: int) -> Sequence[Any]:
+        # Typed columns compare natively, no per-row key objects needed
+        if self.types[col] in (bool, int, float):
+            return self._live(col)
+        return super().sort_keys(col)
+
+    def order_by(self, sort_spec: List[Tuple[int, bool]]) -> List[int]:
+        arrays = [self._numeric(col) for col, _ in sort_spec]
+        if not sort_spec or any(values is None for values in arrays):
+            return super().order_by(sort_spec)
+        # lexsort is stable and treats the last key as the most significant one
+        keys = [values if ascending else -values.astype(np.float64 if values.dtype.kind == "f" else np.int64)
+                for values, (_, ascending) in zip(arrays, sort_spec)]
+        return np.lexsort(keys[::-1]).tolist()
+
+    def select(self, col: int, low=None, high=None) -> List[int]:
+        values = self._numeric(col)
+        if values is None or self.types[col] is bool:
+            return super().select(col, low, high)
+        mask = np.ones(len(values), dtype=bool)
+        if low is not None:
+            mask &= values >= low
+        if high is not None:
+            mask &= values <= high
+        return np.flatnonzero(mask).tolist()
+
+    def aggregate(self, col: int, rows: Optional[Sequence[int]] = None) -> Dict[str, Any]:
+        values = self._numeric(col)
+        if values is None or self.types[col] is bool:
+            return super().aggregate(col, rows)
+        if rows is not None:
+            values = values[np.asarray(rows, dtype=np.intp)]
+        if not len(values):
+            return {"count": 0, "sum": 0, "min": None, "max": None, "avg": None}
+        return {
+            "count": len(values),
+            "sum": values.sum().item(),
+            "min": values.min().item(),
+            "max": values.max().item(),
+            "avg": values.mean().item(),
+        }
+
+
+class PagedTableModel(TableModel):
+    """
+    A TableModel over a data provider that is read one page at a time, for data that cannot be
+    loaded up front. Only the most recently used pages are kept; sorting and filtering are done
+    by the provider.
+    fetch: Callable - fetch(offset, limit, sort, filter) -> rows; sort is [(col, ascending), ...], filter is {col: query}
+    total_count: Callable - total_count(filter) -> number of rows matching filter
+    page_size: int - Rows per page (default: 50)
+    cache_pages: int - Pages kept in the LRU cache, the current page and its neighbours (default: 3)
+    """
+    def __init__(
+        self,
+        fetch: Callable[[int, int, List[Tuple[int, bool]], Dict[int, str]], Sequence[Sequence[Any]]],
+        total_count: Callable[[Dict[int, str]], int],
+        page_size: int = 50,
+        cache_pages: int = 3
+    ):
+        super().__init__()
+        self.fetch = fetch
+        self.total_count = total_count
+        self.page_size = page_size
+        self.cache_pages = cache_pages
+        self.sort_spec = []
+        self.filters = {}
+        self._pages = OrderedDict()
+        self._count = None
+        self._width = None
+
+    def set_query(self, sort_spec: Optional[List[Tuple[int, bool]]] = None, filters: Optional[Dict[int, str]] = None):
+        """Change the sort or filter passed to the provider, dropping the cached pages"""
+        if sort_spec is not None:
+            self.sort_spec = list(sort_spec)
+        if filters is not None:
+            self.filters = {col: query for col, query in filters.items() if query}
+        self._pages.clear()
+        self._sort_keys = {}
+        self._count = None
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-len(self) // self.page_size))
+
+    def page(self, page: int) -> List[List[Any]]:
+        """Rows of a page, fetched on first use"""
+        rows = self._pages.get(page)
+        if rows is None:
+            rows = [list(row_data) for row_data in self.fetch(page * self.page_size, self.page_size, self.sort_spec, self.filters)]
+            self._pages[page] = rows
+            if rows and self._width is None:
+                self._width = len(rows[0])
+            while len(self._pages) > self.cache_pages:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(page)
+        return rows
+
+    def prefetch(self, page: int):
+        """Load the pages next to page, so paging either way does not wait for the provider"""
+        for neighbour in (page + 1, page - 1):
+            if 0 <= neighbour < self.page_count and neighbour not in self._pages:
+                # Keep the current page the most recent, so a small cache evicts the others first
+                if page in self._pages:
+                    self._pages.move_to_end(page)
+                self.page(neighbour)
+        if page in self._pages:
+            self._pages.move_to_end(page)
+
+    def __len__(self) -> int:
+        if self._count is None:
+            self._count = self.total_count(self.filters)
+        return self._count
+
+    @property
+    def column_count(self) -> int:
+        if self._width is None and len(self):
+            self.page(0)
+        return self._width or 0
+
+    def get(self, row: int, col: int) -> Any:
+        return self.page(row // self.page_size)[row % self.page_size][col]
+
+    def row(self, row: int) -> List[Any]:
+        return list(self.page(row // self.page_size)[row % self.page_size])
+
+    def _write(self, row: int, col: int, value) -> Any:
+        # Only the cached page changes; on_change callbacks write back to the provider's store
+        self.page(row // self.page_size)[row % self.page_size][col] = value
+        return value
+
+    def order_by(self, sort_spec: List[Tuple[int, bool]]) -> List[int]:
+        """Rows come sorted from the provider, see set_query"""
+        return list(range(len(self)))
+
+
+class RingTableModel(TableModel):
+    """
+    At most max_rows rows in a ring buffer, for tables that follow a live feed. Appending to a
+    full buffer overwrites the oldest row in O(1); row 0 is always the oldest row kept.
+    max_rows: int - Number of rows kept
+    rows: Iterable[Sequence[Any]] - Initial rows, only the last max_rows are kept (default: ())
+    """
+    def __init__(self, max_rows: int, rows: Iterable[Sequence[Any]] = ()):
+        super().__init__()
+        if max_rows < 1:
+            raise ValueError("max_rows must be at least 1")
+        self.max_rows = max_rows
+        self._slots: List[Optional[List[Any]]] = [None] * max_rows
+        self._start = 0  # Slot of row 0
+        self._size = 0
+        self._width = None
+        self.evicted = 0  # Rows dropped for newer ones since the model was created
+        self.append(rows)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def column_count(self) -> int:
+        return self._width or 0
+
+    def _slot(self, row: int) -> int:
+        if not 0 <= row < self._size:
+            raise IndexError("row index out of range")
+        return (self._start + row) % self.max_rows
+
+    def get(self, row: int, col: int) -> Any:
+        return self._slots[self._slot(row)][col]
+
+    def _write(self, row: int, col: int, value) -> Any:
+        self._slots[self._slot(row)][col] = value
+        return value
+
+    def row(self, row: int) -> List[Any]:
+        return list(self._slots[self._slot(row)])
+
+    def append(self, rows: Iterable[Sequence[Any]]) -> int:
+        """Add rows at the end, dropping the oldest rows past max_rows; returns the number of rows dropped"""
+        evicted = 0
+        added = False
+        for row_data in rows:
+            row_data = row_data if isinstance(row_data, list) else list(row_data)
+            if self._width is None:
+                self._width = len(row_data)
+            if self._size < self.max_rows:
+                self._slots[(self._start + self._size) % self.max_rows] = row_data
+                self._size += 1
+            else:
+                # The slot of the oldest row takes the new one
+                self._slots[self._start] = row_data
+                self._start = (self._start + 1) % self.max_rows
+                evicted += 1
+            added = True
+        if added:
+            self._sort_keys.clear()  # Row indices shifted
+        self.evicted += evicted
+        return evicted
+
+    def snapshot(self) -> "RingTableModel":
+        # Appends replace slots of the list, the snapshot keeps its own list of them
+        snapshot = RingTableModel(self.max_rows)
+        snapshot._slots = list(self._slots)
+        snapshot._start, snapshot._size, snapshot._width = self._start, self._size, self._width
+        return snapshot
+
+    def clear(self):
+        """Remove every row"""
+        self._slots = [None] * self.max_rows
+        self._start = 0
+        self._size = 0
+        self._sort_keys.clear()
+
+    def _insert(self, index: int, rows: List[List[Any]]):
+        raise NotImplementedError("RingTableModel only appends rows, see append")
@@ -1,6 +1,8 @@
 import ttkbootstrap as ttk
 from PIL import Image, ImageTk
 from devopsnextgenx.utils.iconProvider import ICON_PATH
+from devopsnextgenx.utils.styleRegistry import style_registry
+from devopsnextgenx.utils.frameScheduler import frame_scheduler
 from enum import Enum
 from .PreviewFrame import PreviewFrame
 
@@ -10,12 +12,19 @@ class PreviewSide(Enum):
     LEFT = 'left'
     RIGHT = 'right'
 
+_END = object()  # Marks the end of a level in Treeview._insert_steps
+
 class Treeview(ttk.Frame):
-    def __init__(self, master: any, items, previewSide: PreviewSide = PreviewSide.RIGHT, key: str = 'name', style="darkly", height: int = 300):
+    def __init__(self, master: any, items=None, previewSide: PreviewSide = PreviewSide.RIGHT, key: str = 'name', style="darkly", height: int = 300,
+                 on_progress=None, source=None):
         super().__init__(master)
         
         self.key = key
-        self.items = items
+        self.on_progress = on_progress  # on_progress(nodes inserted, total nodes) while insert_items runs in chunks
+        self.source = source  # SqliteSource the children of a node are read from when it is opened
+        self._insert_jobs = []
+        self._nodes = {}  # tree item id -> data item
+        self.items = items if items is not None else source.children(None)
         self.style = ttk.Style()
         self.previewSide = previewSide
         self.height = height
@@ -23,35 +32,35 @@ class Treeview(ttk.Frame):
         self.start_y = 0
         self.start_height = self.height
         
-        # Configure treeview style with darkly theme
-        self.style.configure(
+        # Configure treeview style with darkly theme, once per theme for every tree
+        style_registry.define(
             "Treeview",
             background="#2a2d2e",
             foreground="white",
             fieldbackground="#2a2d2e",
             borderwidth=0,
-            font=("TkDefaultFont", 10)
-        )
-        
-        # Configure selection colors
-        self.style.map(
-            "Treeview",
-            background=[("selected", "#404040")],
-            foreground=[("selected", "#00bc8c")]
+            font=("TkDefaultFont", 10),
+            indent=15,
+            # Configure selection colors
+            map={
+                "background": [("selected", "#404040")],
+                "foreground": [("selected", "#00bc8c")],
+            },
         )
 
-        # Custom style for the paned window divider (sash)
-        self.style.configure("CustomPane.TPanedwindow", background="#555555", sashwidth=5, sashpad=1)
-        self.style.map("CustomPane.TPanedwindow", 
-                       background=[("active", "#00bc8c"), ("hover", "#999999")],
-                       sashrelief=[("active", "sunken")])
-        
-        # Set hover cursor for paned window sash
-        self.style.element_create("CustomSash", "from", "default")
-        if self.previewSide in [PreviewSide.LEFT, PreviewSide.RIGHT]:
-            self.style.configure("CustomPane.TPanedwindow", sashcursor="sb_h_double_arrow")
-        else:
-            self.style.configure("CustomPane.TPanedwindow", sashcursor="sb_v_double_arrow")
+        # Custom style for the paned window divider (sash), with the hover cursor of the orientation
+        style_registry.element("CustomSash", "from", "default")
+        self.pane_style = style_registry.intern(
+            "TPanedwindow",
+            background="#555555",
+            sashwidth=5,
+            sashpad=1,
+            sashcursor="sb_h_double_arrow" if self.previewSide in [PreviewSide.LEFT, PreviewSide.RIGHT] else "sb_v_double_arrow",
+            map={
+                "background": [("active", "#00bc8c"), ("hover", "#999999")],
+                "sashrelief": [("active", "sunken")],
+            },
+        )
 
         # Setup tree icons
         self.im_open = Image.open(ICON_PATH["arrow"])
@@ -62,13 +71,10 @@ class Treeview(ttk.Frame):
         self.img_close = ImageTk.PhotoImage(self.im_close, size=(15, 15))
         self.img_empty = ImageTk.PhotoImage(self.im_empty, size=(15, 15))
 
-        # Create custom tree indicator elements
-        self.style.configure("Treeview", indent=15)
-
         # Configure tree layout
-        self.style.layout(
+        style_registry.define(
             'Treeview.Item',
-            [
+            layout=[
                 ('Treeitem.padding',
                 {'sticky': 'nsew',
                 'children': [
@@ -86,9 +92,9 @@ class Treeview(ttk.Frame):
 
         # Create a PanedWindow with proper orientation based on previewSide
         if self.previewSide in [PreviewSide.LEFT, PreviewSide.RIGHT]:
-            self.paned_window = ttk.PanedWindow(self, orient="horizontal", height=self.height, style="CustomPane.TPanedwindow")
+            self.paned_window = ttk.PanedWindow(self, orient="horizontal", height=self.height, style=self.pane_style)
         else:
-            self.paned_window = ttk.PanedWindow(self, orient="vertical", height=self.height, style="CustomPane.TPanedwindow")
+            self.paned_window = ttk.PanedWindow(self, orient="vertical", height=self.height, style=self.pane_style)
         
         self.paned_window.grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
 
@@ -156,11 +162,12 @@ class Treeview(ttk.Frame):
         # Create a resizer frame at the bottom
         self.resizer = ttk.Frame(self, height=8, cursor="sb_v_double_arrow")
         self.resizer.grid(row=2, column=0, sticky="ew")
-        self.resizer.configure(style="Resizer.TFrame")
         
-        # Create a custom style for the resizer
-        self.style.configure("Resizer.TFrame", background="#777777")
-        self.style.map("Resizer.TFrame", background=[("active", "#999999")])
+        # Create custom styles for the resizer and its hover and drag states
+        style_registry.define("Resizer.TFrame", background="#777777", map={"background": [("active", "#999999")]})
+        style_registry.define("ResizerHover.TFrame", background="#999999")
+        style_registry.define("ResizerActive.TFrame", background="#00bc8c")
+        self.resizer.configure(style="Resizer.TFrame")
         
         # Bind events for resizing
         self.resizer.bind("<Enter>", self._on_resizer_enter)
@@ -173,25 +180,94 @@ class Treeview(ttk.Frame):
         self.grid_rowconfigure(2, weight=0)
 
     def insert_items(self, items, parent=''):
-        """Insert items into treeview and start in a closed state"""
-        for item in items:
+        """
+        Insert items into treeview and start in a closed state. The nodes are inserted in
+        frame-budgeted chunks, so a large hierarchy does not freeze the window; the first
+        chunk is inserted before this returns.
+        """
+        job = frame_scheduler(self).submit(
+            self._insert_steps(items, parent),
+            total=self._count_items(items),
+            on_progress=self.on_progress,
+            on_done=self._forget_finished_inserts,
+        )
+        if not job.finished:
+            self._insert_jobs.append(job)
+
+    def _forget_finished_inserts(self):
+        self._insert_jobs = [job for job in self._insert_jobs if not job.finished]
+
+    def finish_inserts(self):
+        """Insert every node still waiting to be inserted by insert_items now"""
+        for job in list(self._insert_jobs):
+            job.finish()
+
+    def _count_items(self, items) -> int:
+        count = 0
+        stack = [items]
+        while stack:
+            for item in stack.pop():
+                count += 1
+                if isinstance(item, dict) and item.get('children'):
+                    stack.append(item['children'])
+        return count
+
+    def _insert_steps(self, items, parent):
+        """Insert the items depth first, one node per step, parents before their children"""
+        stack = [(parent, iter(items))]
+        while stack:
+            parent, children = stack[-1]
+            item = next(children, _END)
+            if item is _END:
+                stack.pop()
+                continue
             item['open'] = False
             
-            if isinstance(item, dict) and 'children' in item and item['children']:
-                # Insert parent node with proper tag
+            if self._has_children(item):
+                # Insert parent node with proper tag, then its children unless they are read when it opens
                 item_id = self.treeview.insert(parent, 'end', text=item[self.key], tags=["closed"])
-                # Insert children recursively
-                self.insert_items(item['children'], item_id)
+                if item.get('children'):
+                    stack.append((item_id, iter(item['children'])))
             else:
                 # Insert leaf node with leaf tag (no children)
-                self.treeview.insert(parent, 'end', text=item[self.key], tags=["leaf"])
+                item_id = self.treeview.insert(parent, 'end', text=item[self.key], tags=["leaf"])
+            self._nodes[item_id] = item
+            yield
+
+    @staticmethod
+    def _has_children(item) -> bool:
+        """Whether an item has children, loaded or still in the source"""
+        return isinstance(item, dict) and (bool(item.get('children')) or bool(item.get('has_children')))
+
+    def _load_children(self, item_id, item):
+        """Read the children of an opened node from the source and insert them"""
+        item['children'] = self.source.children(item['id'])
+        self.insert_items(item['children'], item_id)
+
+    def _unload_children(self, item_id, item):
+        """Drop the children of a closed node, they are read again when it opens"""
+        self.finish_inserts()
+        stack = list(self.treeview.get_children(item_id))
+        while stack:
+            child = stack.pop()
+            stack.extend(self.treeview.get_children(child))
+            self._nodes.pop(child, None)
+        self.treeview.delete(*self.treeview.get_children(item_id))
+        item['children'] = None
+
+    def destroy(self):
+        """Drop the pending inserts before destroying the widget"""
+        for job in self._insert_jobs:
+            job.cancel()
+        self._insert_jobs = []
+        super().destroy()
 
     def _find_item(self, items, key, value):
         """Recursively find item in nested items by key and value"""
         for item in items:
             if item.get(key) == value:
                 return item
-            if 'children' in item:
+            if item.get('children'):
                 found = self._find_item(item['children'], key, value)
                 if found:
                     return found
@@ -202,14 +278,14 @@ class Treeview(ttk.Frame):
         selected_items = self.treeview.selection()
         if selected_items:
             selected_item = selected_items[0]
-            item_data = self.treeview.item(selected_item)
-            item_name = item_data['text']
             
             # Find the corresponding data item
-            item = self._find_item(self.items, self.key, item_name)
+            item = self._nodes.get(selected_item)
+            if item is None:
+                item = self._find_item(self.items, self.key, self.treeview.item(selected_item)['text'])
             
             # Check if this is a leaf node (no children)
-            is_leaf = not (isinstance(item, dict) and 'children' in item and item['children'])
+            is_leaf = not self._has_children(item)
             
             if not is_leaf:
                 # Toggle the item's open state in the treeview
@@ -219,8 +295,12 @@ class Treeview(ttk.Frame):
                 # Update tags based on the new state
                 if not current_open_state:  # Will be opened
                     self.treeview.item(selected_item, tags=["open"])
+                    if self.source is not None and item.get('children') is None:
+                        self._load_children(selected_item, item)
                 else:  # Will be closed
                     self.treeview.item(selected_item, tags=["closed"])
+                    if self.source is not None:
+                        self._unload_children(selected_item, item)
                 
                 # Update the corresponding data item
                 if item:
@@ -243,7 +323,6 @@ class Treeview(ttk.Frame):
     def _on_resizer_enter(self, event):
         """Visual feedback when mouse enters the resizer area"""
         self.resizer.configure(style="ResizerHover.TFrame")
-        self.style.configure("ResizerHover.TFrame", background="#999999")
     
     def _on_resizer_leave(self, event):
         """Reset visual feedback when mouse leaves the resizer area"""
@@ -256,7 +335,6 @@ class Treeview(ttk.Frame):
         self.start_y = event.y_root
         self.start_height = self.winfo_height()
         self.resizer.configure(style="ResizerActive.TFrame")
-        self.style.configure("ResizerActive.TFrame", background="#00bc8c")
     
     def _on_resizer_release(self, event):
         """End the resizing operation"""
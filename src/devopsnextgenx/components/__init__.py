@@ -1,7 +1,12 @@
 from devopsnextgenx.components.Carousel import Carousel
 from devopsnextgenx.components.Table import Table, Header, WidgetType
+from devopsnextgenx.components.TableModel import TableModel, ListTableModel, ColumnarTableModel, PagedTableModel, RingTableModel
 from devopsnextgenx.components.TreeTable import Treeview, PreviewSide
+from devopsnextgenx.components.SqliteSource import SqliteSource
+from devopsnextgenx.components.FileTail import FileTail
+from devopsnextgenx.components.TableFeed import LiveFeed
+from devopsnextgenx.components.TableFormat import Threshold, ColorScale, Match
 from devopsnextgenx.components.ScrollFrame import ScrollFrame
 from devopsnextgenx.components.StatusBar import StatusBar
 
-__all__ = [Carousel, ScrollFrame, StatusBar, Table, Treeview, Header, WidgetType]
\ No newline at end of file
+__all__ = [Carousel, ScrollFrame, StatusBar, Table, Treeview, Header, WidgetType, TableModel, ListTableModel, ColumnarTableModel, PagedTableModel, RingTableModel, SqliteSource, FileTail, LiveFeed, Threshold, ColorScale, Match]
\ No newline at end of file
@@ -2,4 +2,6 @@ from devopsnextgenx.utils.iconProvider import get_icon_path, list_icons
 from devopsnextgenx.utils.windowPosition import center_window, place_window_bottom_right, place_frame
 from devopsnextgenx.utils.guiUtils import *
 from devopsnextgenx.utils.style import *
+from devopsnextgenx.utils.styleRegistry import StyleRegistry, style_registry
+from devopsnextgenx.utils.frameScheduler import FrameScheduler, FrameJob, frame_scheduler, status_progress
 # __all__ = [get_icon_path, list_icons, center_window, place_window_bottom_right, place_frame]
\ No newline at end of file
@@ -0,0 +1,135 @@
+from collections import deque
+from time import perf_counter
+from typing import Any, Callable, Iterable, Optional
+
+ProgressHook = Callable[[int, Optional[int]], None]
+
+
+class FrameJob:
+    """
+    A long UI job split into steps, run by a FrameScheduler between frames. Each step is one
+    item of the job's iterable (a row, a tree node, ...); the values it yields are ignored.
+    """
+    def __init__(self, scheduler: "FrameScheduler", steps: Iterable[Any], total: Optional[int],
+                 on_progress: Optional[ProgressHook], on_done: Optional[Callable[[], None]]):
+        self._scheduler = scheduler
+        self._steps = iter(steps)
+        self.total = total
+        self.done = 0  # Steps run so far
+        self.finished = False
+        self.on_progress = on_progress
+        self.on_done = on_done
+
+    def _run(self, deadline: float) -> bool:
+        """Run steps until perf_counter() reaches deadline, at least one; True when no step is left"""
+        steps = self._steps
+        try:
+            while True:
+                next(steps)
+                self.done += 1
+                if perf_counter() >= deadline:
+                    return False
+        except StopIteration:
+            return True
+
+    def finish(self):
+        """Run the remaining steps now, e.g. before changing what the job is building"""
+        if not self.finished:
+            self._scheduler._run(self, float("inf"))
+
+    def cancel(self):
+        """Drop the remaining steps, on_done is not called"""
+        if not self.finished:
+            self.finished = True
+            self._scheduler._jobs.remove(self)
+
+
+class FrameScheduler:
+    """
+    Cooperative scheduler for long UI jobs: runs their steps through after() in slices of at most
+    budget_ms per frame, so the mainloop keeps redrawing and handling input while a large table
+    or tree is built. Jobs run in the order they were submitted.
+    widget: Any - Widget whose after() drives the scheduler
+    budget_ms: float - Time spent on steps per frame, in milliseconds (default: 8)
+    """
+    def __init__(self, widget, budget_ms: float = 8.0):
+        self.widget = widget
+        self.budget = budget_ms / 1000
+        self._jobs = deque()
+        self._after_id = None
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._jobs)
+
+    def submit(self, steps: Iterable[Any], total: Optional[int] = None, on_progress: Optional[ProgressHook] = None,
+               on_done: Optional[Callable[[], None]] = None, start_now: bool = True) -> FrameJob:
+        """
+        Schedule a job and return it.
+        steps: Iterable[Any] - Iterating runs the job, one step per item
+        total: Optional[int] - Number of steps, passed to on_progress (default: None)
+        on_progress: Optional[Callable[[int, Optional[int]], None]] - Called with (steps done, total)
+                     after every slice, see status_progress (default: None)
+        on_done: Optional[Callable[[], None]] - Called once every step ran (default: None)
+        start_now: bool - Run the first slice before returning, so the first results show at once (default: True)
+        """
+        job = FrameJob(self, steps, total, on_progress, on_done)
+        self._jobs.append(job)
+        if start_now:
+            self._run(job, perf_counter() + self.budget)
+        self._schedule()
+        return job
+
+    def _schedule(self):
+        if self._jobs and self._after_id is None:
+            # A short delay rather than after_idle, so redraws and input get their turn between slices
+            self._after_id = self.widget.after(1, self._tick)
+
+    def _tick(self):
+        self._after_id = None
+        deadline = perf_counter() + self.budget
+        try:
+            for job in list(self._jobs):
+                if not job.finished:
+                    self._run(job, deadline)
+                if perf_counter() >= deadline:
+                    break
+        finally:
+            self._schedule()
+
+    def _run(self, job: FrameJob, deadline: float):
+        try:
+            complete = job._run(deadline)
+        except Exception:
+            job.cancel()  # A failing job is not retried every frame
+            raise
+        if complete:
+            job.finished = True
+            self._jobs.remove(job)
+        if job.on_progress is not None:
+            job.on_progress(job.done, job.total)
+        if complete and job.on_done is not None:
+            job.on_done()
+
+
+def frame_scheduler(widget) -> FrameScheduler:
+    """The FrameScheduler shared by every widget of widget's Tk root, so they share one frame budget"""
+    root = widget._root()
+    scheduler = getattr(root, "_frame_scheduler", None)
+    if scheduler is None:
+        scheduler = root._frame_scheduler = FrameScheduler(root)
+    return scheduler
+
+
+def status_progress(status_bar, text: str) -> ProgressHook:
+    """
+    on_progress hook that shows a job's progress on a StatusBar.
+    status_bar: StatusBar - Status bar to update
+    text: str - Status text, followed by the count of steps done
+    """
+    def update(done: int, total: Optional[int]):
+        if total:
+            status_bar.update_status(f"{text} {done}/{total}", done / total)
+        else:
+            status_bar.update_status(f"{text} {done}")
+    return update
@@ -0,0 +1,119 @@
+from typing import Any, Dict, List, Optional, Set, Tuple
+import ttkbootstrap as ttk
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable form of a style option value (fonts, state maps and layouts are lists and dicts)"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class StyleRegistry:
+    """
+    Process-wide registry of the ttk styles used by the components. Every style is configured
+    once per theme: defining a style again with the same options does nothing, so creating
+    another Table does not restyle the widgets of the existing ones. Dynamic styles are interned
+    by their options, and everything is applied again only when the theme changes.
+    style: Optional[ttk.Style] - The style to configure (default: ttk.Style() on first use)
+    """
+    def __init__(self, style: Optional[ttk.Style] = None):
+        self._style = style
+        self._bound = False  # Whether <<ThemeChanged>> reaches refresh
+        self._theme: Optional[str] = None  # Theme the applied styles belong to
+        self._elements: Dict[str, Tuple] = {}  # element name -> (args, kwargs) of element_create
+        self._specs: Dict[str, Tuple[Dict, Optional[Dict], Optional[List]]] = {}  # name -> (options, map, layout)
+        self._frozen: Dict[str, Tuple] = {}  # name -> hashable spec, to detect redefinitions
+        self._applied: Set[str] = set()  # Styles configured in self._theme
+        self._created: Set[str] = set()  # Elements created in self._theme
+        self._interned: Dict[Tuple, str] = {}  # (base, spec) -> interned style name
+
+    @property
+    def style(self) -> ttk.Style:
+        if self._style is None:
+            self._style = ttk.Style()
+        if not self._bound:
+            master = getattr(self._style, "master", None)
+            if master is not None:
+                # Tk sends <<ThemeChanged>> to every widget; refresh only acts on the first
+                master.bind("<<ThemeChanged>>", lambda e: self.refresh(), add="+")
+            self._bound = True
+        return self._style
+
+    def refresh(self):
+        """Apply every registered element and style again if the theme changed since they were applied"""
+        theme = self.style.theme_use()
+        if theme == self._theme:
+            return
+        self._theme = theme
+        self._applied.clear()
+        self._created.clear()
+        for name in self._elements:
+            self._create_element(name)
+        for name in self._specs:
+            self._apply(name)
+
+    def define(self, name: str, map: Optional[Dict[str, List]] = None, layout: Optional[List] = None, **options) -> str:
+        """
+        Configure a named style once per theme and return its name.
+        name: str - Style name, like "Row.TLabel"
+        map: Optional[Dict[str, List]] - State specific options, as passed to Style.map (default: None)
+        layout: Optional[List] - Layout, as passed to Style.layout (default: None)
+        options: Options passed to Style.configure
+        """
+        self.refresh()
+        frozen = (_freeze(options), _freeze(map), _freeze(layout))
+        if self._frozen.get(name) == frozen and name in self._applied:
+            return name
+        self._specs[name] = (options, map, layout)
+        self._frozen[name] = frozen
+        self._apply(name)
+        return name
+
+    def element(self, name: str, *args, **kwargs) -> str:
+        """Create a style element once per theme, arguments as for Style.element_create"""
+        self.refresh()
+        if name not in self._elements:
+            self._elements[name] = (args, kwargs)
+            self._create_element(name)
+        return name
+
+    def intern(self, base: str, map: Optional[Dict[str, List]] = None, **options) -> str:
+        """
+        Name of a style derived from base with the given options. Equal options give the same
+        name, so changing a widget's look switches its style instead of reconfiguring a style
+        other widgets share.
+        base: str - Style to derive from, like "Horizontal.TProgressbar"
+        map: Optional[Dict[str, List]] - State specific options (default: None)
+        options: Options passed to Style.configure
+        """
+        key = (base, _freeze(options), _freeze(map))
+        name = self._interned.get(key)
+        if name is None:
+            name = self._interned[key] = f"S{len(self._interned) + 1}.{base}"
+        return self.define(name, map=map, **options)
+
+    def _create_element(self, name: str):
+        if name in self._created:
+            return
+        args, kwargs = self._elements[name]
+        try:
+            self.style.element_create(name, *args, **kwargs)
+        except Exception:
+            pass  # Created before the registry saw it, in this theme
+        self._created.add(name)
+
+    def _apply(self, name: str):
+        options, map, layout = self._specs[name]
+        if layout is not None:
+            self.style.layout(name, layout)
+        if options:
+            self.style.configure(name, **options)
+        if map:
+            self.style.map(name, **map)
+        self._applied.add(name)
+
+
+style_registry = StyleRegistry()
@@ -0,0 +1,304 @@
+"""
+Headless benchmarks of Table: construction, update_data, sort, selection and editing of N rows x M
+columns covering every WidgetType, in the widget, virtual, canvas and placed layout modes, and a chunked
+load_csv of --load-rows rows into a columnar model. Times are the best of
+--repeat runs; a separate run under tracemalloc gives the peak memory, and the Tk widgets under the
+table are counted after construction. Results are written as JSON.
+
+Without a DISPLAY a local Xvfb server is started for the run.
+
+    python tests/benchmark.py --rows 2000 --columns 7 --output bench.json
+    python tests/benchmark.py --rows 2000 --columns 7 --baseline bench.json --threshold 0.2
+
+With --baseline the run is compared to an earlier result file and exits with status 1 when a
+timing or memory peak got worse by more than --threshold (0.2 = 20%).
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+# Add src directory to Python path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.append(src_path)
+
+MODES = {
+    "widgets": {},
+    "virtual": {"virtual": True, "visible_rows": 30},
+    "canvas": {"renderer": "canvas"},
+    "placed": {"layout": "place"},
+}
+NOISE_SECONDS = 0.002  # Differences below this are timer noise, never a regression
+
+
+def start_xvfb(display: str = ":99") -> Optional[subprocess.Popen]:
+    """Start Xvfb on display and point DISPLAY at it, unless a display is already set"""
+    if os.environ.get("DISPLAY"):
+        return None
+    if shutil.which("Xvfb") is None:
+        sys.exit("No DISPLAY and no Xvfb: install Xvfb (e.g. apt install xvfb) or run under a display")
+    process = subprocess.Popen(["Xvfb", display, "-screen", "0", "1920x1080x24", "-nolisten", "tcp"],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    socket = f"/tmp/.X11-unix/X{display.lstrip(':')}"
+    deadline = time.monotonic() + 10
+    while not os.path.exists(socket):
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            sys.exit(f"Xvfb did not start on {display}")
+        time.sleep(0.05)
+    os.environ["DISPLAY"] = display
+    return process
+
+
+def make_headers(columns: int) -> List[Any]:
+    """Headers cycling through every WidgetType"""
+    from devopsnextgenx.components.Table import Header, WidgetType
+    types = list(WidgetType)
+    headers = []
+    for col in range(columns):
+        widget_type = types[col % len(types)]
+        headers.append(Header(text=f"{widget_type.value.title()} {col}", type=widget_type,
+                              editable=widget_type in (WidgetType.TEXT, WidgetType.ENTRY), sortable=True))
+    return headers
+
+
+def make_rows(rows: int, headers: List[Any], seed: int = 0) -> List[List[Any]]:
+    from devopsnextgenx.components.Table import WidgetType
+    data = []
+    for row in range(rows):
+        values = []
+        for col, header in enumerate(headers):
+            match header.type:
+                case WidgetType.TEXT:
+                    values.append(f"Row {(row * 7919 + seed) % rows} col {col}")
+                case WidgetType.RADIOBTN:
+                    values.append(row == seed % rows)
+                case WidgetType.CHECKBOX | WidgetType.SQTOGGLE | WidgetType.RNDTOGGLE:
+                    values.append((row + seed) % 2 == 0)
+                case WidgetType.ENTRY:
+                    values.append(str(row + seed))
+                case _:
+                    values.append("Go")
+        data.append(values)
+    return data
+
+
+def count_widgets(widget) -> int:
+    """Tk widgets under widget, itself included"""
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def timed(func: Callable[[], Any], settle: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """Best and median time of repeat runs of func, each followed by settle (pending idle work)"""
+    times = []
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        settle()
+        times.append(perf_counter() - start)
+    return {"seconds": min(times), "median": statistics.median(times)}
+
+
+def peak_kib(func: Callable[[], Any]) -> float:
+    """Peak memory allocated while func runs, in KiB"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def bench_mode(root, options: Dict[str, Any], rows: int, columns: int, repeat: int,
+               clicks: int) -> Dict[str, Dict[str, float]]:
+    from devopsnextgenx.components.Table import Table, WidgetType
+    headers = make_headers(columns)
+    data = [make_rows(rows, headers, seed) for seed in range(2)]
+    settle = root.update_idletasks
+    results = {}
+    tables = []
+
+    def construct():
+        table = Table(root, headers=make_headers(columns), data=[list(row) for row in data[0]], **options)
+        table._finish_build()  # The rows past the first screen, normally built between frames
+        tables.append(table)
+
+    def destroy_tables():
+        while tables:
+            tables.pop().destroy()
+        settle()
+
+    # Construction: a fresh table per run, destroyed outside the timing
+    times = []
+    for _ in range(repeat):
+        start = perf_counter()
+        construct()
+        settle()
+        times.append(perf_counter() - start)
+        widgets = count_widgets(tables[-1])
+        destroy_tables()
+    memory = peak_kib(construct)
+    destroy_tables()
+    results["construct"] = {"seconds": min(times), "median": statistics.median(times), "peak_kib": memory,
+                            "widgets": widgets}
+
+    table = Table(root, headers=headers, data=[list(row) for row in data[0]], **options)
+    table._finish_build()
+    settle()
+    flip = [0]
+
+    def update():
+        flip[0] ^= 1
+        table.update_data([list(row) for row in data[flip[0]]])
+    results["update_data"] = {**timed(update, settle, repeat), "peak_kib": peak_kib(update)}
+
+    def sort():
+        flip[0] ^= 1
+        table.sort([(0, bool(flip[0]))])
+    results["sort"] = {**timed(sort, settle, repeat), "peak_kib": peak_kib(sort)}
+    table.sort([])
+
+    shown = max(1, min(len(table._rows), rows))
+
+    def select():
+        for click in range(clicks):
+            table._handle_cell_click(click % shown + 1, 0)
+    results["select"] = {**timed(select, settle, repeat), "peak_kib": peak_kib(select), "operations": clicks}
+
+    entry_cols = [col for col, header in enumerate(headers) if header.type == WidgetType.ENTRY]
+    if entry_cols:
+        col = entry_cols[0]
+
+        def edit():
+            for click in range(clicks):
+                table_row = table._rows[click % shown]
+                entry = table_row.cells[col]
+                if not hasattr(entry, "delete"):
+                    # Drawn or edited on demand: go through the model as the shared editor does
+                    table._store_value(table_row.index, col, str(click), table_row)
+                    continue
+                entry.delete(0, "end")
+                entry.insert(0, str(click))
+                table._handle_entry_change(table_row.index, col, entry)
+        results["edit"] = {**timed(edit, settle, repeat), "peak_kib": peak_kib(edit), "operations": clicks}
+
+        def set_cells():
+            flip[0] ^= 1
+            table.set_cells({(row, col): str(row + flip[0]) for row in range(rows)})
+            table.flush_cells()
+        results["set_cells"] = {**timed(set_cells, settle, repeat), "peak_kib": peak_kib(set_cells), "operations": rows}
+
+    table.destroy()
+    settle()
+    return results
+
+
+def bench_load(root, rows: int, repeat: int) -> Dict[str, float]:
+    """Chunked load_csv of rows rows into a virtual table over a ColumnarTableModel"""
+    from devopsnextgenx.components.Table import Table, Header, WidgetType
+    from devopsnextgenx.components.TableModel import ColumnarTableModel
+    headers = [Header(text="name"), Header(text="count", dtype=int), Header(text="score", dtype=float),
+               Header(text="done", type=WidgetType.CHECKBOX)]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "load.csv")
+        with open(path, "w") as stream:
+            stream.write("name,count,score,done\n")
+            stream.writelines(f"row {i},{i},{i / 2},{i % 2}\n" for i in range(rows))
+        table = Table(root, headers=headers, data=ColumnarTableModel([], types=[str, int, float, bool]), virtual=True)
+
+        def load():
+            table.load_csv(path, chunk_size=100).finish()
+        result = {**timed(load, root.update_idletasks, repeat), "peak_kib": peak_kib(load), "operations": rows}
+        table.destroy()
+    return result
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Descriptions of the measurements that got worse than baseline by more than threshold"""
+    regressions = []
+    for name, current in results["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None:
+            continue
+        for metric in ("seconds", "peak_kib"):
+            old, new = previous.get(metric), current.get(metric)
+            if not old or new is None:
+                continue
+            if metric == "seconds" and new - old < NOISE_SECONDS:
+                continue
+            change = new / old - 1
+            if change > threshold:
+                regressions.append(f"{name} {metric}: {old:.4g} -> {new:.4g} (+{change:.0%})")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000, help="Data rows (default: 1000)")
+    parser.add_argument("--columns", type=int, default=7, help="Columns, cycling through the widget types (default: 7)")
+    parser.add_argument("--modes", default=",".join(MODES), help=f"Comma separated modes (default: {','.join(MODES)})")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per measurement, the best is kept (default: 3)")
+    parser.add_argument("--clicks", type=int, default=100, help="Selections and edits per run (default: 100)")
+    parser.add_argument("--load-rows", type=int, default=200_000, help="Rows of the load_csv run, 0 to skip (default: 200000)")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", help="Compare with this earlier JSON result file")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown over the baseline (default: 0.2)")
+    parser.add_argument("--display", default=":99", help="Display for Xvfb when DISPLAY is not set (default: :99)")
+    args = parser.parse_args(argv)
+
+    xvfb = start_xvfb(args.display)
+    try:
+        import ttkbootstrap as ttk
+        root = ttk.Window()
+        root.withdraw()
+        results = {
+            "meta": {
+                "rows": args.rows,
+                "columns": args.columns,
+                "repeat": args.repeat,
+                "load_rows": args.load_rows,
+                "python": platform.python_version(),
+                "tk": str(root.tk.call("info", "patchlevel")),
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            },
+            "results": {},
+        }
+        for mode in args.modes.split(","):
+            for name, result in bench_mode(root, MODES[mode], args.rows, args.columns, args.repeat, args.clicks).items():
+                results["results"][f"{mode}/{name}"] = result
+                extra = f" {result['widgets']} widgets" if "widgets" in result else ""
+                print(f"{mode}/{name:<12} {result['seconds'] * 1000:10.2f} ms {result['peak_kib']:10.1f} KiB{extra}")
+        if args.load_rows:
+            result = results["results"]["columnar/load_csv"] = bench_load(root, args.load_rows, args.repeat)
+            print(f"columnar/load_csv    {result['seconds'] * 1000:10.2f} ms {result['peak_kib']:10.1f} KiB")
+        root.destroy()
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait()
+
+    if args.output:
+        with open(args.output, "w") as stream:
+            json.dump(results, stream, indent=2)
+    if args.baseline:
+        with open(args.baseline) as stream:
+            regressions = compare(results, json.load(stream), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print(f"No regression over {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -302,19 +302,17 @@ class Demo(ttk.Window):
     def sort_by_age(self, ascending=True):
         """Sort table data by age"""
         sorted_data = sorted(self.table.data, key=lambda x: x[2], reverse=not ascending)
-        self.table.update_data(sorted_data)
+        self.table.update_data(sorted_data, key=lambda row: row[0])
 
     def sort_by_email(self, ascending=True):
         """Sort table data by email"""
         sorted_data = sorted(self.table.data, key=lambda x: x[3], reverse=not ascending)
-        self.table.update_data(sorted_data)
+        self.table.update_data(sorted_data, key=lambda row: row[0])
 
     def remove_user(self, row):
         """Remove a user from the table"""
         if row < len(self.table.data):
-            data = self.table.data.copy()
-            data.pop(row)
-            self.table.update_data(data)
+            self.table.delete_rows([row])
 
 if __name__ == "__main__":
     app = Demo()
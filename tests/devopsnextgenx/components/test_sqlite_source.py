@@ -0,0 +1,90 @@
+import os
+import sys
+
+# Add src directory to Python path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'src'))
+sys.path.append(src_path)
+
+import sqlite3
+import pytest
+from devopsnextgenx.components.SqliteSource import SqliteSource
+from devopsnextgenx.components.TableModel import PagedTableModel
+
+
+@pytest.fixture
+def connection():
+    """In-memory database with 95 people, every 10th inactive, in a 3 level hierarchy"""
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE people (id INTEGER PRIMARY KEY, name TEXT, age INTEGER, active INTEGER, manager INTEGER)")
+    connection.executemany(
+        "INSERT INTO people VALUES (?, ?, ?, ?, ?)",
+        [(i, f"Person {i:02d}", 20 + i % 40, int(i % 10 != 0), None if i < 3 else (i % 3 if i < 12 else 3 + i % 9))
+         for i in range(95)]
+    )
+    return connection
+
+
+@pytest.fixture
+def source(connection):
+    return SqliteSource(connection, "people", ["name", "age", "active"], key="id", parent_column="manager",
+                        boolean_columns=[2])
+
+
+def test_fetch_pages(source):
+    """Test that pages are read with LIMIT/OFFSET in key order"""
+    assert source.total_count({}) == 95
+    rows = source.fetch(10, 5, [], {})
+    assert rows == [(f"Person {i}", 20 + i % 40, int(i % 10 != 0)) for i in range(10, 15)]
+
+
+def test_keyset_matches_offset(source, connection):
+    """Test that paging forward reads by keyset and gives the pages read by offset"""
+    spec = [(1, True)]
+    statements = []
+    connection.set_trace_callback(statements.append)
+    pages = [source.fetch(offset, 10, spec, {}) for offset in range(0, 95, 10)]
+    connection.set_trace_callback(None)
+    assert "OFFSET" in statements[0]
+    assert all("OFFSET" not in statement for statement in statements[1:])
+    fresh = SqliteSource(connection, "people", ["name", "age", "active"], key="id")
+    assert pages[3] == fresh.fetch(30, 10, spec, {})
+    rows = [row for page in pages for row in page]
+    assert len(rows) == 95 and rows == sorted(rows, key=lambda row: row[1])
+
+
+def test_descending_sort(source):
+    """Test that descending sorts are pushed to SQL"""
+    rows = source.fetch(0, 3, [(1, False)], {})
+    assert [row[1] for row in rows] == [59, 59, 58]
+
+
+def test_filters_in_sql(source):
+    """Test the filter queries of Table translated to SQL"""
+    assert source.total_count({0: "person 1"}) == 10
+    assert source.total_count({0: "^Person 9"}) == 5
+    assert source.total_count({1: "20..22"}) == 9
+    assert source.total_count({2: "false"}) == 10
+    assert source.total_count({0: "50%"}) == 0
+    rows = source.fetch(0, 50, [], {1: ">=58", 2: "true"})
+    assert {row[1] for row in rows} == {58, 59}
+
+
+def test_paged_model(source):
+    """Test that Table's paged model reads the source"""
+    model = source.model(page_size=10)
+    assert isinstance(model, PagedTableModel)
+    assert len(model) == 95 and model.page_count == 10
+    model.set_query(sort_spec=[(0, False)], filters={2: "true"})
+    assert len(model) == 85
+    assert model.get(0, 0) == "Person 94"
+
+
+def test_children_by_parent(source):
+    """Test that tree children are read by parent id"""
+    roots = source.children()
+    assert [root["id"] for root in roots] == [0, 1, 2]
+    assert all(root["has_children"] and root["children"] is None for root in roots)
+    leaves = source.children(12)
+    assert leaves == []
+    children = source.children(0)
+    assert [child["name"] for child in children] == ["Person 03", "Person 06", "Person 09"]
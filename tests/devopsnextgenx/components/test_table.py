@@ -5,15 +5,28 @@ import sys
 src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'src'))
 sys.path.append(src_path)
 
+import queue
 import pytest
 import ttkbootstrap as ttk
 from devopsnextgenx.components.Table import Table, Header, WidgetType
+from devopsnextgenx.components.TableModel import ColumnarTableModel, RingTableModel, sort_key
+from devopsnextgenx.components.FileTail import FileTail
+from devopsnextgenx.components.TableFeed import LiveFeed
+from devopsnextgenx.components.TableFormat import Threshold, Match
+from devopsnextgenx.components.TableCanvas import CanvasCell
+from devopsnextgenx.utils.frameScheduler import frame_scheduler
+from devopsnextgenx.utils.styleRegistry import style_registry
 
 @pytest.fixture
-def table():
-    """Fixture to create a fresh Table instance for each test"""
+def root():
+    """Fixture to create the Tk root of a test, destroyed after it"""
     root = ttk.Window()
-    
+    yield root
+    root.destroy()
+
+@pytest.fixture
+def table(root):
+    """Fixture to create a fresh Table instance for each test"""
     headers = [
         Header(text="Text Column", type=WidgetType.TEXT, editable=True),
         Header(text="Checkbox", type=WidgetType.CHECKBOX),
@@ -126,4 +139,1086 @@ def test_widget_styles(table):
     assert isinstance(sq_toggle_cell, ttk.Checkbutton)
     
     rnd_toggle_cell = table._cells.get((1, 3))
-    assert isinstance(rnd_toggle_cell, ttk.Checkbutton)
\ No newline at end of file
+    assert isinstance(rnd_toggle_cell, ttk.Checkbutton)
+
+
+@pytest.fixture
+def virtual_table(root):
+    """Fixture to create a virtual Table with more rows than it shows"""
+    headers = [
+        Header(text="Text Column", type=WidgetType.TEXT),
+        Header(text="Checkbox", type=WidgetType.CHECKBOX),
+        Header(text="Entry", type=WidgetType.ENTRY, editable=True),
+        Header(text="Button", type=WidgetType.BUTTON)
+    ]
+
+    data = [[f"Row {i}", i % 2 == 0, f"Entry {i}", "Go"] for i in range(1000)]
+
+    return Table(root, headers=headers, data=data, virtual=True, visible_rows=10)
+
+def test_virtual_table_pool_size(virtual_table):
+    """Test that a virtual table only creates widgets for the visible rows"""
+    assert len(virtual_table._rows) == 10
+    assert (11, 0) not in virtual_table._cells
+    assert virtual_table._cells[(10, 0)].cget("text") == "Row 9"
+
+def test_virtual_table_scroll_rebinds(virtual_table):
+    """Test that scrolling rebinds the pooled widgets to new rows"""
+    first_cell = virtual_table._cells[(1, 0)]
+    virtual_table.yview_scroll(25, "units")
+    assert virtual_table._top == 25
+    assert virtual_table._cells[(1, 0)] is first_cell
+    assert first_cell.cget("text") == "Row 25"
+    assert virtual_table._cells[(1, 2)].get() == "Entry 25"
+
+    virtual_table.yview("moveto", 1.0)
+    assert virtual_table._top == 990
+
+def test_virtual_table_edit_after_scroll(virtual_table):
+    """Test that pooled widgets write to the row they currently show"""
+    virtual_table.yview_scroll(5, "units")
+    virtual_table._cells[(1, 1)].invoke()
+    assert virtual_table.data[5][1] == True
+    assert virtual_table.data[0][1] == True
+
+def test_virtual_table_update_data(virtual_table):
+    """Test that update_data resizes the pool instead of rebuilding it"""
+    virtual_table.update_data(virtual_table.data[:3])
+    assert len(virtual_table._rows) == 3
+    assert virtual_table._top == 0
+
+def test_update_data_with_key_reuses_widgets(table):
+    """Test that a keyed update moves existing rows instead of recreating them"""
+    first_row_cell = table._cells[(1, 0)]
+    second_row_cell = table._cells[(2, 0)]
+    header_label = table._header_labels[0]
+
+    table.update_data(list(reversed(table.data)), key=lambda row: row[0])
+    assert table._cells[(1, 0)] is second_row_cell
+    assert table._cells[(2, 0)] is first_row_cell
+    assert table._header_labels[0] is header_label
+    assert first_row_cell.cget("text") == "Row 1"
+
+def test_update_data_with_key_adds_and_removes(table):
+    """Test that a keyed update only creates and destroys changed rows"""
+    kept_cell = table._cells[(2, 0)]
+    table.update_data(
+        [table.data[1], ["Row 3", True, True, True, True, "Entry 3", "New"]],
+        key=lambda row: row[0]
+    )
+    assert len(table._rows) == 2
+    assert table._cells[(1, 0)] is kept_cell
+    assert table._cells[(2, 0)].cget("text") == "Row 3"
+    assert (3, 0) not in table._cells
+
+def test_update_data_keeps_selection(table):
+    """Test that the selected row follows its key"""
+    table._handle_cell_click(1, 0)
+    table.update_data(list(reversed(table.data)), key=lambda row: row[0])
+    assert table.selected_row == 2
+    assert table.selected_cell == (2, 0)
+
+def test_builtin_sort_reorders_rows(table):
+    """Test that a sortable header sorts the rows without reordering the data"""
+    table.headers[0].sortable = True
+    first_row_cell = table._cells[(1, 0)]
+    table._handle_header_click(table.headers[0])
+    assert table._sort_spec == [(0, True)]
+    table._handle_header_click(table.headers[0])
+    assert table._sort_spec == [(0, False)]
+    assert table._cells[(2, 0)] is first_row_cell
+    assert table.data[0][0] == "Row 1"
+    assert table._header_labels[0].cget("text") == "Text Column ↓"
+
+def test_builtin_multi_column_sort(table):
+    """Test that sorting is stable across several columns"""
+    table.update_data([
+        ["b", True, False, True, False, "x", "1"],
+        ["a", False, True, False, True, "x", "2"],
+        ["c", True, True, False, False, "y", "3"],
+    ])
+    table.sort([(5, False), (0, True)])
+    assert [table._cells[(row, 0)].cget("text") for row in (1, 2, 3)] == ["c", "a", "b"]
+    table.sort([])
+    assert [table._cells[(row, 0)].cget("text") for row in (1, 2, 3)] == ["b", "a", "c"]
+
+def test_sort_key_cache_follows_edits(table):
+    """Test that edits update the cached sort keys"""
+    table.sort([(1, True)])
+    table._cells[(1, 1)].invoke()
+    assert table.model.sort_keys(1) == [sort_key(row[1]) for row in table.data]
+
+def test_table_with_columnar_model(root):
+    """Test that Table reads and writes through a columnar model"""
+    headers = [
+        Header(text="Name", type=WidgetType.TEXT),
+        Header(text="Age", type=WidgetType.ENTRY, editable=True),
+        Header(text="Active", type=WidgetType.CHECKBOX)
+    ]
+    model = ColumnarTableModel([["Alice", 30, True], ["Bob", 25, False]])
+    table = Table(root, headers=headers, data=model)
+    assert table.data is model
+
+    table._cells[(1, 2)].invoke()
+    assert model.get(0, 2) == False
+
+    entry = table._cells[(2, 1)]
+    entry.delete(0, "end")
+    entry.insert(0, "26")
+    table._handle_entry_change(1, 1, entry)
+    assert model.get(1, 1) == 26
+
+    entry.delete(0, "end")
+    entry.insert(0, "not a number")
+    table._handle_entry_change(1, 1, entry)
+    assert model.get(1, 1) == 26
+    assert entry.get() == "26"
+
+def test_filter_row_hides_rows(table):
+    """Test that filtering hides rows and keeps them for later"""
+    table.set_filter(0, "2")
+    assert len(table._rows) == 1
+    assert table._cells[(1, 0)].cget("text") == "Row 2"
+    assert (2, 0) not in table._cells
+    table.set_filter(0, "")
+    assert len(table._rows) == 2
+    assert table._cells[(2, 0)].cget("text") == "Row 2"
+
+def test_filterable_table_inputs(root):
+    """Test the filter inputs of a filterable table"""
+    headers = [
+        Header(text="Name", type=WidgetType.TEXT),
+        Header(text="Active", type=WidgetType.CHECKBOX),
+        Header(text="Action", type=WidgetType.BUTTON)
+    ]
+    table = Table(root, headers=headers, data=[["a", True, "Go"], ["b", False, "Go"]], filterable=True)
+    assert isinstance(table._filter_inputs[0], ttk.Entry)
+    assert isinstance(table._filter_inputs[1], ttk.Combobox)
+    assert 2 not in table._filter_inputs
+
+    table.set_filter(1, "False")
+    assert [table._cells[(1, 0)].cget("text")] == ["b"]
+    table.clear_filters()
+    assert len(table._rows) == 2
+
+@pytest.fixture
+def paged_table(root):
+    """Fixture to create a paged Table over 95 provided rows"""
+    rows = [[f"Name {i:02d}", i % 2 == 0, i] for i in range(95)]
+    fetches = []
+
+    def fetch(offset, limit, sort, filters):
+        fetches.append((offset, limit))
+        matching = [row for row in rows if all(query in str(row[col]) for col, query in filters.items())]
+        for col, ascending in reversed(sort):
+            matching.sort(key=lambda row: row[col], reverse=not ascending)
+        return [list(row) for row in matching[offset:offset + limit]]
+
+    headers = [
+        Header(text="Name", type=WidgetType.TEXT, sortable=True),
+        Header(text="Even", type=WidgetType.CHECKBOX),
+        Header(text="Number", type=WidgetType.TEXT, sortable=True),
+    ]
+    table = Table(root, headers=headers, fetch=fetch, total_count=lambda filters: len(fetch(0, 1000, [], filters)),
+                  page_size=10)
+    table.fetches = fetches
+    return table
+
+def test_paged_table_pages(paged_table):
+    """Test that a paged table shows one page and moves between pages"""
+    assert paged_table.paged
+    assert len(paged_table._rows) == 10
+    assert paged_table._cells[(1, 0)].cget("text") == "Name 00"
+    assert paged_table._page_label.cget("text") == "Page 1 of 10"
+    paged_table.next_page()
+    assert paged_table.page == 1
+    assert paged_table._cells[(1, 0)].cget("text") == "Name 10"
+    paged_table.go_to_page(20)
+    assert paged_table.page == 9
+    assert len(paged_table._rows) == 5
+    assert paged_table._cells[(5, 0)].cget("text") == "Name 94"
+    assert paged_table._page_label.cget("text") == "Page 10 of 10"
+
+def test_paged_table_refuses_row_changes(paged_table):
+    """Test that rows of a paged table are not inserted, appended, deleted or moved by the table"""
+    for change in (lambda: paged_table.insert_rows(0, [["x", True, 0]]), lambda: paged_table.append_rows([["x", True, 0]]),
+                   lambda: paged_table.delete_rows([0]), lambda: paged_table.move_row(0, 1)):
+        with pytest.raises(ValueError, match="provider"):
+            change()
+    assert len(paged_table.model) == 95
+
+def test_paged_table_sort_and_filter(paged_table):
+    """Test that sorting and filtering go to the provider and return to the first page"""
+    paged_table.next_page()
+    paged_table._handle_header_click(paged_table.headers[2])
+    paged_table._handle_header_click(paged_table.headers[2])
+    assert paged_table.model.sort_spec == [(2, False)]
+    assert paged_table.page == 0
+    assert paged_table._cells[(1, 2)].cget("text") == "94"
+    paged_table.set_filter(0, "Name 1")
+    assert len(paged_table.model) == 10
+    assert paged_table._page_label.cget("text") == "Page 1 of 1"
+    assert paged_table._cells[(1, 0)].cget("text") == "Name 19"
+    paged_table.clear_filters()
+    assert len(paged_table.model) == 95
+
+def test_paged_table_on_change(paged_table):
+    """Test that edits on a later page report the absolute row"""
+    changes = []
+    paged_table.headers[1].on_change = lambda data, row, col: changes.append((row, col, data.get(row, col)))
+    paged_table.next_page()
+    checkbox = paged_table._cells[(1, 1)]
+    checkbox.var.set(True)
+    paged_table._handle_checkbox_change(checkbox.table_row.index, 1, checkbox)
+    assert changes == [(10, 1, True)]
+
+def _texts(table, col=0):
+    """Text shown in column col of every table row, top to bottom"""
+    return [table._cells[(row, col)].cget("text") for row in range(1, len(table._rows) + 1)]
+
+def test_append_rows_creates_only_new_widgets(table):
+    """Test that appending keeps the existing widgets"""
+    first = table._cells[(1, 0)]
+    table.append_rows([["Row 3", True, True, True, True, "Entry 3", "Go"]])
+    assert len(table.data) == 3
+    assert table._cells[(1, 0)] is first
+    assert _texts(table) == ["Row 1", "Row 2", "Row 3"]
+    assert table._cells[(3, 0)].cget("style") == "Alt.TLabel"
+
+def test_insert_rows_shifts_later_rows(table):
+    """Test that inserted rows push later rows down without recreating them"""
+    second = table._cells[(2, 0)]
+    table._handle_cell_click(2, 0)
+    table.insert_rows(1, [["New A", False, False, False, False, "", ""], ["New B", False, False, False, False, "", ""]])
+    assert _texts(table) == ["Row 1", "New A", "New B", "Row 2"]
+    assert table._cells[(4, 0)] is second
+    assert second.table_row.index == 3
+    assert table.selected_row == 4
+    assert table._cells[(4, 0)].cget("style") == "info.TLabel"
+
+def test_delete_rows(table):
+    """Test that deleting rows destroys only their widgets and keeps _cells consistent"""
+    table.append_rows([["Row 3", True, True, True, True, "Entry 3", "Go"]])
+    third = table._cells[(3, 0)]
+    table._handle_cell_click(1, 0)
+    table.delete_rows([0, 1])
+    assert table.data == [["Row 3", True, True, True, True, "Entry 3", "Go"]]
+    assert table._cells[(1, 0)] is third
+    assert (2, 0) not in table._cells
+    assert table.selected_row is None
+    assert third.table_row.index == 0
+
+def test_move_row(table):
+    """Test that a moved row keeps its widgets"""
+    table.append_rows([["Row 3", True, True, True, True, "Entry 3", "Go"]])
+    first = table._cells[(1, 0)]
+    table.move_row(0, 2)
+    assert [row[0] for row in table.data] == ["Row 2", "Row 3", "Row 1"]
+    assert _texts(table) == ["Row 2", "Row 3", "Row 1"]
+    assert table._cells[(3, 0)] is first
+
+def test_row_mutations_with_sort_and_filter(table):
+    """Test that new rows take their sorted place and respect the filter"""
+    table.sort([(0, False)])
+    table.set_filter(0, "row")
+    table.append_rows([["Row 0", True, True, True, True, "", ""], ["Other", True, True, True, True, "", ""]])
+    assert _texts(table) == ["Row 2", "Row 1", "Row 0"]
+    table.delete_rows([1])
+    assert _texts(table) == ["Row 1", "Row 0"]
+
+def test_virtual_table_row_mutations(virtual_table):
+    """Test row mutations in virtual mode rebind the pool"""
+    virtual_table.insert_rows(0, [["Top", False, "", "Go"]])
+    assert virtual_table._cells[(1, 0)].cget("text") == "Top"
+    assert len(virtual_table._rows) == 10
+    virtual_table.delete_rows([0])
+    virtual_table.append_rows([["Last", True, "", "Go"]])
+    virtual_table.yview("moveto", 1.0)
+    assert virtual_table._cells[(10, 0)].cget("text") == "Last"
+
+def test_set_cells_coalesces_updates(table):
+    """Test that queued updates are applied once, last write winning"""
+    label = table._cells[(1, 0)]
+    configured = []
+    original = label.configure
+    label.configure = lambda **kw: (configured.append(kw), original(**kw))
+    table.set_cells({(0, 0): "First"})
+    table.set_cells({(0, 0): "Second", (1, 1): True})
+    assert table.data[0][0] == "Row 1"  # Nothing applied before the idle callback
+    table.flush_cells()
+    assert table.data[0][0] == "Second"
+    assert table.data[1][1] is True
+    assert table._cells[(2, 1)].var.get() is True
+    assert configured == [{"text": "Second"}]
+    table.flush_cells()
+    assert len(configured) == 1
+
+def test_batch_defers_updates(table):
+    """Test that a batch schedules one flush when it ends"""
+    with table.batch():
+        table.set_cells({(0, 5): "a"})
+        with table.batch():
+            table.set_cells({(0, 5): "b"})
+        assert table._flush_id is None
+    assert table._flush_id is not None
+    table.flush_cells()
+    assert table._cells[(1, 5)].get() == "b"
+    assert table._flush_id is None
+
+def test_set_cells_resorts(table):
+    """Test that updating a sorted column moves the row"""
+    table.sort([(0, True)])
+    table.set_cells({(0, 0): "Z"})
+    table.flush_cells()
+    assert _texts(table) == ["Row 2", "Z"]
+
+def test_virtual_set_cells(virtual_table):
+    """Test that updates to rows outside the pool only change the data"""
+    virtual_table.set_cells({(0, 0): "Top", (500, 0): "Middle"})
+    virtual_table.flush_cells()
+    assert virtual_table._cells[(1, 0)].cget("text") == "Top"
+    assert virtual_table.data[500][0] == "Middle"
+    virtual_table.yview("moveto", 0.5)
+    assert virtual_table._cells[(1, 0)].cget("text") == "Middle"
+
+@pytest.fixture
+def canvas_table(root):
+    """Fixture to create a Table drawing its TEXT cells on a canvas"""
+    headers = [
+        Header(text="Name", type=WidgetType.TEXT, editable=True, sortable=True),
+        Header(text="Checkbox", type=WidgetType.CHECKBOX),
+        Header(text="Note", type=WidgetType.TEXT, align="right"),
+    ]
+    data = [[f"Row {i}", i % 2 == 0, f"Note {i}"] for i in range(50)]
+    return Table(root, headers=headers, data=data, renderer="canvas")
+
+def test_canvas_table_draws_text_cells(canvas_table):
+    """Test that TEXT cells are canvas items and only interactive cells are widgets"""
+    cell = canvas_table._cells[(1, 0)]
+    assert isinstance(cell, CanvasCell)
+    assert canvas_table._canvas.canvas.itemcget(cell.item, "text") == "Row 0"
+    assert not isinstance(canvas_table._cells[(1, 1)], CanvasCell)
+    assert len(canvas_table._canvas._backgrounds) == 50
+
+def test_canvas_table_click_and_select(canvas_table):
+    """Test that canvas coordinates map to cells and selection paints the row background"""
+    renderer = canvas_table._canvas
+    renderer._edges = [0, 100, 150, 300]
+    assert renderer.cell_at(120, canvas_table.row_height * 2 + 5) == (3, 1)
+    assert renderer.cell_at(400, 5) is None
+    canvas_table._handle_canvas_click(3, 0)
+    assert canvas_table.selected_row == 3
+    assert renderer._colors[3] == renderer.color("info")
+    canvas_table._handle_canvas_click(1, 2)
+    assert renderer._colors[3] == renderer.style_color("Alt.TLabel")
+
+def test_canvas_table_sort_and_edit(canvas_table):
+    """Test that sorting moves drawn cells and the editor opens over the drawn cell"""
+    canvas_table.sort([(0, False)])
+    assert canvas_table._cells[(1, 0)].cget("text") == "Row 9"
+    canvas_table._handle_canvas_click(1, 0, double=True)
+    editor = [child for child in canvas_table.winfo_children() if isinstance(child, ttk.Entry)][-1]
+    assert editor.get() == "Row 9"
+    assert str(editor) in canvas_table._canvas._windows
+    editor.destroy()
+    canvas_table._canvas.forget(str(editor))
+    assert str(editor) not in canvas_table._canvas._windows
+
+class _Event:
+    """Stand-in for a Tk event on a cell widget"""
+    def __init__(self, widget, x_root=0, y_root=0):
+        self.widget = widget
+        self.x_root = x_root
+        self.y_root = y_root
+
+def test_cell_events_are_delegated(table):
+    """Test that cells carry the table bindtag instead of their own bindings"""
+    label = table._cells[(2, 0)]
+    assert table._bindtag in label.bindtags()
+    assert not label.bind()
+    table._on_cell_click(_Event(label))
+    assert table.selected_row == 2
+    assert table.selected_cell == (2, 0)
+    table._on_cell_click(_Event(table._cells[(1, 1)]))
+    assert table.selected_row == 2  # Only TEXT cells select
+
+def test_row_hover(table):
+    """Test that entering a cell highlights its row and leaving the table clears it"""
+    table._on_cell_enter(_Event(table._cells[(1, 5)]))
+    assert table._hover_row == 1
+    assert str(table._cells[(1, 0)].cget("background")) == table.hover_color
+    table._on_cell_enter(_Event(table._cells[(2, 0)]))
+    assert table._hover_row == 2
+    assert str(table._cells[(1, 0)].cget("background")) == ""
+    table._on_cell_click(_Event(table._cells[(2, 0)]))
+    assert table._hover_row is None
+    assert table._cells[(2, 0)].cget("style") == "info.TLabel"
+    table._on_cell_enter(_Event(table._cells[(1, 0)]))
+    table._hover(None)
+    assert table._hover_row is None
+
+@pytest.fixture
+def demand_table(root):
+    """Fixture to create a Table that edits its TEXT and ENTRY columns on demand"""
+    headers = [
+        Header(text="Name", type=WidgetType.TEXT, editable=True),
+        Header(text="Done", type=WidgetType.CHECKBOX),
+        Header(text="Note", type=WidgetType.ENTRY, editable=True),
+    ]
+    data = [[f"Row {i}", False, f"Note {i}"] for i in range(30)]
+    return Table(root, headers=headers, data=data, edit_on_demand=True, virtual=True, visible_rows=5)
+
+def test_edit_on_demand_shows_text(demand_table):
+    """Test that ENTRY columns are shown as text and share one editor"""
+    assert isinstance(demand_table._cells[(1, 2)], ttk.Label)
+    assert not any(isinstance(child, ttk.Entry) for child in demand_table.winfo_children())
+    demand_table._make_cell_editable(1, 2)
+    editor = demand_table._editor
+    assert editor.get() == "Note 0"
+    demand_table._make_cell_editable(2, 0)
+    assert demand_table._editor is editor
+    assert [isinstance(child, ttk.Entry) for child in demand_table.winfo_children()].count(True) == 1
+
+def test_shared_editor_commits_and_navigates(demand_table):
+    """Test that Tab and Enter save through on_change and move the editor"""
+    changes = []
+    demand_table.headers[0].on_change = lambda data, row, col: changes.append((row, col, data[row][col]))
+    demand_table._make_cell_editable(1, 0)
+    demand_table._editor.delete(0, "end")
+    demand_table._editor.insert(0, "First")
+    assert demand_table._move_editor(0, 1) == "break"
+    assert changes == [(0, 0, "First")]
+    assert demand_table._cells[(1, 0)].cget("text") == "First"
+    assert demand_table._editing[:2] == (0, 2)
+    demand_table._move_editor(0, 1)  # Wraps to the first editable column of the next row
+    assert demand_table._editing[:2] == (1, 0)
+    demand_table._close_editor()
+    assert demand_table._editing is None
+
+def test_shared_editor_scrolls_past_last_row(demand_table):
+    """Test that Enter on the last shown row scrolls the pool"""
+    demand_table._make_cell_editable(5, 2)
+    demand_table._editor.delete(0, "end")
+    demand_table._editor.insert(0, "Changed")
+    demand_table._move_editor(1, 0)
+    assert demand_table.data[4][2] == "Changed"
+    assert demand_table._top == 1
+    assert demand_table._editing[:2] == (5, 2)
+    assert demand_table._editor.get() == "Note 5"
+
+@pytest.fixture
+def bool_table(root):
+    """Fixture to create a filterable Table with boolean columns over a columnar model"""
+    headers = [
+        Header(text="Name", type=WidgetType.TEXT),
+        Header(text="Done", type=WidgetType.CHECKBOX),
+        Header(text="Primary", type=WidgetType.RADIOBTN),
+    ]
+    model = ColumnarTableModel([[f"Row {i}", i % 3 == 0, i == 2] for i in range(100)])
+    return Table(root, headers=headers, data=model, filterable=True)
+
+def test_bulk_boolean_operations(bool_table):
+    """Test select all, invert and count on a packed boolean column"""
+    assert bool_table.count_checked(1) == 34
+    bool_table.set_column(1, True)
+    assert bool_table.count_checked(1) == 100
+    assert bool_table._cells[(2, 1)].var.get() is True
+    bool_table.invert_column(1)
+    assert bool_table.count_checked(1) == 0
+    assert bool_table._cells[(1, 1)].var.get() is False
+    with pytest.raises(ValueError):
+        bool_table.invert_column(2)
+
+def test_radio_column_single_selection(bool_table):
+    """Test that selecting a radio button clears the previous selection"""
+    changes = []
+    bool_table.headers[2].on_change = lambda data, row, col: changes.append(row)
+    assert bool_table._cells[(3, 2)].var.get() == str(bool_table._cells[(3, 2)])
+    radio = bool_table._cells[(6, 2)]
+    radio.var.set(str(radio))
+    bool_table._handle_radio_change(radio.table_row.index, 2, radio)
+    assert [bool_table.model.get(row, 2) for row in (2, 5)] == [False, True]
+    assert bool_table.count_checked(2) == 1
+    assert changes == [5]
+    other = bool_table._cells[(1, 2)]
+    other.var.set(str(other))
+    bool_table._handle_radio_change(0, 2, other)
+    assert bool_table.count_checked(2) == 1
+    assert bool_table._radio_selected[2][0] == 0
+
+def test_hidden_rows_release_boolean_variables(bool_table):
+    """Test that rows filtered out give their variables back and get them again when shown"""
+    bool_table.set_filter(0, "Row 1")
+    hidden = [table_row for table_row in bool_table._hidden_rows]
+    assert all(table_row.cells[1].var is None for table_row in hidden)
+    assert len(bool_table._free_vars) == len(hidden)
+    bool_table.set_column(1, True)
+    bool_table.clear_filters()
+    assert not bool_table._free_vars
+    assert all(table_row.cells[1].var.get() is True for table_row in bool_table._rows)
+
+def test_column_plans_resolve_headers(table):
+    """Test that each header is compiled once into a render plan"""
+    assert len(table._plans) == len(table.headers)
+    assert table._plans[0].kind == WidgetType.TEXT and table._plans[0].shows_text
+    assert table._plans[1].style == "success.TCheckbutton" and table._plans[1].boolean
+    assert table._plans[6].style == "primary.TButton"
+    assert table._plans[5].anchor == "w"
+
+def test_column_plans_for_edit_on_demand(demand_table):
+    """Test that edit on demand ENTRY columns are planned as text"""
+    plan = demand_table._plans[2]
+    assert plan.kind == WidgetType.TEXT and plan.shows_text and plan.editable
+
+def test_large_table_builds_in_chunks(root):
+    """Test that rows past the first screen are created between frames"""
+    frame_scheduler(root).budget = 0  # One row per frame
+    headers = [Header(text="Name", type=WidgetType.TEXT), Header(text="Done", type=WidgetType.CHECKBOX)]
+    progress = []
+    table = Table(root, headers=headers, data=[[f"Row {i}", False] for i in range(30)], visible_rows=5,
+                  on_progress=lambda done, total: progress.append((done, total)))
+    assert len(table._rows) == 6
+    assert progress == [(6, 30)]
+    table.sort([(0, False)])
+    assert len(table._rows) == 30 and table._build is None
+    assert progress[-1] == (30, 30)
+    assert _texts(table)[:2] == ["Row 9", "Row 8"]
+
+def test_updates_during_build_keep_it_incremental(root):
+    """Test that cell updates and appends leave the build going and only rearranging rows finishes it"""
+    frame_scheduler(root).budget = 0
+    headers = [Header(text="Name", type=WidgetType.TEXT), Header(text="Done", type=WidgetType.CHECKBOX)]
+    table = Table(root, headers=headers, data=[[f"Row {i}", False] for i in range(30)], visible_rows=5)
+    table.set_cells({(0, 0): "First", (20, 0): "Later"})
+    table.flush_cells()
+    table.append_rows([["Row 30", True]])
+    assert len(table._rows) == 6 and table._build is not None
+    assert table._rows[0].cells[0].cget("text") == "First"
+    table._build.finish()
+    assert len(table._rows) == 31
+    assert table._rows[20].cells[0].cget("text") == "Later" and table._rows[30].cells[0].cget("text") == "Row 30"
+    table = Table(root, headers=headers, data=[[f"Row {i}", False] for i in range(30)], visible_rows=5)
+    table.delete_rows([0])
+    assert table._build is None and _texts(table)[:2] == ["Row 1", "Row 2"] and len(table._rows) == 29
+
+@pytest.fixture
+def tail_table(root):
+    """Fixture to create a tail Table keeping 10 rows, 4 shown"""
+    headers = [Header(text="Seq", type=WidgetType.TEXT), Header(text="Message", type=WidgetType.TEXT)]
+    return Table(root, headers=headers, data=[[str(i), f"msg {i}"] for i in range(6)], tail=10, visible_rows=4)
+
+def test_tail_follows_newest_rows(tail_table):
+    """Test that appended rows evict the oldest and stay in view"""
+    table = tail_table
+    assert table.virtual and isinstance(table.model, RingTableModel)
+    pool = [cell for table_row in table._rows for cell in table_row.cells]
+    table.append_rows([[str(i), f"msg {i}"] for i in range(6, 13)])
+    assert len(table.model) == 10 and table.model.get(0, 0) == "3"
+    assert _texts(table) == ["9", "10", "11", "12"]
+    # The widgets are recycled, not recreated
+    assert [cell for table_row in table._rows for cell in table_row.cells] == pool
+
+def test_tail_pause_keeps_view(tail_table):
+    """Test that scrolling up pauses following and the view stays on its rows"""
+    table = tail_table
+    table.append_rows([[str(i), f"msg {i}"] for i in range(6, 10)])
+    table.yview_scroll(-3, "units")
+    assert not table.auto_scroll
+    assert _texts(table) == ["3", "4", "5", "6"]
+    table._handle_cell_click(1, 0)
+    table.append_rows([["10", "msg 10"], ["11", "msg 11"]])
+    assert _texts(table) == ["3", "4", "5", "6"]
+    assert table.model.get(table._order[table.selected_row - 1], 0) == "3"
+    table.append_rows([[str(i), f"msg {i}"] for i in range(12, 16)])
+    assert table.selected_row is None
+    table.resume_scroll()
+    assert table.auto_scroll and _texts(table) == ["12", "13", "14", "15"]
+
+def test_tail_filter_after_eviction(tail_table):
+    """Test that a filter cleared before rows were evicted searches and edits the current rows"""
+    table = tail_table
+    table.set_filter(1, "msg 1")
+    table.set_filter(1, "")
+    table.append_rows([[str(i), f"msg {i}"] for i in range(6, 14)])  # Evicts 0 to 3
+    table.set_filter(1, "msg 1")
+    assert sorted(table.model.get(row, 0) for row in table._order) == ["10", "11", "12", "13"]
+    table.set_cells({(9, 1): "done"})
+    table.flush_cells()
+    assert sorted(table.model.get(row, 0) for row in table._order) == ["10", "11", "12"]
+
+def test_tail_refuses_row_edits(tail_table):
+    """Test that a tail table refuses to insert, delete or move rows and keeps its rows"""
+    table = tail_table
+    rows = list(table.model.rows())
+    with pytest.raises(ValueError):
+        table.insert_rows(0, [["x", "msg x"]])
+    with pytest.raises(ValueError):
+        table.delete_rows([0])
+    with pytest.raises(ValueError):
+        table.move_row(0, 1)
+    assert list(table.model.rows()) == rows
+
+def test_file_tail_appends_new_lines(root, tmp_path):
+    """Test that a FileTail appends complete new lines and follows a rotated file"""
+    headers = [Header(text="level", type=WidgetType.TEXT), Header(text="message", type=WidgetType.TEXT)]
+    table = Table(root, headers=headers, data=[], tail=5, visible_rows=3)
+    path = tmp_path / "events.jsonl"
+    path.write_text('{"level": "info", "message": "old"}\n')
+    follower = FileTail(table, str(path))
+    assert follower.poll() == 0  # Starts at the end of the file
+    with open(path, "a") as stream:
+        stream.write('{"level": "warn", "message": "new"}\n["error", "list"]\nnot json\n{"level": "info"')
+    assert follower.poll() == 2
+    assert list(table.model.rows()) == [["warn", "new"], ["error", "list"]]
+    with open(path, "a") as stream:
+        stream.write(', "message": "done"}\n')
+    assert follower.poll() == 1
+    path.unlink()
+    path.write_text('{"level": "info", "message": "rotated"}\n')
+    assert follower.poll() == 1
+    assert table.model.get(len(table.model) - 1, 1) == "rotated"
+    follower.stop()
+
+def test_file_tail_csv_header(root, tmp_path):
+    """Test that a CSV FileTail read from the start skips the header line"""
+    headers = [Header(text="a", type=WidgetType.TEXT), Header(text="b", type=WidgetType.TEXT)]
+    table = Table(root, headers=headers, data=[], tail=5, visible_rows=3)
+    path = tmp_path / "events.csv"
+    path.write_text("a,b\n1,2\n3\n")
+    assert FileTail(table, str(path), from_start=True).poll() == 2
+    assert list(table.model.rows()) == [["1", "2"], ["3", ""]]
+
+@pytest.fixture
+def typed_table(root):
+    """Fixture to create a Table whose headers declare the column types"""
+    headers = [
+        Header(text="name", type=WidgetType.TEXT),
+        Header(text="count", type=WidgetType.TEXT, dtype=int),
+        Header(text="score", type=WidgetType.TEXT, dtype=float),
+        Header(text="done", type=WidgetType.CHECKBOX)
+    ]
+    return Table(root, headers=headers, data=[["old", 0, 0.0, False]])
+
+def test_load_csv_streams_and_coerces(typed_table, tmp_path):
+    """Test that load_csv replaces the rows, matches columns by name and converts the values"""
+    table = typed_table
+    frame_scheduler(table).budget = 0  # One chunk per frame
+    path = tmp_path / "rows.csv"
+    path.write_text("score,name,count,done\n" + "".join(f"{i / 2},row {i},{i},{i % 2}\n" for i in range(25)) + "x,bad,n/a,no\n")
+    loaded = []
+    job = table.load_csv(str(path), chunk_size=10, on_done=lambda: loaded.append(len(table.model)))
+    assert len(table.model) == 10 and not loaded
+    job.finish()
+    assert loaded == [26]
+    assert table.model.row(3) == ["row 3", 3, 1.5, True]
+    assert table.model.row(25) == ["bad", "n/a", "x", False]  # Kept as read when it does not convert
+
+def test_load_csv_columnar_grows_geometrically(root, tmp_path):
+    """Test that a chunked load into a columnar model appends in place, reallocating its columns O(log n) times"""
+    headers = [Header(text="name"), Header(text="count", dtype=int), Header(text="score", dtype=float),
+               Header(text="done", type=WidgetType.CHECKBOX)]
+    table = Table(root, headers=headers, data=ColumnarTableModel([], types=[str, int, float, bool]), virtual=True)
+    path = tmp_path / "large.csv"
+    rows = 20_000
+    path.write_text("name,count,score,done\n" + "".join(f"row {i},{i},{i / 2},{i % 2}\n" for i in range(rows)))
+    job = table.load_csv(str(path), chunk_size=100)
+    stores = []
+    while not job.finished:
+        job._scheduler._run(job, 0)  # One chunk
+        store = table.model._columns[1]
+        if not stores or stores[-1] is not store:
+            stores.append(store)
+    assert len(table.model) == rows and table.model.row(rows - 1) == [f"row {rows - 1}", rows - 1, (rows - 1) / 2, True]
+    assert len(stores) < 20  # 200 chunks, a copy of the column per chunk before
+    # Timing of large loads: tests/benchmark.py
+
+def test_load_jsonl_skips_bad_lines(typed_table, tmp_path):
+    """Test that load_jsonl skips lines holding no row and reports them in the status bar"""
+    table = typed_table
+    path = tmp_path / "rows.jsonl"
+    path.write_text('{"name": "a", "count": 1}\n\nnot json\n5\n"text"\nnull\n["b", 2, 0.5]\n{"name": "c"\n')
+    statuses = []
+    status_bar = type("StatusBar", (), {"update_status": lambda self, *args: statuses.append(args)})()
+    table.load_jsonl(str(path), status_bar=status_bar).finish()
+    assert table.model.row(0) == ["a", 1, None, False] and table.model.row(1) == ["b", 2, 0.5, False]
+    assert len(table.model) == 2
+    assert statuses[-1] == ("Loaded 2 rows from rows.jsonl, 5 bad lines skipped", 1.0)
+
+def test_export_round_trip(typed_table, tmp_path):
+    """Test that the rows shown are exported from a snapshot and load back the same"""
+    table = typed_table
+    table.update_data([[f"row {i}", i, i * 1.5, i % 2 == 0] for i in range(5)])
+    table.sort([(1, False)])
+    done = []
+    for name, export, load in [("rows.csv", table.export_csv, table.load_csv),
+                               ("rows.jsonl", table.export_jsonl, table.load_jsonl)]:
+        path = str(tmp_path / name)
+        job = export(path, on_done=done.append)
+        table.set_cells({(0, 0): "changed"})  # Does not reach the export
+        job.join()
+        job._poll()
+        expected = [[f"row {i}", i, i * 1.5, i % 2 == 0] for i in reversed(range(5))]
+        load(path).finish()
+        table.sort([])
+        assert list(table.model.rows()) == expected
+        table.sort([(1, False)])
+    assert done == [None, None]
+
+@pytest.fixture
+def grouped_table(root):
+    """Fixture to create a Table grouped by team, summing the points"""
+    headers = [
+        Header(text="Team", type=WidgetType.TEXT),
+        Header(text="Name", type=WidgetType.TEXT),
+        Header(text="Points", type=WidgetType.ENTRY, editable=True, aggregate="sum"),
+        Header(text="Active", type=WidgetType.SQTOGGLE)
+    ]
+    data = ColumnarTableModel([["red", "a", 5, True], ["blue", "b", 3, False], ["red", "c", 7, True], ["blue", "d", 1, True]])
+    return Table(root, headers=headers, data=data, group_by=[0])
+
+def _group_text(table, key):
+    return [label.cget("text") for label in table._group_rows[(key,)].cells]
+
+def test_group_rows_and_aggregates(grouped_table):
+    """Test that groups get a row above their rows showing the chosen aggregate"""
+    table = grouped_table
+    assert table._order == [1, 3, 0, 2]
+    assert _group_text(table, "blue")[:3] == ["▾ blue (2)", "", "sum 4"]
+    assert table._group_rows[("blue",)].row == 1 and table._group_rows[("red",)].row == 4
+    assert table._rows[2].cells[0].grid_info()["row"] == 5
+    assert table.group_aggregates("red")[2] == table.model.aggregate(2, [0, 2])
+
+def test_collapsed_group_has_no_widgets(grouped_table):
+    """Test that collapsing a group destroys its rows' widgets and expanding creates them again"""
+    table = grouped_table
+    table.toggle_group("blue")
+    assert table._order == [0, 2]
+    assert sorted(table_row.index for table_row in table._rows + table._hidden_rows) == [0, 2]
+    assert _group_text(table, "blue")[0] == "▸ blue (2)"
+    assert table._group_rows[("red",)].row == 2
+    assert table._rows[0].cells[0].grid_info()["row"] == 3
+    table.set_group_expanded("blue", True)
+    assert table._order == [1, 3, 0, 2] and len(table._rows) == 4
+
+def test_group_aggregates_follow_edits(grouped_table):
+    """Test that edits update the aggregates in place and a changed group column moves the row"""
+    table = grouped_table
+    entry = table._rows[0].cells[2]  # Row "b" of blue
+    entry.delete(0, "end")
+    entry.insert(0, "10")
+    table._handle_entry_change(1, 2, entry)
+    assert table.group_aggregates("blue")[2]["sum"] == 11
+    assert _group_text(table, "blue")[2] == "sum 11"
+    table.set_cells({(3, 0): "red"})
+    table.flush_cells()
+    assert ("blue",) in table._group_rows and _group_text(table, "red")[:3] == ["▾ red (3)", "", "sum 13"]
+    assert table.group_aggregates("red")[2] == table.model.aggregate(2, [0, 2, 3])
+    assert table._order == [1, 0, 2, 3]
+    table.append_rows([["green", "e", 2, False]])
+    assert table._order == [1, 4, 0, 2, 3] and _group_text(table, "green")[0] == "▾ green (1)"
+    table.group_by([])
+    assert not table._group_rows and table._rows[0].cells[0].grid_info()["row"] == 1
+
+@pytest.fixture
+def computed_table(root):
+    """Fixture to create a Table with a computed total and a computed label reading it"""
+    headers = [
+        Header(text="Qty", type=WidgetType.ENTRY, editable=True),
+        Header(text="Price", type=WidgetType.TEXT),
+        Header(text="Total", type=WidgetType.TEXT, compute=lambda row: row["Qty"] * row[1]),
+        Header(text="Size", type=WidgetType.TEXT, compute=lambda row: "big" if row[2] >= 10 else "small")
+    ]
+    data = ColumnarTableModel([[2, 1.5, 0.0, ""], [4, 3.0, 0.0, ""]])
+    return Table(root, headers=headers, data=data)
+
+def test_computed_columns_fill(computed_table):
+    """Test that computed cells are filled in and their sources recorded"""
+    table = computed_table
+    assert list(table.model.rows()) == [[2, 1.5, 3.0, "small"], [4, 3.0, 12.0, "big"]]
+    assert table._computed.sources == {2: {0, 1}, 3: {2}}
+    assert table._computed.affected(0) == [2, 3] and table._computed.affected(3) == []
+    table.append_rows([[1, 2.0, 0.0, ""]])
+    assert table.model.row(2) == [1, 2.0, 2.0, "small"]
+
+def test_computed_columns_follow_edits(computed_table):
+    """Test that an edit recomputes and repaints only the computed cells depending on it"""
+    table = computed_table
+    entry = table._rows[0].cells[0]
+    entry.delete(0, "end")
+    entry.insert(0, "10")
+    table._handle_entry_change(0, 0, entry)
+    assert table.model.row(0) == [10, 1.5, 15.0, "big"]
+    assert table._rows[0].cells[2].cget("text") == "15.0" and table._rows[0].cells[3].cget("text") == "big"
+    calls = []
+    table._computed.functions[3] = lambda row: calls.append(row[2]) or "small"
+    table.set_cells({(1, 1): 3.0})  # Unchanged value, nothing to recompute
+    table.flush_cells()
+    table.set_cells({(1, 1): 1.0})
+    table.flush_cells()
+    assert calls == [4.0] and table.model.row(1) == [4, 1.0, 4.0, "small"]
+    assert table._rows[1].cells[2].cget("text") == "4.0"
+
+def test_computed_columns_after_on_change(root):
+    """Test that an on_change callback writing a source cell updates the computed cells"""
+
+    def double(data, row, col):
+        data[row][1] = data[row][1] * 2
+    headers = [
+        Header(text="Go", type=WidgetType.BUTTON, on_change=double),
+        Header(text="Value", type=WidgetType.TEXT),
+        Header(text="Square", type=WidgetType.TEXT, compute=lambda row: row[1] ** 2)
+    ]
+    table = Table(root, headers=headers, data=[["go", 3, None]])
+    table._handle_button_click(0, 0)
+    assert table.model.row(0) == ["go", 6, 36]
+    assert table._rows[0].cells[2].cget("text") == "36"
+
+def test_on_change_writes_follow_sort_filter_and_formats(root):
+    """Test that cells an on_change callback writes through its data re-sort, re-filter and restyle the rows"""
+
+    def promote(data, row, col):
+        data[row][1] = data[row][1] + 10
+        data[row][2] = data[row][1] * 2  # Reads the value just written
+    headers = [Header(text="Go", type=WidgetType.BUTTON, on_change=promote), Header(text="Rank"),
+               Header(text="Alert", formats=[Threshold(">", 10, background="#b71c1c")])]
+    table = Table(root, headers=headers, data=[["a", 1, 5], ["b", 2, 5]])
+    table.sort([(1, True)])
+    table._handle_button_click(0, 0)
+    assert table.model.row(0) == ["a", 11, 22] and not table._pending
+    assert _texts(table) == ["b", "a"]
+    assert table._rows[1].cells[2].cget("style").endswith(".Row.TLabel")
+    table.set_filter(2, "22")
+    assert _texts(table) == ["a"]
+
+@pytest.fixture
+def journal_table(root):
+    """Fixture to create a Table journaling its changes, rows keyed by name"""
+    headers = [
+        Header(text="Name", type=WidgetType.TEXT),
+        Header(text="Qty", type=WidgetType.ENTRY, editable=True),
+        Header(text="Pick", type=WidgetType.RADIOBTN),
+        Header(text="Done", type=WidgetType.CHECKBOX)
+    ]
+    data = [["a", "1", True, False], ["b", "2", False, False], ["c", "3", False, True]]
+    return Table(root, headers=headers, data=data, journal=True, row_key=lambda row: row[0])
+
+def test_journal_records_and_undoes_edits(journal_table):
+    """Test that edits are journaled by row key and undo/redo patch only their cells"""
+    table = journal_table
+    token = table.journal.token
+    entry = table._rows[1].cells[1]
+    entry.delete(0, "end")
+    entry.insert(0, "20")
+    table._handle_entry_change(1, 1, entry)
+    table._handle_radio_change(2, 2, table._rows[2].cells[2])
+    assert [change[:4] for change in table.changes_since(token)] == [
+        ("b", 1, "2", "20"), ("c", 2, False, True), ("a", 2, True, False)]
+    assert table.undo()  # The radio selection, both cells at once
+    assert [row[2] for row in table.data] == [True, False, False]
+    assert table.undo()
+    assert table.data[1][1] == "2" and entry.get() == "2"
+    assert not table.undo()
+    assert table.redo() and table.data[1][1] == "20"
+    assert table.changes_since(token) == table.changes_since(token, net=False)[-1:]
+
+def test_journal_transactions_and_bulk_operations(journal_table):
+    """Test that transactions, set_cells and set_column are single undo steps found by key after moves"""
+    table = journal_table
+    token = table.journal.token
+    with table.transaction():
+        table.set_cells({(0, 1): "5", (2, 1): "7"})
+        table.set_cells({(0, 1): "6"})
+    table.set_column(3, True)
+    assert [row[3] for row in table.data] == [True, True, True]
+    table.move_row(0, 2)  # a is now the last row
+    assert table.undo()
+    assert [row[3] for row in table.data] == [False, True, False]
+    assert table.undo()
+    assert [row[1] for row in table.data] == ["2", "3", "1"]
+    assert table.changes_since(token) == []  # Everything was undone
+    assert len(table.changes_since(token, net=False)) == 8  # 2 set, 2 checked, then both undone
+    with pytest.raises(ValueError):
+        with table.transaction():
+            table.undo()
+
+def test_journal_without_row_key_follows_row_changes(root):
+    """Test that changes keyed by data row index follow inserted, removed and moved rows"""
+    headers = [Header(text="Name", type=WidgetType.TEXT), Header(text="Qty", type=WidgetType.ENTRY, editable=True)]
+    table = Table(root, headers=headers, data=[["a", "1"], ["b", "2"], ["c", "3"]], journal=True)
+    table.set_cells({(1, 1): "20"})
+    table.insert_rows(0, [["z", "0"]])  # b is now data row 2
+    assert table.undo()
+    assert [row[1] for row in table.data] == ["0", "1", "2", "3"]
+    assert table.redo() and table.data[2][1] == "20"
+    table.set_cells({(3, 1): "30"})
+    table.delete_rows([0, 3])  # The edit of c goes with its row, b is data row 1
+    assert table.undo()
+    assert [row[1] for row in table.data] == ["1", "2"]
+    assert not table.undo()
+    table.set_cells({(0, 1): "10"})
+    table.move_row(0, 1)
+    assert table.undo() and table.data == [["b", "2"], ["a", "1"]]
+    tail = Table(root, headers=headers, data=[[str(i), "0"] for i in range(3)], tail=3, visible_rows=2, journal=True)
+    tail.set_cells({(0, 1): "5", (2, 1): "7"})
+    tail.append_rows([["3", "0"]])  # Evicts the edited row 0, row 2 is now data row 1
+    assert tail.undo()
+    assert list(tail.model.rows()) == [["1", "0"], ["2", "0"], ["3", "0"]]
+
+@pytest.fixture
+def placed_table(root):
+    """Fixture to create a Table placing its cells at computed positions"""
+    headers = [
+        Header(text="Name", type=WidgetType.TEXT),
+        Header(text="Done", type=WidgetType.CHECKBOX),
+        Header(text="Note", type=WidgetType.ENTRY, editable=True),
+    ]
+    data = [["a", True, "1"], ["b", False, "2"], ["c", True, "3"]]
+    table = Table(root, headers=headers, data=data, row_height=24, layout="place")
+    table._layout.column_edges = lambda: [0, 100, 150, 300]
+    table._layout.relayout()
+    return table
+
+def place_of(widget):
+    info = widget.place_info()
+    return int(info["x"]), int(info["y"]), int(info["width"])
+
+def test_place_layout_positions_cells(placed_table):
+    """Test that cells are placed from the row height and column edges, and follow sorting and filtering"""
+    table = placed_table
+    assert place_of(table._rows[1].cells[2]) == (151, 25, 148)
+    table.sort([(0, False)])  # c, b, a
+    assert table._rows[0].cells[0].cget("text") == "c"
+    assert place_of(table._rows[0].cells[0]) == (1, 1, 98)
+    table.set_filter(0, "b")
+    assert len(table._rows) == 1 and place_of(table._rows[0].cells[1]) == (101, 1, 48)
+    assert not table._hidden_rows[0].cells[0].place_info()  # Filtered out rows are unplaced
+    assert int(table._layout.body.cget("height")) == 24
+
+def test_place_layout_relayouts_changed_columns(placed_table):
+    """Test that only the columns whose edges moved are placed again"""
+    table = placed_table
+    table._layout.column_edges = lambda: [0, 100, 180, 300]
+    assert table._layout.relayout() == [1, 2]
+    assert place_of(table._rows[2].cells[1]) == (101, 49, 78)
+    assert place_of(table._rows[2].cells[2]) == (181, 49, 118)
+    assert place_of(table._rows[2].cells[0]) == (1, 49, 98)
+    assert table._layout.relayout() == []
+
+def test_place_layout_option_checks(root):
+    """Test that an unknown layout, or the place layout with the canvas renderer, is refused"""
+    headers = [Header(text="Name", type=WidgetType.TEXT)]
+    with pytest.raises(ValueError):
+        Table(root, headers=headers, data=[["a"]], layout="pack")
+    with pytest.raises(ValueError):
+        Table(root, headers=headers, data=[["a"]], layout="place", renderer="canvas")
+
+def test_place_layout_with_groups(root):
+    """Test that group rows take placed lines of their own above their rows"""
+    headers = [Header(text="Name", type=WidgetType.TEXT), Header(text="Note", type=WidgetType.TEXT)]
+    table = Table(root, headers=headers, data=[["a", "1"], ["b", "2"], ["a", "3"]],
+                  row_height=20, layout="place", group_by=[0])
+    table._layout.column_edges = lambda: [0, 100, 200]
+    table._layout.relayout()
+    assert int(table._group_rows[("b",)].cells[0].place_info()["y"]) == 61  # After group a and its 2 rows
+    assert int(table._rows[2].cells[1].place_info()["y"]) == 81
+    table.set_group_expanded("a", False)
+    assert int(table._group_rows[("b",)].cells[0].place_info()["y"]) == 21
+    assert int(table._layout.body.cget("height")) == 60
+
+def test_live_feed_coalesces_updates_and_flashes(root):
+    """Test that a feed applies the last update of each cell per frame and fades the changed cells"""
+    headers = [Header(text="Symbol"), Header(text="Price"), Header(text="Live", type=WidgetType.CHECKBOX)]
+    table = Table(root, headers=headers, data=[["A", "1", False], ["B", "2", False], ["C", "3", False]],
+                  row_key=lambda row: row[0])
+    updates = queue.Queue()
+    for update in [("B", 1, "5"), ("B", 1, "6"), ("Z", 1, "9"), ("A", 1, "1"), ("C", 2, True)]:
+        updates.put(update)
+    feed = LiveFeed(table, updates, flash_ms=600)
+    assert feed.poll(now=0.0) == 3
+    assert [row[1] for row in table.data] == ["1", "6", "3"] and table.data[2][2] is True
+    assert feed.dropped == 1  # Z is no row
+    assert len(feed.flash) == 1  # A did not change, checkboxes do not flash
+    cell = table._rows[1].cells[1]
+    first = cell.cget("style")
+    assert first.endswith(".Row.TLabel") and first != "Row.TLabel"
+    feed.poll(now=0.15)
+    assert cell.cget("style") not in (first, "Row.TLabel")
+    feed.poll(now=0.7)
+    assert cell.cget("style") == "Row.TLabel" and len(feed.flash) == 0
+
+def test_live_feed_flash_keeps_conditional_format(root, monkeypatch):
+    """Test that a flashing formatted cell fades to its format's background and gets its format back"""
+    headers = [Header(text="Symbol"), Header(text="Price", formats=[Threshold(">", 10, background="#b71c1c")])]
+    table = Table(root, headers=headers, data=[["A", 1], ["B", 20]], row_key=lambda row: row[0])
+    feed = LiveFeed(table, iter([("B", 1, 30)]), flash_ms=600, flash_color="#ffffff")
+    alert = table._text_style(2, 1, 1)
+    assert alert.endswith(".Row.TLabel") and alert != "Row.TLabel"
+    lookup = style_registry.style.lookup
+    monkeypatch.setattr(style_registry.style, "lookup",
+                        lambda style, option, *args: "#b71c1c" if (style, option) == (alert, "background") else lookup(style, option, *args))
+    feed.poll(now=0.0)
+    cell = table._rows[1].cells[1]
+    assert cell.cget("style").endswith("." + alert)  # Derived from the formatted style, keeping its foreground
+    assert feed.flash._steps[alert][0] == "#ffffff" and feed.flash._steps[alert][-1] == "#c34242"
+    feed.poll(now=0.7)
+    assert cell.cget("style") == alert and len(feed.flash) == 0
+
+def test_live_feed_flashes_single_canvas_cell(canvas_table):
+    """Test that a flash on the canvas renderer fills the cell's box, not its row background"""
+    table = canvas_table
+    canvas = table._canvas.canvas
+    background = table._canvas._backgrounds[2]
+    row_color = canvas.itemcget(background, "fill")
+    feed = LiveFeed(table, iter([(1, 2, "changed")]), flash_ms=600, flash_color="#ffffff")
+    feed.poll(now=0.0)
+    cell, other = table._rows[1].cells[2], table._rows[1].cells[0]
+    assert cell.marker is not None and other.marker is None
+    assert cell.box == table._canvas._cell_box(2, 2) and canvas.itemcget(cell.marker, "fill") == "#ffffff"
+    assert canvas.itemcget(background, "fill") == row_color
+    feed.poll(now=0.7)
+    assert cell.marker is None and not canvas.find_withtag("marker")
+
+def test_live_feed_reads_iterator_by_frame(root):
+    """Test that an iterator is read up to each None and that row indices are keys without row_key"""
+    table = Table(root, headers=[Header(text="Name"), Header(text="Value")], data=[["a", "1"], ["b", "2"]])
+    feed = LiveFeed(table, iter([(0, 1, "10"), None, (1, 1, "20"), (5, 1, "x")]), flash_ms=0)
+    assert feed.poll() == 1 and table.data[1][1] == "2"
+    assert feed.poll() == 1 and table.data[1][1] == "20"
+    assert feed.dropped == 1
+    feed.start()
+    feed._tick()
+    assert not feed.running  # Exhausted
+
+def test_conditional_formats_style_cells(root):
+    """Test that formatted cells get shared interned styles that follow edits, moves and the selection"""
+    headers = [Header(text="Name", formats=[Match("^x", foreground="#ff0000")]),
+               Header(text="Value", type=WidgetType.ENTRY, editable=True),
+               Header(text="Alert", formats=[Threshold(">", 10, background="#b71c1c")])]
+    table = Table(root, headers=headers, data=[["a", "1", 5], ["xb", "2", 20], ["xc", "3", 30]])
+    styles = [[cell.cget("style") for cell in (row.cells[0], row.cells[2])] for row in table._rows]
+    assert styles[0] == ["Alt.TLabel", "Alt.TLabel"]
+    assert styles[1][0] != "Row.TLabel" and styles[1][0].endswith(".Row.TLabel")
+    assert styles[2][1].endswith(".Alt.TLabel") and styles[2][1] != styles[1][1]  # Same options, other row style
+    table.set_cells({(0, 2): 11, (1, 2): 1})
+    table.flush_cells()
+    assert table._rows[0].cells[2].cget("style") == table._rows[2].cells[2].cget("style")
+    assert table._rows[1].cells[2].cget("style") == "Row.TLabel"
+    table._handle_cell_click(2, 0)
+    assert table._rows[1].cells[0].cget("style") == "info.TLabel"
+    table._handle_cell_click(1, 1)
+    assert table._rows[1].cells[0].cget("style") == styles[1][0]
+    table.delete_rows([0])
+    assert table._rows[0].cells[0].cget("style").endswith(".Alt.TLabel")
+    with pytest.raises(ValueError):
+        Table(root, headers=headers, data=[["a", "1", 5]], renderer="canvas")
+
+def test_conditional_formats_follow_update_data(root):
+    """Test that update_data restyles rows rebound in place whose values cross a threshold"""
+    headers = [Header(text="Name"), Header(text="Alert", formats=[Threshold(">", 10, background="#b71c1c")])]
+    table = Table(root, headers=headers, data=[["a", 5], ["b", 20]])
+    alert = table._rows[1].cells[1].cget("style")
+    assert alert.endswith(".Row.TLabel")
+    table.update_data([["a", 5], ["b", 1]])
+    assert table._rows[1].cells[1].cget("style") == "Row.TLabel"
+    table.update_data([["a", 5], ["b", 30]])
+    assert table._rows[1].cells[1].cget("style") == alert
@@ -0,0 +1,106 @@
+import os
+import sys
+
+# Add src directory to Python path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'src'))
+sys.path.append(src_path)
+
+import pytest
+from devopsnextgenx.components.TableModel import ListTableModel
+from devopsnextgenx.components.TableFilter import ColumnIndex, TableFilter, parse_query
+
+ROWS = [
+    ["Alice", 30, True],
+    ["bob", 25, False],
+    ["Charlie", 35, True],
+    ["alicia", "40", False],
+    ["Malik", None, True],
+]
+
+@pytest.fixture
+def table_filter():
+    """Fixture to create a filter over a small model"""
+    return TableFilter(ListTableModel([list(row) for row in ROWS]))
+
+def test_parse_query():
+    """Test the filter input syntax"""
+    assert parse_query("  ") is None
+    assert parse_query("Ali") == ("substring", "ali")
+    assert parse_query("^Ali") == ("prefix", "ali")
+    assert parse_query("10..20") == ("range", (10.0, 20.0, False, False))
+    assert parse_query("..20") == ("range", (None, 20.0, False, False))
+    assert parse_query("> 5") == ("range", (5.0, None, True, False))
+    assert parse_query("yes", boolean=True) == ("bool", True)
+
+def test_column_index_lookups():
+    """Test the prefix, substring, range and boolean indexes"""
+    index = ColumnIndex([row[0] for row in ROWS])
+    assert sorted(index.prefix("ali")) == [0, 3]
+    assert sorted(index.substring("lic")) == [0, 3]
+    assert sorted(index.substring("li")) == [0, 2, 3, 4]
+    numbers = ColumnIndex([row[1] for row in ROWS])
+    assert sorted(numbers.range(30, None)) == [0, 2, 3]
+    assert sorted(numbers.range(25, 35, True, True)) == [0]
+    assert sorted(ColumnIndex([row[2] for row in ROWS]).boolean(True)) == [0, 2, 4]
+
+def test_filter_narrows_incrementally(table_filter, monkeypatch):
+    """Test that a refined query only rechecks the previous result"""
+    table_filter.set(0, "li")
+    assert table_filter.rows() == {0, 2, 3, 4}
+
+    index = table_filter._index(0)
+    monkeypatch.setattr(index, "lookup", lambda *args: pytest.fail("index lookup on a refined query"))
+    table_filter.set(0, "lic")
+    assert table_filter.rows() == {0, 3}
+
+def test_filter_combines_columns(table_filter):
+    """Test that filters of several columns intersect"""
+    table_filter.set(0, "li")
+    table_filter.set(2, "true", boolean=True)
+    assert table_filter.rows() == {0, 2, 4}
+    table_filter.set(1, ">=35")
+    assert table_filter.filter_order([4, 3, 2, 1, 0]) == [2]
+    table_filter.clear()
+    assert table_filter.rows() is None
+
+def test_filter_follows_edits_and_new_data(table_filter):
+    """Test that edited columns and new data are indexed again"""
+    table_filter.set(0, "^b")
+    table_filter.model.set(1, 0, "Zed")
+    table_filter.invalidate(0)
+    assert table_filter.rows() == set()
+
+    table_filter.set_model(ListTableModel([["Bea", 1, True]]))
+    assert table_filter.rows() == {0}
+
+def test_filter_updates_edited_rows(table_filter):
+    """Test that edits update the built indexes in place and refilter only their rows"""
+    table_filter.set(0, "^ali")
+    table_filter.set(1, "28..38")
+    assert table_filter.rows() == {0}
+    index = table_filter._index(0)
+    assert sorted(index.substring("ice")) == [0]
+    for row, col, value in [(2, 0, "Alina"), (2, 1, "31"), (0, 1, 50), (4, 1, 29.5), (4, 0, "alibi")]:
+        table_filter.model.set(row, col, value)
+        table_filter.update([(row, col)])
+    assert table_filter._index(0) is index
+    assert table_filter.rows() == {2, 4}
+    assert sorted(index.substring("lin")) == [2] and sorted(index.substring("ice")) == [0]
+    assert sorted(table_filter._index(1).range(30, 60)) == [0, 2, 3]
+    fresh = TableFilter(table_filter.model)
+    fresh.set(0, "^ali")
+    fresh.set(1, "28..38")
+    assert fresh.rows() == table_filter.rows()
+
+def test_column_index_numpy_ranges():
+    """Test the range index of a NumPy column, NaN left out, and its updates"""
+    np = pytest.importorskip("numpy")
+    values = np.array([3.0, float("nan"), 1.0, 2.0])
+    index = ColumnIndex(values)
+    assert index.range(None, None) == [2, 3, 0]
+    values[1] = 1.5
+    index.update(1, 1.5)
+    values[0] = float("nan")
+    index.update(0, float("nan"))
+    assert index.range(1.0, 2.0) == [2, 1, 3]
+    assert index.range(None, None) == [2, 1, 3]
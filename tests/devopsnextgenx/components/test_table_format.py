@@ -0,0 +1,53 @@
+import os
+import sys
+
+# Add src directory to Python path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'src'))
+sys.path.append(src_path)
+
+import pytest
+from devopsnextgenx.components.TableFormat import Rule, Threshold, ColorScale, Match, ConditionalFormats
+from devopsnextgenx.components.TableModel import ListTableModel, ColumnarTableModel
+
+def test_rules_evaluate_lists_and_arrays():
+    """Test that rules give the same options for a Python list and a NumPy column"""
+    rule = Threshold(">=", 10, foreground="#ff0000")
+    hot = (("foreground", "#ff0000"),)
+    assert rule.evaluate([5, "12", None, "n/a", 10.0]) == [None, hot, None, None, hot]
+    model = ColumnarTableModel([[5], [12], [10]])
+    assert rule.evaluate(model.column(0)) == [None, hot, hot]
+    scale = ColorScale(0, 100, colors=("#000000", "#ffffff"), steps=3)
+    assert scale.evaluate([-5, 50, 1000, "x"]) == [
+        (("background", "#000000"),), (("background", "#808080"),), (("background", "#ffffff"),), None]
+    assert scale.evaluate(ColumnarTableModel([[-5], [50], [1000]]).column(0)) == scale.evaluate([-5, 50, 1000])
+    assert Match(r"^ERR", background="#b71c1c").evaluate(["ERROR x", "ok ERR", None]) == [
+        (("background", "#b71c1c"),), None, None]
+    with pytest.raises(ValueError):
+        Threshold("=>", 1)
+
+def test_conditional_formats_follow_changes():
+    """Test that later rules override earlier ones and only changed cells are evaluated again"""
+    model = ListTableModel([["a", 5], ["b", 50], ["c", 500]])
+    formats = ConditionalFormats({1: [Threshold(">", 10, foreground="#ffffff", background="#000000"),
+                                      Threshold(">", 100, background="#ff0000")]})
+    formats.rebuild(model)
+    assert formats._options[1] == [None, (("background", "#000000"), ("foreground", "#ffffff")),
+                                   (("background", "#ff0000"), ("foreground", "#ffffff"))]
+    model.set(0, 1, 20)
+    model.set(1, 1, 60)
+    assert formats.update(model, [(0, 1), (1, 1), (2, 0)]) == [(0, 1)]
+    assert formats.style("Row.TLabel", 0, 1) == formats.style("Row.TLabel", 1, 1) != "Row.TLabel"
+    assert formats.style("Row.TLabel", 0, 0) == "Row.TLabel"
+    model.insert(1, [["d", 1]])
+    formats.insert(model, 1, 1)
+    assert formats._options[1][1] is None and len(formats._options[1]) == 4
+    model.move(0, 3)
+    formats.move(0, 3)
+    model.delete([0])
+    formats.delete([0])
+    assert formats.update_column(model, 1) == []  # Followed the rows without evaluating them again
+
+def test_rule_is_abstract():
+    """Test that a rule must implement evaluate"""
+    with pytest.raises(TypeError):
+        Rule()
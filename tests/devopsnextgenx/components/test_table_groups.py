@@ -0,0 +1,34 @@
+import os
+import sys
+
+# Add src directory to Python path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'src'))
+sys.path.append(src_path)
+
+from devopsnextgenx.components.TableGroups import Aggregate, GroupIndex
+from devopsnextgenx.components.TableModel import ListTableModel
+
+def test_aggregate_add_and_remove():
+    """Test that removing the minimum or maximum keeps the aggregate exact"""
+    aggregate = Aggregate()
+    for value in (4, 1.5, "n/a", 9):
+        aggregate.add(value)
+    assert aggregate.as_dict() == {"sum": 14.5, "count": 4, "min": 1.5, "max": 9, "avg": 14.5 / 3}
+    aggregate.remove(9)
+    aggregate.remove(1.5)
+    assert (aggregate.get("min"), aggregate.get("max"), aggregate.get("sum")) == (4, 4, 4)
+    aggregate.remove(4)
+    assert aggregate.get("min") is None and aggregate.get("sum") == 0 and aggregate.get("count") == 1
+
+def test_group_index_update_and_arrange():
+    """Test that a changed grouped column moves the row and arrange lays the groups out in key order"""
+    model = ListTableModel([["b", 1], ["a", 2], ["b", 3]])
+    index = GroupIndex([0], [1])
+    index.rebuild(model)
+    assert index.arrange([2, 1, 0]) == ([1, 2, 0], [0, 1], [("a",), ("b",)])
+    model.set(0, 0, "a")
+    assert index.update(model, 0, 0, "b", "a") == [("b",), ("a",)]
+    assert index.groups[("a",)].aggregates[1].get("sum") == 3
+    index.collapsed.add(("a",))
+    assert index.arrange([0, 1, 2]) == ([2], [0, 0], [("a",), ("b",)])
+    assert index.is_collapsed(1) and not index.is_collapsed(2)
@@ -0,0 +1,36 @@
+import os
+import sys
+
+# Add src directory to Python path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'src'))
+sys.path.append(src_path)
+
+import pytest
+from devopsnextgenx.components.TableJournal import ChangeJournal, Change
+
+def test_journal_log_and_history():
+    """Test net changes, the redo history and expired tokens"""
+    journal = ChangeJournal(max_log=4)
+    journal.record(Change("a", 0, 1, 2, 0))
+    journal.record(Change("a", 0, 2, 3, 0))
+    journal.record(Change("b", 1, "x", "y", 1))
+    assert journal.changes_since(0) == [Change("a", 0, 1, 3, 0), Change("b", 1, "x", "y", 1)]
+    token = journal.token
+    assert journal.undo() == [Change("b", 1, "x", "y", 1)] and journal.can_redo
+    assert journal.changes_since(token) == [Change("b", 1, "y", "x", 1)]
+    journal.record(Change("c", 0, 0, 1, 2))
+    assert not journal.can_redo
+    with pytest.raises(ValueError):
+        journal.changes_since(0)  # Trimmed to the last 4 changes
+
+def test_journal_log_keeps_last_changes():
+    """Test that a full log drops its oldest changes one by one and keeps the tokens"""
+    journal = ChangeJournal(max_log=4)
+    for value in range(10):
+        journal.record(Change("a", value % 2, value, value + 1, 0))
+    assert journal.token == 10
+    assert journal.changes_since(6, net=False) == [Change("a", value % 2, value, value + 1, 0) for value in range(6, 10)]
+    assert journal.changes_since(8) == [Change("a", 0, 8, 9, 0), Change("a", 1, 9, 10, 0)]
+    assert journal.changes_since(10) == []
+    with pytest.raises(ValueError):
+        journal.changes_since(5)
@@ -0,0 +1,241 @@
+import os
+import sys
+
+# Add src directory to Python path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'src'))
+sys.path.append(src_path)
+
+import pytest
+from devopsnextgenx.components.TableModel import Bitmap, ListTableModel, ColumnarTableModel, PagedTableModel, RingTableModel, sort_key, to_bool
+
+# The package exports the TableModel class under the module's name, so look the module up directly
+table_model = sys.modules[ColumnarTableModel.__module__]
+
+ROWS = [
+    ["Alice", 30, 1.5, True],
+    ["bob", 25, 2.5, False],
+    ["Charlie", 35, 0.5, True],
+    ["alice", 30, 3.0, False],
+]
+
+@pytest.fixture(params=["numpy", "array"])
+def columnar(request, monkeypatch):
+    """Columnar model with and without NumPy"""
+    if request.param == "array":
+        monkeypatch.setattr(table_model, "np", None)
+    elif table_model.np is None:
+        pytest.skip("NumPy is not installed")
+    return ColumnarTableModel([list(row) for row in ROWS])
+
+def test_bitmap():
+    """Test the packed boolean storage"""
+    bits = Bitmap([True, False, "yes", 0] * 5)
+    assert len(bits) == 20
+    assert list(bits)[:4] == [True, False, True, False]
+    assert bits.count() == 10
+    bits[1] = True
+    bits[0] = False
+    assert bits[1] and not bits[0]
+    assert bits.count() == 10
+    with pytest.raises(IndexError):
+        bits[20]
+
+def test_to_bool_and_sort_key():
+    """Test value interpretation helpers"""
+    assert to_bool("Yes") and to_bool(1) and not to_bool("no")
+    assert sorted(["b", 10, "A", None, "2"], key=sort_key) == ["2", 10, "A", "b", None]
+
+def test_list_model_uses_rows_in_place():
+    """Test that the list model writes to the original rows"""
+    rows = [list(row) for row in ROWS]
+    model = ListTableModel(rows)
+    assert model.data is rows
+    model.set(0, 1, 31)
+    assert rows[0][1] == 31
+    assert model.order_by([(1, False), (0, True)]) == [2, 0, 3, 1]
+
+def test_list_model_sort_keys_follow_set():
+    """Test that cached sort keys are maintained by set()"""
+    model = ListTableModel([list(row) for row in ROWS])
+    model.order_by([(0, True)])
+    model.set(1, 0, "aaron")
+    assert model.sort_keys(0)[1] == sort_key("aaron")
+    assert model.order_by([(0, True)])[0] == 1
+
+def test_columnar_types(columnar):
+    """Test column type inference and coercion"""
+    assert columnar.types == [str, int, float, bool]
+    assert isinstance(columnar.column(3), Bitmap)
+    assert columnar.row(0) == ["Alice", 30, 1.5, True]
+    assert type(columnar.get(0, 1)) is int
+    assert columnar.set(1, 1, "26") == 26
+    assert columnar.set(1, 3, "true") is True
+    with pytest.raises(ValueError):
+        columnar.set(1, 1, "abc")
+
+def test_columnar_row_view(columnar):
+    """Test model[row][col] access used by on_change callbacks"""
+    columnar[2][0] = "Carl"
+    assert columnar[2][0] == "Carl"
+    assert len(columnar) == 4
+    assert [row[1] for row in columnar] == [30, 25, 35, 30]
+
+def test_columnar_order_by(columnar):
+    """Test stable multi-column sort"""
+    assert columnar.order_by([(1, True)]) == [1, 0, 3, 2]
+    assert columnar.order_by([(1, False), (2, True)]) == [2, 0, 3, 1]
+    assert columnar.order_by([(3, False), (1, True)]) == [0, 2, 1, 3]
+    assert columnar.order_by([(0, True)]) == [0, 3, 1, 2]
+
+def test_columnar_select_and_aggregate(columnar):
+    """Test numeric range selection and aggregates"""
+    assert columnar.select(1, low=30) == [0, 2, 3]
+    assert columnar.select(2, high=1.5) == [0, 2]
+    stats = columnar.aggregate(1)
+    assert stats == {"count": 4, "sum": 120, "min": 25, "max": 35, "avg": 30.0}
+    assert columnar.aggregate(2, rows=[0, 1])["sum"] == 4.0
+
+class _Provider:
+    """In-memory page provider recording its calls"""
+    def __init__(self, count):
+        self.rows = [[f"name{i:03d}", i] for i in range(count)]
+        self.fetches = []
+
+    def fetch(self, offset, limit, sort, filters):
+        self.fetches.append((offset, limit, list(sort), dict(filters)))
+        rows = [row for row in self.rows if all(query in str(row[col]) for col, query in filters.items())]
+        for col, ascending in reversed(sort):
+            rows.sort(key=lambda row: row[col], reverse=not ascending)
+        return rows[offset:offset + limit]
+
+    def total_count(self, filters):
+        return len(self.fetch(0, len(self.rows), [], filters))
+
+def test_paged_model_lru():
+    """Test that pages are fetched on demand and only the most recent ones are kept"""
+    provider = _Provider(100)
+    model = PagedTableModel(provider.fetch, provider.total_count, page_size=10, cache_pages=2)
+    assert len(model) == 100
+    assert model.page_count == 10
+    assert model.column_count == 2
+    assert model.get(15, 1) == 15
+    assert model.row(5) == ["name005", 5]
+    fetched = len(provider.fetches)
+    model.get(16, 0)
+    assert len(provider.fetches) == fetched  # Cached
+    model.get(25, 0)
+    assert list(model._pages) == [1, 2]
+    model.prefetch(2)
+    assert list(model._pages) == [1, 2]
+
+def test_paged_model_query():
+    """Test that sort and filter are handed to the provider"""
+    provider = _Provider(30)
+    model = PagedTableModel(provider.fetch, provider.total_count, page_size=10)
+    model.set_query(sort_spec=[(1, False)], filters={0: "1", 1: ""})
+    assert model.filters == {0: "1"}
+    assert model.get(0, 1) == 21
+    assert provider.fetches[-1] == (0, 10, [(1, False)], {0: "1"})
+    assert len(model) == 12
+    model.set(0, 1, 99)
+    assert model.get(0, 1) == 99
+
+def test_list_model_row_mutations():
+    """Test insert, delete and move on the default model, in the caller's list"""
+    rows = [list(row) for row in ROWS]
+    model = ListTableModel(rows)
+    model.sort_keys(1)
+    assert model.insert(1, [("Dan", 40, 1.0, True)]) == 1
+    assert rows[1] == ["Dan", 40, 1.0, True]
+    assert model.delete([0, 2]) == [0, 2]
+    assert [row[0] for row in rows] == ["Dan", "Charlie", "alice"]
+    moved = rows[0]
+    model.move(0, 2)
+    assert rows[2] is moved
+    assert [rows[row][1] for row in model.order_by([(1, True)])] == [30, 35, 40]
+    with pytest.raises(IndexError):
+        model.delete([10])
+
+def test_columnar_row_mutations(columnar):
+    """Test insert and delete keep typed columns"""
+    columnar.insert(len(columnar), [["Dan", "40", 1, "yes"]])
+    assert columnar.row(4) == ["Dan", 40, 1.0, True]
+    columnar.insert(0, [["Eve", 20, 0.5, False]])
+    assert columnar.row(0) == ["Eve", 20, 0.5, False]
+    assert len(columnar) == 6
+    columnar.delete([0, 1])
+    assert [columnar.get(row, 0) for row in range(len(columnar))] == ["bob", "Charlie", "alice", "Dan"]
+    assert columnar.order_by([(1, False)])[0] == 3
+    assert columnar.column(3).count() == 2
+    with pytest.raises(ValueError):
+        columnar.insert(0, [["Bad", "x", 1.0, True]])
+    assert len(columnar) == 4
+
+def test_columnar_append_writes_in_place():
+    """Test that appends fill the spare capacity of NumPy columns instead of copying them"""
+    if table_model.np is None:
+        pytest.skip("NumPy is not installed")
+    model = ColumnarTableModel([[i, float(i), f"r{i}", i % 2 == 0] for i in range(100)])
+    model.insert(len(model), [[100, 100.0, "r100", True]])
+    store = model._columns[0]
+    assert len(store) > len(model) == 101
+    snapshot = model.snapshot()
+    for row in range(101, 150):
+        model.insert(len(model), [[row, float(row), f"r{row}", False]])
+    assert model._columns[0] is store  # No copy while the capacity lasts
+    assert len(model.column(0)) == 150 and model.column(1)[-1] == 149.0
+    assert len(snapshot) == 101 and snapshot.row(100) == [100, 100.0, "r100", True]
+    model.insert(1, [[-1, -1.0, "mid", True]])
+    assert model.row(1) == [-1, -1.0, "mid", True] and model.row(150) == [149, 149.0, "r149", False]
+    assert model.aggregate(0)["count"] == 151 and model.order_by([(0, True)])[0] == 1
+
+def test_bitmap_bulk_operations():
+    """Test fill and invert keep the bits past the end clear"""
+    bits = Bitmap([True, False, True] * 7)
+    bits.invert()
+    assert list(bits) == [False, True, False] * 7
+    assert bits.count() == 7
+    bits.fill(True)
+    assert bits.count() == 21
+    bits.append(False)
+    assert bits.count() == 21
+    bits.fill(False)
+    assert bits.count() == 0
+
+def test_bulk_column_operations(columnar):
+    """Test fill, invert and count on columnar and list models"""
+    for model in (columnar, ListTableModel([list(row) for row in ROWS])):
+        assert model.count_true(3) == 2
+        model.invert_column(3)
+        assert [model.get(row, 3) for row in range(4)] == [False, True, False, True]
+        model.fill_column(3, False)
+        assert model.count_true(3) == 0
+
+def test_ring_model_evicts_oldest():
+    """Test that a full ring buffer drops its oldest rows"""
+    model = RingTableModel(3, [[i, f"r{i}"] for i in range(2)])
+    assert len(model) == 2 and model.column_count == 2
+    assert model.append([[2, "r2"], [3, "r3"], [4, "r4"]]) == 2
+    assert list(model.rows()) == [[2, "r2"], [3, "r3"], [4, "r4"]]
+    assert model.evicted == 2
+    model.set(0, 1, "x")
+    assert model.get(0, 1) == "x"
+    assert model.order_by([(0, False)]) == [2, 1, 0]
+    model.append([[5, "r5"]])
+    assert model.order_by([(0, False)]) == [2, 1, 0]
+    with pytest.raises(IndexError):
+        model.get(3, 0)
+    with pytest.raises(NotImplementedError):
+        model.insert(0, [[9, "r9"]])
+
+def test_snapshot_ignores_later_row_changes(columnar):
+    """Test that a snapshot keeps the rows it was taken with"""
+    for model in (ListTableModel([[1, "a"], [2, "b"]]), columnar, RingTableModel(3, [[1], [2], [3]])):
+        rows = list(model.rows())
+        snapshot = model.snapshot()
+        if isinstance(model, RingTableModel):
+            model.append([[4]])
+        else:
+            model.insert(0, [model.row(0)])
+            model.delete([len(model) - 1])
+        assert list(snapshot.rows()) == rows
@@ -0,0 +1,84 @@
+import os
+import sys
+
+# Add src directory to Python path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'src'))
+sys.path.append(src_path)
+
+import pytest
+from devopsnextgenx.utils.frameScheduler import FrameScheduler, status_progress
+
+
+class MockWidget:
+    """Collects after() callbacks so the test runs the frames"""
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, ms, func):
+        self.callbacks.append(func)
+        return f"after#{len(self.callbacks)}"
+
+    def run_frame(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for func in callbacks:
+            func()
+
+
+@pytest.fixture
+def widget():
+    return MockWidget()
+
+
+def test_steps_run_between_frames(widget):
+    """Test that a zero budget runs one step per job per frame"""
+    scheduler = FrameScheduler(widget, budget_ms=0)
+    done = []
+    job = scheduler.submit((done.append(i) for i in range(3)), total=3)
+    assert done == [0]
+    widget.run_frame()
+    assert done == [0, 1]
+    widget.run_frame()
+    widget.run_frame()
+    assert done == [0, 1, 2] and job.finished and not scheduler.busy
+    assert widget.callbacks == []
+
+
+def test_budget_runs_small_job_at_once(widget):
+    """Test that a job that fits the frame budget finishes on submit"""
+    scheduler = FrameScheduler(widget)
+    done = []
+    finished = []
+    job = scheduler.submit((done.append(i) for i in range(10)), on_done=lambda: finished.append(True))
+    assert done == list(range(10)) and job.finished and finished == [True]
+
+
+def test_progress_and_finish(widget):
+    """Test progress hooks and finishing a job early"""
+    scheduler = FrameScheduler(widget, budget_ms=0)
+    progress = []
+    job = scheduler.submit(iter(range(5)), total=5, on_progress=lambda done, total: progress.append((done, total)),
+                           start_now=False)
+    assert progress == []
+    widget.run_frame()
+    job.finish()
+    assert progress == [(1, 5), (5, 5)] and job.finished
+
+
+def test_cancel(widget):
+    """Test that a cancelled job does not run again"""
+    scheduler = FrameScheduler(widget, budget_ms=0)
+    done = []
+    job = scheduler.submit((done.append(i) for i in range(5)))
+    job.cancel()
+    widget.run_frame()
+    assert done == [0] and not scheduler.busy
+
+
+def test_status_progress():
+    """Test that the progress hook drives a status bar"""
+    class StatusBar:
+        def update_status(self, text, progress=None):
+            self.status = (text, progress)
+    status_bar = StatusBar()
+    status_progress(status_bar, "Loading")(5, 20)
+    assert status_bar.status == ("Loading 5/20", 0.25)
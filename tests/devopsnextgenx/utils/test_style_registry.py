@@ -0,0 +1,90 @@
+import os
+import sys
+
+# Add src directory to Python path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'src'))
+sys.path.append(src_path)
+
+import pytest
+from devopsnextgenx.utils.styleRegistry import StyleRegistry
+
+
+class RecordingStyle:
+    """Style stand-in that records the calls reaching ttk"""
+    def __init__(self):
+        self.theme = "darkly"
+        self.calls = []
+
+    def theme_use(self):
+        return self.theme
+
+    def configure(self, name, **options):
+        self.calls.append(("configure", name))
+
+    def map(self, name, **options):
+        self.calls.append(("map", name))
+
+    def layout(self, name, layout):
+        self.calls.append(("layout", name))
+
+    def element_create(self, name, *args, **kwargs):
+        self.calls.append(("element_create", name))
+
+
+@pytest.fixture
+def style():
+    return RecordingStyle()
+
+
+@pytest.fixture
+def registry(style):
+    return StyleRegistry(style)
+
+
+def test_define_configures_once(registry, style):
+    """Test that defining a style again with the same options does not restyle"""
+    for _ in range(50):
+        assert registry.define("Row.TLabel", padding=5) == "Row.TLabel"
+    assert style.calls == [("configure", "Row.TLabel")]
+
+
+def test_redefine_with_new_options(registry, style):
+    """Test that changed options are applied"""
+    registry.define("Row.TLabel", padding=5)
+    registry.define("Row.TLabel", padding=8)
+    assert style.calls == [("configure", "Row.TLabel"), ("configure", "Row.TLabel")]
+
+
+def test_intern_shares_equal_styles(registry, style):
+    """Test that equal options give the same interned style"""
+    green = registry.intern("Horizontal.TProgressbar", background="#00FF00", thickness=3)
+    red = registry.intern("Horizontal.TProgressbar", background="#FF0000", thickness=3)
+    assert green != red
+    assert green.endswith(".Horizontal.TProgressbar")
+    assert registry.intern("Horizontal.TProgressbar", thickness=3, background="#00FF00") == green
+    assert style.calls == [("configure", green), ("configure", red)]
+
+
+def test_element_created_once(registry, style):
+    """Test that elements are created once per theme"""
+    registry.element("CustomSash", "from", "default")
+    registry.element("CustomSash", "from", "default")
+    assert style.calls == [("element_create", "CustomSash")]
+
+
+def test_theme_change_reapplies(registry, style):
+    """Test that everything is applied again after a theme change, and only then"""
+    registry.element("CustomSash", "from", "default")
+    registry.define("Treeview", background="#2a2d2e", map={"background": [("selected", "#404040")]})
+    registry.define("Treeview.Item", layout=[("Treeitem.padding", {"sticky": "nsew"})])
+    style.calls.clear()
+    registry.refresh()
+    assert style.calls == []
+
+    style.theme = "flatly"
+    registry.refresh()
+    assert style.calls == [
+        ("element_create", "CustomSash"),
+        ("configure", "Treeview"), ("map", "Treeview"),
+        ("layout", "Treeview.Item"),
+    ]